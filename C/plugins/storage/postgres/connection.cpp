@@ -3296,6 +3296,49 @@ int Connection::delete_table_snapshot(const string& table, const string& id)
 	return -1;
 }
 
+/**
+ * Take a snapshot of the statistics table into the statistics history
+ *
+ * The delta between value and previous_value of every statistic is
+ * inserted into statistics_history and previous_value is then rolled
+ * forward to value, all in a single transaction so that increments made
+ * while the snapshot is taken are neither lost nor counted twice.
+ *
+ * @param historyTs	The history timestamp of the new rows
+ * @return		-1 on error, >= 0 on success
+ */
+int Connection::statistics_snapshot(const string& historyTs)
+{
+	string query = "START TRANSACTION; ";
+	query += "INSERT INTO fledge.statistics_history (key, history_ts, value) ";
+	query += "SELECT key, '" + escape(historyTs) + "', value - previous_value FROM fledge.statistics; ";
+	query += "UPDATE fledge.statistics SET previous_value = value; ";
+	query += "COMMIT;";
+
+	logSQL("StatisticsSnapshot", query.c_str());
+
+	PGresult *res = PQexec(dbConnection, query.c_str());
+	if (PQresultStatus(res) == PGRES_COMMAND_OK)
+	{
+		PQclear(res);
+		return 1;
+	}
+	else
+	{
+		PGresult *resRollback = PQexec(dbConnection, "ROLLBACK;");
+		if (PQresultStatus(resRollback) != PGRES_COMMAND_OK)
+		{
+			raiseError("rollback statistics_snapshot",
+				   PQerrorMessage(dbConnection));
+		}
+		PQclear(resRollback);
+	}
+
+	raiseError("statistics_snapshot", PQerrorMessage(dbConnection));
+	PQclear(res);
+	return -1;
+}
+
 /**
  * Get list of snapshots for a given common table
  *
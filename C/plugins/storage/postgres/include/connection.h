@@ -47,6 +47,7 @@ class Connection {
 		int		delete_table_snapshot(const std::string& table, const std::string& id);
 		bool		get_table_snapshots(const std::string& table,
 						    std::string& resultSet);
+		int		statistics_snapshot(const std::string& historyTs);
 		bool		aggregateQuery(const rapidjson::Value& payload, std::string& resultSet);
 		int 		create_schema(const std::string &payload);
 		bool 		findSchemaFromDB(const std::string &service,
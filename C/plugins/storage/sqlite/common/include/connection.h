@@ -137,6 +137,7 @@ class Connection {
 		int		load_table_snapshot(const std::string& table, const std::string& id);
 		int		delete_table_snapshot(const std::string& table, const std::string& id);
 		bool		get_table_snapshots(const std::string& table, std::string& resultSet);
+		int		statistics_snapshot(const std::string& historyTs);
 #endif
 		int		appendReadings(const char *readings);
 		int 		readingStream(ReadingStream **readings, bool commit);
@@ -3516,6 +3516,65 @@ SQLBuffer sql;
 		return false;
 	}
 }
+
+/**
+ * Take a snapshot of the statistics table into the statistics history
+ *
+ * The delta between value and previous_value of every statistic is
+ * inserted into statistics_history and previous_value is then rolled
+ * forward to value, all in a single transaction so that increments made
+ * while the snapshot is taken are neither lost nor counted twice.
+ *
+ * @param historyTs	The history timestamp of the new rows
+ * @return		-1 on error, >= 0 on success
+ */
+int Connection::statistics_snapshot(const string& historyTs)
+{
+	string ts = escape(historyTs);
+	string query = "BEGIN TRANSACTION; ";
+	query += "INSERT INTO fledge.statistics_history (key, history_ts, value) ";
+	query += "SELECT key, '" + ts + "', value - previous_value FROM fledge.statistics; ";
+	query += "UPDATE fledge.statistics SET previous_value = value; ";
+	query += "COMMIT TRANSACTION;";
+
+	logSQL("StatisticsSnapshot", query.c_str());
+
+	char* zErrMsg = NULL;
+	m_writeAccessOngoing.fetch_add(1);
+	int rc = SQLexec(dbHandle,
+			 query.c_str(),
+			 NULL,
+			 NULL,
+			 &zErrMsg);
+	m_writeAccessOngoing.fetch_sub(1);
+	if (m_writeAccessOngoing == 0)
+		db_cv.notify_all();
+
+	// Check result code
+	if (rc == SQLITE_OK)
+	{
+		return 1;
+	}
+
+	raiseError("statistics_snapshot", zErrMsg);
+	sqlite3_free(zErrMsg);
+
+	// transaction is still open, do rollback
+	if (sqlite3_get_autocommit(dbHandle) == 0)
+	{
+		rc = SQLexec(dbHandle,
+			     "ROLLBACK TRANSACTION;",
+			     NULL,
+			     NULL,
+			     &zErrMsg);
+		if (rc != SQLITE_OK)
+		{
+			raiseError("rollback for statistics_snapshot", zErrMsg);
+			sqlite3_free(zErrMsg);
+		}
+	}
+	return -1;
+}
 /**
  * Create schema and populate with tables and indexes as defined in the JSON schema
  * definition.
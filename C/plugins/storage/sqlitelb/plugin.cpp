@@ -369,6 +369,24 @@ std::string results;
 	return rval ? strdup(results.c_str()) : NULL;
 }
 
+/**
+ * Snapshot the statistics table into the statistics history
+ *
+ * @param handle	The plugin handle
+ * @param historyTs	The history timestamp of the new rows
+ * @return		-1 on error, >= 0 on success
+ */
+int plugin_statistics_snapshot(PLUGIN_HANDLE handle,
+			       char *historyTs)
+{
+ConnectionManager *manager = (ConnectionManager *)handle;
+Connection        *connection = manager->allocate();
+
+	int result = connection->statistics_snapshot(std::string(historyTs));
+	manager->release(connection);
+	return result;
+}
+
 /**
  * Update or creats a schema
  *
@@ -35,6 +35,7 @@ using HttpServer = SimpleWeb::Server<SimpleWeb::HTTP>;
 #define LOAD_TABLE_SNAPSHOT	"^/storage/table/([A-Za-z][a-zA-Z_0-9_]*)/snapshot/([a-zA-Z_0-9_]*)$"
 #define DELETE_TABLE_SNAPSHOT	LOAD_TABLE_SNAPSHOT
 #define CREATE_STORAGE_STREAM	"^/storage/reading/stream$"
+#define STATISTICS_SNAPSHOT	"^/storage/statistics/snapshot$"
 #define STORAGE_SCHEMA		"^/storage/schema"
 #define STORAGE_TABLE_ACCESS    "^/storage/schema/([A-Za-z][a-zA-Z0-9_]*)/table/([A-Za-z][a-zA-Z0-9_]*)$"
 #define STORAGE_TABLE_QUERY	 "^/storage/schema/([A-Za-z][a-zA-Z0-9_]*)/table/([A-Za-z][a-zA-Z_0-9]*)/query$"           
@@ -87,6 +88,7 @@ public:
 	void	loadTableSnapshot(shared_ptr<HttpServer::Response> response, shared_ptr<HttpServer::Request> request);
 	void	deleteTableSnapshot(shared_ptr<HttpServer::Response> response, shared_ptr<HttpServer::Request> request);
 	void	getTableSnapshots(shared_ptr<HttpServer::Response> response, shared_ptr<HttpServer::Request> request);
+	void	statisticsSnapshot(shared_ptr<HttpServer::Response> response, shared_ptr<HttpServer::Request> request);
 	void	createStorageStream(shared_ptr<HttpServer::Response> response, shared_ptr<HttpServer::Request> request);
 	bool	readingStream(ReadingStream **readings, bool commit);
 	void    createStorageSchema(shared_ptr<HttpServer::Response> response, shared_ptr<HttpServer::Request> request);
@@ -52,6 +52,8 @@ public:
 	int		loadTableSnapshot(const std::string& table, const std::string& id);
 	int		deleteTableSnapshot(const std::string& table, const std::string& id);
 	char		*getTableSnapshots(const std::string& table);
+	bool		hasStatisticsSnapshot() { return statisticsSnapshotPtr != NULL; };
+	int		statisticsSnapshot(const std::string& historyTs);
 	PLUGIN_ERROR	*lastError();
 	bool		hasStreamSupport() { return readingStreamPtr != NULL; };
 	int		readingStream(ReadingStream **stream, bool commit);
@@ -80,6 +82,7 @@ private:
 	int		(*loadTableSnapshotPtr)(PLUGIN_HANDLE, const char *, const char *);
 	int		(*deleteTableSnapshotPtr)(PLUGIN_HANDLE, const char *, const char *);
 	char		*(*getTableSnapshotsPtr)(PLUGIN_HANDLE, const char *);
+	int		(*statisticsSnapshotPtr)(PLUGIN_HANDLE, const char *) = nullptr;
 	int		(*readingStreamPtr)(PLUGIN_HANDLE, ReadingStream **, bool);
 	PLUGIN_ERROR	*(*lastErrorPtr)(PLUGIN_HANDLE);
 	bool		(*pluginShutdownPtr)(PLUGIN_HANDLE);
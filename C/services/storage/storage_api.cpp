@@ -310,6 +310,16 @@ void getTableSnapshotsWrapper(shared_ptr<HttpServer::Response> response,
 	api->getTableSnapshots(response, request);
 }
 
+/**
+ * Wrapper function for the statistics snapshot API call.
+ */
+void statisticsSnapshotWrapper(shared_ptr<HttpServer::Response> response,
+			       shared_ptr<HttpServer::Request> request)
+{
+	StorageApi *api = StorageApi::getInstance();
+	api->statisticsSnapshot(response, request);
+}
+
 /**
  * Wrapper function for the create storage stream API call.
  */
@@ -446,6 +456,7 @@ void StorageApi::initResources()
 	m_server->resource[LOAD_TABLE_SNAPSHOT]["PUT"] = loadTableSnapshotWrapper;
 	m_server->resource[DELETE_TABLE_SNAPSHOT]["DELETE"] = deleteTableSnapshotWrapper;
 	m_server->resource[GET_TABLE_SNAPSHOTS]["GET"] = getTableSnapshotsWrapper;
+	m_server->resource[STATISTICS_SNAPSHOT]["POST"] = statisticsSnapshotWrapper;
 
 	m_server->resource[READING_ACCESS]["POST"] = readingAppendWrapper;
 	m_server->resource[READING_ACCESS]["GET"] = readingFetchWrapper;
@@ -1493,6 +1504,56 @@ string   payload;
         }
 }
 
+/**
+ * Snapshot the statistics table into the statistics history
+ *
+ * The payload must contain the history_ts of the new statistics
+ * history rows. The plugin inserts the delta of every statistic and
+ * rolls previous_value forward to value in a single transaction.
+ */
+void StorageApi::statisticsSnapshot(shared_ptr<HttpServer::Response> response,
+				    shared_ptr<HttpServer::Request> request)
+{
+string   payload;
+Document doc;
+
+	try
+	{
+		if (!plugin->hasStatisticsSnapshot())
+		{
+			string resp = "{ \"error\" : \"The storage plugin does not support statistics snapshots\" }";
+			respond(response, SimpleWeb::StatusCode::client_error_not_found, resp);
+			return;
+		}
+		payload = request->content.string();
+		doc.Parse(payload.c_str());
+		if (doc.HasParseError() || !doc.IsObject() || !doc.HasMember("history_ts")
+				|| !doc["history_ts"].IsString())
+		{
+			string resp = "{ \"error\" : \"Missing history_ts element in payload for statistics snapshot\" }";
+			respond(response, SimpleWeb::StatusCode::client_error_bad_request, resp);
+			return;
+		}
+
+		string responsePayload;
+		string historyTs = doc["history_ts"].GetString();
+		if (plugin->statisticsSnapshot(historyTs) < 0)
+		{
+			mapError(responsePayload, plugin->lastError());
+			respond(response,
+				SimpleWeb::StatusCode::client_error_bad_request,
+				responsePayload);
+		}
+		else
+		{
+			responsePayload = "{\"snapshot\": {\"history_ts\": \"" + historyTs + "\"} }";
+			respond(response, responsePayload);
+		}
+	} catch (exception ex) {
+		internalError(response, ex);
+	}
+}
+
 
 /**
  * Perform an create table and create index for schema provided in the payload.
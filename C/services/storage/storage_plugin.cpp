@@ -126,6 +126,9 @@ StoragePlugin::StoragePlugin(const string& name, PLUGIN_HANDLE handle) : Plugin(
 	getTableSnapshotsPtr =
 			(char * (*)(PLUGIN_HANDLE, const char*))
 			      manager->resolveSymbol(handle, "plugin_get_table_snapshots");
+	statisticsSnapshotPtr =
+			(int (*)(PLUGIN_HANDLE, const char*))
+			      manager->resolveSymbol(handle, "plugin_statistics_snapshot");
 	readingStreamPtr =
 			(int (*)(PLUGIN_HANDLE, ReadingStream **, bool))
 			      manager->resolveSymbol(handle, "plugin_readingStream");
@@ -306,6 +309,14 @@ char *StoragePlugin::getTableSnapshots(const string& table)
         return this->getTableSnapshotsPtr(instance, table.c_str());
 }
 
+/**
+ * Call the statistics snapshot method in the plugin
+ */
+int StoragePlugin::statisticsSnapshot(const string& historyTs)
+{
+	return this->statisticsSnapshotPtr(instance, historyTs.c_str());
+}
+
 /**
  * Call the reading stream method in the plugin
  */
@@ -286,6 +286,10 @@ class ACLManager(ACLManagerSingleton):
             err_response = ex.error
             raise ValueError(err_response)
 
+    def has_pending_notification(self, svc_name):
+        """Whether an ACL change could not be notified to the service"""
+        return svc_name in self._pending_notifications
+
     async def resolve_pending_notification_for_acl_change(self, svc_name):
         """Methods that handles the pending notification about acl change to the service."""
         _logger.debug("svc name {} and pending notifications {}".format(svc_name,
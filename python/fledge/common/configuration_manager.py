@@ -6,12 +6,12 @@
 
 from importlib import import_module
 from urllib.parse import urlparse
+import asyncio
 import binascii
 import copy
 import json
 import inspect
 import ipaddress
-import datetime
 import os
 from math import *
 import collections
@@ -45,67 +45,113 @@ RESERVED_CATG = ['South', 'North', 'General', 'Advanced', 'Utilities', 'rest_api
 
 
 class ConfigurationCache(object):
-    """Configuration Cache Manager"""
+    """Configuration Cache Manager
 
-    MAX_CACHE_SIZE = 10
+    Least recently used categories are evicted once the cache holds more than max_cache_size categories or more
+    than max_cache_bytes approximate bytes of category values.
+    """
 
-    def __init__(self):
+    MAX_CACHE_SIZE = 512
+    MAX_CACHE_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, max_cache_size=None, max_cache_bytes=None):
         """
-        cache: value stored in dictionary as per category_name
-        max_cache_size: Hold the 10 recently requested categories in the cache
+        cache: value stored in an ordered dictionary as per category_name, least recently used first
+        max_cache_size: maximum number of categories in the cache
+        max_cache_bytes: maximum approximate size of the cached categories, in bytes
         hit: number of times an item is read from the cache
         miss: number of times an item was not found in the cache and a read of the storage layer was required
+        evictions: number of categories removed from the cache to honour its limits
         """
-        self.cache = {}
-        self.max_cache_size = self.MAX_CACHE_SIZE
+        self._cache = collections.OrderedDict()
+        self._entry_bytes = {}
+        self.bytes = 0
+        self.max_cache_size = self.MAX_CACHE_SIZE if max_cache_size is None else max_cache_size
+        self.max_cache_bytes = self.MAX_CACHE_BYTES if max_cache_bytes is None else max_cache_bytes
         self.hit = 0
         self.miss = 0
+        self.evictions = 0
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, entries):
+        self._cache = collections.OrderedDict(entries)
+        self._entry_bytes = {name: self._approximate_bytes(entry) for name, entry in self._cache.items()}
+        self.bytes = sum(self._entry_bytes.values())
+
+    @staticmethod
+    def _approximate_bytes(entry):
+        try:
+            return len(json.dumps(entry.get('value'), default=str))
+        except (TypeError, ValueError):
+            return 0
 
     def __contains__(self, category_name):
         """Returns True or False depending on whether or not the key is in the cache
-        and update the hit and data_accessed"""
-        if category_name in self.cache:
-            try:
-                current_hit = self.cache[category_name]['hit']
-            except KeyError:
-                current_hit = 0
-
+        and marks the key as the most recently used"""
+        if category_name in self._cache:
+            self._cache.move_to_end(category_name)
             self.hit += 1
-            self.cache[category_name].update({'date_accessed': datetime.datetime.now(), 'hit': current_hit + 1})
             return True
         self.miss += 1
         return False
 
     def update(self, category_name, category_description, category_val, display_name=None):
-        """Update the cache dictionary and remove the oldest item"""
-        if category_name not in self.cache and len(self.cache) >= self.max_cache_size:
-            self.remove_oldest()
+        """Update the cache dictionary and remove the least recently used items beyond the cache limits"""
         display_name = category_name if display_name is None else display_name
-        self.cache[category_name] = {'date_accessed': datetime.datetime.now(), 'description': category_description,
-                                     'value': category_val, 'displayName': display_name}
-        _logger.info("Updated Configuration Cache %s", self.cache)
+        entry = {'description': category_description, 'value': category_val, 'displayName': display_name}
+        entry_bytes = self._approximate_bytes(entry)
+        self.bytes += entry_bytes - self._entry_bytes.get(category_name, 0)
+        self._entry_bytes[category_name] = entry_bytes
+        self._cache[category_name] = entry
+        self._cache.move_to_end(category_name)
+        self._evict()
+
+    def refresh(self, category_name):
+        """Recompute the size of a category whose cached value was changed in place
+        and remove the least recently used items beyond the cache limits"""
+        if category_name not in self._cache:
+            return
+        entry_bytes = self._approximate_bytes(self._cache[category_name])
+        self.bytes += entry_bytes - self._entry_bytes.get(category_name, 0)
+        self._entry_bytes[category_name] = entry_bytes
+        self._cache.move_to_end(category_name)
+        self._evict()
+
+    def set_limits(self, max_cache_size, max_cache_bytes):
+        """Change the cache limits and remove the least recently used items beyond them"""
+        self.max_cache_size = max_cache_size
+        self.max_cache_bytes = max_cache_bytes
+        self._evict()
+
+    def _evict(self):
+        # The most recently used category is kept even if it alone exceeds max_cache_bytes
+        while len(self._cache) > 1 and (len(self._cache) > self.max_cache_size or self.bytes > self.max_cache_bytes):
+            self.remove_oldest()
 
     def remove_oldest(self):
-        """Remove the entry that has the oldest accessed date"""
-        oldest_entry = None
-        for category_name in self.cache:
-            if oldest_entry is None:
-                oldest_entry = category_name
-            elif self.cache[category_name]['date_accessed'] < self.cache[oldest_entry]['date_accessed']:
-                oldest_entry = category_name
-        self.cache.pop(oldest_entry)
+        """Remove the least recently used entry"""
+        category_name, _ = self._cache.popitem(last=False)
+        self.bytes -= self._entry_bytes.pop(category_name, 0)
+        self.evictions += 1
 
     def remove(self, key):
         """Remove the entry with given key name"""
-        for category_name in self.cache:
-            if key == category_name:
-                self.cache.pop(key)
-                break
+        if self._cache.pop(key, None) is not None:
+            self.bytes -= self._entry_bytes.pop(key, 0)
 
     @property
     def size(self):
         """Return the size of the cache"""
-        return len(self.cache)
+        return len(self._cache)
+
+    def stats(self):
+        """Return the limits, usage and counters of the cache"""
+        return {'size': self.size, 'maxSize': self.max_cache_size, 'bytes': self.bytes,
+                'maxBytes': self.max_cache_bytes, 'hit': self.hit, 'miss': self.miss, 'evictions': self.evictions}
 
 
 class ConfigurationManagerSingleton(object):
@@ -148,8 +194,11 @@ class ConfigurationManager(ConfigurationManagerSingleton):
     _storage = None
     _registered_interests = None
     _registered_interests_child = None
+    _callback_methods = None
     _cacheManager = None
     _acl_handler = None
+    _category_tree = None
+    _category_tree_generation = 0
 
     def __init__(self, storage=None):
         ConfigurationManagerSingleton.__init__(self)
@@ -163,56 +212,64 @@ class ConfigurationManager(ConfigurationManagerSingleton):
         if self._registered_interests_child is None:
             self._registered_interests_child = {}
 
+        if self._callback_methods is None:
+            self._callback_methods = {}
+
         if self._cacheManager is None:
             self._cacheManager = ConfigurationCache()
 
         if self._acl_handler is None:
             self._acl_handler = ACLManager(storage)
 
+    def _resolve_callback(self, callback, method_name, category_name):
+        """ Return the coroutine function method_name of the callback module, importing and validating it only once
+
+        Raises:
+            ImportError: the callback module cannot be imported
+            AttributeError: the callback module has no method_name coroutine function
+        """
+        method = self._callback_methods.get((callback, method_name))
+        if method is not None:
+            return method
+        try:
+            cb = import_module(callback)
+        except ImportError:
+            _logger.exception(
+                'Unable to import callback module %s for category_name %s', callback, category_name)
+            raise
+        if not hasattr(cb, method_name):
+            _logger.exception(
+                'Callback module %s does not have method %s', callback, method_name)
+            raise AttributeError('Callback module {} does not have method {}'.format(callback, method_name))
+        method = getattr(cb, method_name)
+        if not inspect.iscoroutinefunction(method):
+            _logger.exception(
+                'Callback module %s %s method must be a coroutine function', callback, method_name)
+            raise AttributeError(
+                'Callback module {} {} method must be a coroutine function'.format(callback, method_name))
+        self._callback_methods[(callback, method_name)] = method
+        return method
+
+    @staticmethod
+    async def _dispatch_callbacks(coroutines):
+        # Callbacks are independent of each other; all of them run to completion and the first failure is raised
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
     async def _run_callbacks(self, category_name):
         callbacks = self._registered_interests.get(category_name)
         if callbacks is not None:
-            for callback in callbacks:
-                try:
-                    cb = import_module(callback)
-                except ImportError:
-                    _logger.exception(
-                        'Unable to import callback module %s for category_name %s', callback, category_name)
-                    raise
-                if not hasattr(cb, 'run'):
-                    _logger.exception(
-                        'Callback module %s does not have method run', callback)
-                    raise AttributeError('Callback module {} does not have method run'.format(callback))
-                method = cb.run
-                if not inspect.iscoroutinefunction(method):
-                    _logger.exception(
-                        'Callback module %s run method must be a coroutine function', callback)
-                    raise AttributeError('Callback module {} run method must be a coroutine function'.format(callback))
-                await cb.run(category_name)
+            methods = [self._resolve_callback(callback, 'run', category_name) for callback in callbacks]
+            await self._dispatch_callbacks([method(category_name) for method in methods])
 
     async def _run_callbacks_child(self, parent_category_name, child_category, operation):
-
         callbacks = self._registered_interests_child.get(parent_category_name)
-
         if callbacks is not None:
-            for callback in callbacks:
-                try:
-                    cb = import_module(callback)
-                except ImportError:
-                    _logger.exception(
-                        'Unable to import callback module %s for category_name %s', callback, parent_category_name)
-                    raise
-                if not hasattr(cb, 'run_child'):
-                    _logger.exception(
-                        'Callback module %s does not have method run_child', callback)
-                    raise AttributeError('Callback module {} does not have method run_child'.format(callback))
-                method = cb.run_child
-                if not inspect.iscoroutinefunction(method):
-                    _logger.exception(
-                        'Callback module %s run_child method must be a coroutine function', callback)
-                    raise AttributeError(
-                        'Callback module {} run_child method must be a coroutine function'.format(callback))
-                await cb.run_child(parent_category_name, child_category, operation)
+            methods = [self._resolve_callback(callback, 'run_child', parent_category_name) for callback in callbacks]
+            await self._dispatch_callbacks([method(parent_category_name, child_category, operation)
+                                            for method in methods])
 
     async def _merge_category_vals(self, category_val_new, category_val_storage, keep_original_items,
                                    category_name=None):
@@ -394,6 +451,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
             payload = PayloadBuilder().INSERT(key=category_name, description=category_description,
                                               value=new_category_val, display_name=display_name).payload()
             result = await self._storage.insert_into_tbl("configuration", payload)
+            self._invalidate_category_tree()
             response = result['response']
             self._cacheManager.update(category_name, category_description, new_category_val, display_name)
         except KeyError:
@@ -466,47 +524,66 @@ class ConfigurationManager(ConfigurationManagerSingleton):
         result = await self._storage.query_tbl_with_payload('configuration', payload)
         return result['rows'][0] if result['rows'] else None
 
-    async def _read_all_groups(self, root, children):
-        async def nested_children(child):
-            # Recursively find children
-            if not child:
-                return
-            next_children = await self.get_category_child(child["key"])
-            if len(next_children) == 0:
-                child.update({"children": []})
-            else:
-                child.update({"children": next_children})
-                # call for each child
-                for next_child in child["children"]:
-                    await nested_children(next_child)
+    async def _read_category_tree(self):
+        """ Read all categories and parent-child relationships, one query per table
+
+        The result is cached until a category is created, deleted or renamed or a parent-child relationship changes.
 
+        Return Values:
+            a tuple (categories, children) where categories is an ordered dict of category_name to a tuple
+            (category_name, category_description, display_name) and children is a dict of parent category_name
+            to the list of its child category names, in insertion order
+        """
+        if self._category_tree is not None:
+            return self._category_tree
+        generation = self._category_tree_generation
         # SELECT key, description, display_name FROM configuration
         payload = PayloadBuilder().SELECT("key", "description", "display_name").payload()
         all_categories = await self._storage.query_tbl_with_payload('configuration', payload)
+        # SELECT parent, child FROM category_children ORDER BY id
+        payload = PayloadBuilder().SELECT("parent", "child").ORDER_BY(["id"]).payload()
+        all_children = await self._storage.query_tbl_with_payload('category_children', payload)
+
+        categories = collections.OrderedDict()
+        for row in all_categories['rows']:
+            categories[row["key"]] = (row["key"], row["description"], row["display_name"])
+        children = {}
+        for row in all_children['rows']:
+            children.setdefault(row["parent"], []).append(row["child"])
+        tree = (categories, children)
+        # Do not cache a tree read while a change was being made
+        if generation == self._category_tree_generation:
+            self._category_tree = tree
+        return tree
+
+    def _invalidate_category_tree(self):
+        self._category_tree = None
+        self._category_tree_generation += 1
 
-        # SELECT DISTINCT child FROM category_children
-        unique_category_children_payload = PayloadBuilder().SELECT("child").DISTINCT(["child"]).payload()
-        unique_category_children = await self._storage.query_tbl_with_payload('category_children',
-                                                                              unique_category_children_payload)
+    async def _read_all_groups(self, root, children):
+        def nested_children(parent, ancestors):
+            # Children without a configuration row are skipped, a cycle is cut at the repeated category
+            branch = []
+            for child in relations.get(parent, []):
+                if child not in categories or child in ancestors:
+                    continue
+                k, v, d = categories[child]
+                branch.append({"key": k, "description": v, "displayName": d,
+                               "children": nested_children(child, ancestors | {child})})
+            return branch
 
-        list_child = [row['child'] for row in unique_category_children['rows']]
+        categories, relations = await self._read_category_tree()
+        list_child = {child for parent_children in relations.values() for child in parent_children}
         list_root = []
         list_not_root = []
-
-        for row in all_categories['rows']:
-            if row["key"] in list_child:
-                list_not_root.append((row["key"], row["description"], row["display_name"]))
+        for category in categories.values():
+            if category[0] in list_child:
+                list_not_root.append(category)
             else:
-                list_root.append((row["key"], row["description"], row["display_name"]))
+                list_root.append(category)
         if children:
-            tree = []
-            for k, v, d in list_root if root is True else list_not_root:
-                tree.append({"key": k, "description": v, "displayName": d, "children": []})
-
-            for branch in tree:
-                await nested_children(branch)
-
-            return tree
+            return [{"key": k, "description": v, "displayName": d, "children": nested_children(k, {k})}
+                    for k, v, d in (list_root if root is True else list_not_root)]
 
         return list_root if root else list_not_root
 
@@ -663,6 +740,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
                     else:
                         self._cacheManager.cache[category_name]['value'].update(
                             {item_name: cat_value[item_name]['value']})
+            self._cacheManager.refresh(category_name)
 
             # Configuration Change audit entry
             audit = AuditLogger(self._storage)
@@ -711,17 +789,11 @@ class ConfigurationManager(ConfigurationManagerSingleton):
             payload = PayloadBuilder().SET(value=category_val, description=category_description,
                                            display_name=display_name).WHERE(["key", "=", category_name]).payload()
             result = await self._storage.update_tbl("configuration", payload)
+            self._invalidate_category_tree()
             response = result['response']
             # Re-read category from DB
             new_category_val_db = await self._read_category_val(category_name)
-            if category_name in self._cacheManager.cache:
-                self._cacheManager.cache[category_name]['description'] = category_description
-                self._cacheManager.cache[category_name]['value'] = new_category_val_db
-                self._cacheManager.cache[category_name]['displayName'] = display_name
-            else:
-                self._cacheManager.cache.update({category_name: {"description": category_description,
-                                                                 "value": new_category_val_db,
-                                                                 "displayName": display_name}})
+            self._cacheManager.update(category_name, category_description, new_category_val_db, display_name)
         except KeyError:
             raise ValueError(result['message'])
         except StorageServerError as ex:
@@ -919,6 +991,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
                         self._cacheManager.cache[category_name]['value'][item_name]["file"] = script_file_path
                 else:
                     self._cacheManager.cache[category_name]['value'].update({item_name: cat_item['value']})
+                self._cacheManager.refresh(category_name)
         except:
             _logger.exception(
                 'Unable to set item value entry based on category_name %s and item_name %s and value_item_entry %s',
@@ -1016,6 +1089,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
                         optional_entry_name]
                 else:
                     self._cacheManager.cache[category_name]['value'].update({item_name: cat_item[optional_entry_name]})
+                self._cacheManager.refresh(category_name)
         except:
             _logger.exception(
                 'Unable to set optional %s entry based on category_name %s and item_name %s and value_item_entry %s',
@@ -1180,6 +1254,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
         try:
             payload = PayloadBuilder().INSERT(parent=category_name, child=child).payload()
             result = await self._storage.insert_into_tbl("category_children", payload)
+            self._invalidate_category_tree()
             response = result['response']
         except KeyError:
             raise ValueError(result['message'])
@@ -1309,6 +1384,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
             payload = PayloadBuilder().WHERE(["parent", "=", category_name]).AND_WHERE(
                 ["child", "=", child_category]).payload()
             result = await self._storage.delete_from_tbl("category_children", payload)
+            self._invalidate_category_tree()
 
             if result['response'] == 'deleted':
                 child_dict = await self._read_all_child_category_names(category_name)
@@ -1351,6 +1427,7 @@ class ConfigurationManager(ConfigurationManagerSingleton):
         try:
             payload = PayloadBuilder().WHERE(["parent", "=", category_name]).payload()
             result = await self._storage.delete_from_tbl("category_children", payload)
+            self._invalidate_category_tree()
             response = result["response"]
             # TODO: Shall we write audit trail code entry here? log_code?
 
@@ -1415,12 +1492,14 @@ class ConfigurationManager(ConfigurationManagerSingleton):
             # Remove cat as child from parent-child relation.
             payload = PayloadBuilder().WHERE(["child", "=", cat]).payload()
             result = await self._storage.delete_from_tbl("category_children", payload)
+            self._invalidate_category_tree()
             if result['response'] == 'deleted':
                 _logger.info('Deleted parent in category_children: %s', cat)
 
             # Remove category.
             payload = PayloadBuilder().WHERE(["key", "=", cat]).payload()
             result = await self._storage.delete_from_tbl("configuration", payload)
+            self._invalidate_category_tree()
             if result['response'] == 'deleted':
                 _logger.info('Deleted parent category from configuration: %s', cat)
                 audit = AuditLogger(self._storage)
@@ -1487,12 +1566,15 @@ class ConfigurationManager(ConfigurationManagerSingleton):
         A callback is only called if the corresponding category_value is created or updated.
         A callback is not called if the corresponding category_description is updated.
         A change in configuration is not rolled back if callbacks fail.
+        The callback module is imported and validated here; ImportError or AttributeError is raised if it is invalid.
+        Callbacks registered for the same category_name run concurrently.
         """
 
         if category_name is None:
             raise ValueError('Failed to register interest. category_name cannot be None')
         if callback is None:
             raise ValueError('Failed to register interest. callback cannot be None')
+        self._resolve_callback(callback, 'run_child', category_name)
         if self._registered_interests_child.get(category_name) is None:
             self._registered_interests_child[category_name] = {callback}
         else:
@@ -1520,11 +1602,14 @@ class ConfigurationManager(ConfigurationManagerSingleton):
         A callback is only called if the corresponding category_value is created or updated.
         A callback is not called if the corresponding category_description is updated.
         A change in configuration is not rolled back if callbacks fail.
+        The callback module is imported and validated here; ImportError or AttributeError is raised if it is invalid.
+        Callbacks registered for the same category_name run concurrently.
         """
         if category_name is None:
             raise ValueError('Failed to register interest. category_name cannot be None')
         if callback is None:
             raise ValueError('Failed to register interest. callback cannot be None')
+        self._resolve_callback(callback, 'run', category_name)
         if self._registered_interests.get(category_name) is None:
             self._registered_interests[category_name] = {callback}
         else:
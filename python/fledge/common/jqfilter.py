@@ -7,6 +7,8 @@
 """ A simple implementation using the jq product to apply a transformation to the JSON document
 """
 
+from functools import lru_cache
+
 import pyjq
 
 from fledge.common import logger
@@ -16,6 +18,15 @@ __copyright__ = "Copyright (c) 2017 OSI Soft, LLC"
 __license__ = "Apache 2.0"
 __version__ = "${VERSION}"
 
+_MAX_COMPILED_FILTERS = 64
+""" Number of compiled jq programs kept in memory """
+
+
+@lru_cache(maxsize=_MAX_COMPILED_FILTERS)
+def _compile(filter_string):
+    """ Compiles the jq program once for each filter text """
+    return pyjq.compile(filter_string)
+
 
 class JQFilter:
     """JQFilter class to use the jq product.
@@ -27,12 +38,26 @@ class JQFilter:
         """Initialise the JQFilter"""
         self._logger = logger.setup("JQFilter")
 
-    def transform(self, reading_block, filter_string):
+    def compile(self, filter_string):
+        """ Compiles the filter, the compiled program is cached and shared by all the instances
+        Args:
+            filter_string: filter to compile. Filter should be in JQ format.
+        Returns: the compiled jq program
+        Raises:
+            ValueError: If filter is not a proper JQ filter
         """
+        try:
+            return _compile(filter_string)
+        except ValueError as ex:
+            self._logger.error("Failed to transform, please check the transformation rule, exception %s", str(ex))
+            raise
+
+    def transform(self, reading_block, filter_string):
+        """ Applies the filter to the reading block, the filter is compiled only the first time it is used
         Args:
             reading_block: Formatted JSON on which filter needs to be applied.
             filter_string: filter to apply. Filter should be in JQ format.
-        Returns: transformed JSON (if apply_filter is true)
+        Returns: the list of the results of the filter, as Python objects
         Raises:
             TypeError: If reading_block is not a valid JSON
             ValueError: If filter is not a proper JQ filter
@@ -42,8 +67,9 @@ class JQFilter:
                 and usage with plugins using defined configurations.
 
         """
+        program = self.compile(filter_string)
         try:
-            return pyjq.all(filter_string, reading_block)
+            return program.all(reading_block)
         except TypeError as ex:
             self._logger.error("Invalid JSON passed, exception %s", str(ex))
             raise
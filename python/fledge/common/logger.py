@@ -6,7 +6,6 @@
 
 """ Fledge Logger """
 import os
-import subprocess
 import sys
 import logging
 from logging.handlers import SysLogHandler
@@ -29,6 +28,10 @@ CONSOLE = 1
 FLEDGE_LOGS_DESTINATION='FLEDGE_LOGS_DESTINATION'  # env variable
 default_destination = SYSLOG    # default for fledge
 
+FLEDGE_PROCESS_NAME = 'FLEDGE_PROCESS_NAME'  # env variable, used when the process has no --name argument
+_PROC_CMDLINE = '/proc/self/cmdline'
+_process_name = None
+
 def set_default_destination(destination: int):
     """ set_default_destination - allow a global default to be set, once, for all fledge modules
         also, set env variable FLEDGE_LOGS_DESTINATION for communication with related, spawned
@@ -42,7 +45,37 @@ if (FLEDGE_LOGS_DESTINATION in os.environ) and \
    os.environ[FLEDGE_LOGS_DESTINATION] in [str(CONSOLE), str(SYSLOG)]:
     # inherit (valid) default from the environment
     set_default_destination(int(os.environ[FLEDGE_LOGS_DESTINATION]))
-    
+
+
+def _name_argument(args):
+    """ Value of the --name=<process name> argument, or None """
+    for arg in args:
+        if arg.startswith('--name='):
+            return arg[len('--name='):]
+    return None
+
+
+def _cmdline_args():
+    """ Arguments of this process as the kernel has them, also when Python is embedded and sys.argv is empty """
+    try:
+        with open(_PROC_CMDLINE, 'rb') as f:
+            return f.read().decode(errors='replace').split('\0')
+    except OSError:
+        return []
+
+
+def _get_process_name():
+    """ 'Fledge' followed by the process name, which is shared by all the loggers of the process
+
+    The name is found once, from the --name argument in sys.argv or /proc/self/cmdline, else from the
+    FLEDGE_PROCESS_NAME environment variable.
+    """
+    global _process_name
+    if _process_name is None:
+        name = _name_argument(getattr(sys, 'argv', [])) or _name_argument(_cmdline_args()) or \
+            os.environ.get(FLEDGE_PROCESS_NAME)
+        _process_name = 'Fledge ' + name if name else 'Fledge'
+    return _process_name
 
 
 def setup(logger_name: str = None,
@@ -84,15 +117,6 @@ def setup(logger_name: str = None,
     .. _logging.getLogger: https://docs.python.org/3/library/logging.html#logging.getLogger
     """
 
-    def _get_process_name():
-        # Example: ps -eaf | grep 5175 | grep -v grep | awk -F '--name=' '{print $2}'
-        pid = os.getpid()
-        cmd = "ps -eaf | grep {} | grep -v grep | awk -F '--name=' '{{print $2}}'| tr -d '\n'".format(pid)
-        read_process_name = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE).stdout.readlines()
-        binary_to_string = [b.decode() for b in read_process_name]
-        pname = 'Fledge ' + binary_to_string[0] if binary_to_string else 'Fledge'
-        return pname
-
     logger = logging.getLogger(logger_name)
 
     # if no destination is set, use the fledge default
@@ -4,12 +4,16 @@
 # See: http://fledge-iot.readthedocs.io/
 # FLEDGE_END
 
+import asyncio
 import http.client
 import json
 import urllib.parse
 import logging
 
+import aiohttp
+
 from fledge.common import logger
+from fledge.common.utils import release_session
 from fledge.common.microservice_management_client import exceptions as client_exceptions
 
 __author__ = "Ashwin Gopalakrishnan"
@@ -22,6 +26,15 @@ _logger = logger.setup(__name__, level=logging.INFO)
 
 class MicroserviceManagementClient(object):
     _management_client_conn = None
+    _session = None
+    _session_loop = None
+    _session_semaphore = None
+
+    MAX_CONCURRENT_REQUESTS = 8
+    """ maximum number of asynchronous requests in flight towards the core at once """
+
+    REQUEST_TIMEOUT = 10
+    """ seconds within which an asynchronous request to the core must complete """
 
     def __init__(self, microservice_management_host, microservice_management_port):
         self._management_client_conn = http.client.HTTPConnection("{0}:{1}".format(microservice_management_host, microservice_management_port))
@@ -371,6 +384,54 @@ class MicroserviceManagementClient(object):
         response = json.loads(res)
         return response
 
+    def _get_session(self):
+        """ Return the client session and semaphore of the asynchronous requests, creating them on first use
+
+        The session keeps a keep-alive connection pool towards the core; it is re-created if it was closed or if it
+        is used from a different event loop than the one it was bound to, in which case the previous session is
+        released first.
+        """
+        loop = asyncio.get_event_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            release_session(self._session)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_REQUESTS),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT))
+            self._session_loop = loop
+            self._session_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return self._session, self._session_semaphore
+
+    async def close_session(self):
+        """ Close the client session of the asynchronous requests; to be awaited when the service stops """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self._session_semaphore = None
+
+    async def create_asset_tracker_events(self, asset_events):
+        """ Registers a batch of asset tracker events without blocking the event loop
+
+        At most MAX_CONCURRENT_REQUESTS events are posted at once, each within REQUEST_TIMEOUT seconds.
+
+        :param asset_events: list of events
+               e.g. [{"asset": "AirIntake", "event": "Ingest", "service": "PT100_In1", "plugin": "PT100"}]
+        :return: a list holding, for each event in order, the core response or the exception that occurred
+        """
+        url = 'http://{}:{}/fledge/track'.format(self.hostname, self.port)
+        session, semaphore = self._get_session()
+
+        async def post(asset_event):
+            async with semaphore:
+                async with session.post(url, data=json.dumps(asset_event)) as resp:
+                    if resp.status in range(400, 600):
+                        _logger.error("Error code: %d, Reason: %s", resp.status, resp.reason)
+                        raise client_exceptions.MicroserviceManagementClientError(status=resp.status,
+                                                                                  reason=resp.reason)
+                    return json.loads(await resp.text())
+
+        return await asyncio.gather(*[post(asset_event) for asset_event in asset_events], return_exceptions=True)
+
     def create_asset_tracker_event(self, asset_event):
         """
 
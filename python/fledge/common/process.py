@@ -110,6 +110,11 @@ class FledgeProcess(ABC):
                                                                   self._core_management_port)
         self._storage_async = StorageClientAsync(self._core_management_host, self._core_management_port)
 
+    async def close_storage_sessions(self):
+        """ Release the pooled connections of the storage clients; awaited once the process is done with storage """
+        await self._readings_storage_async.close_session()
+        await self._storage_async.close_session()
+
     # pure virtual method run() to be implemented by child class
     @abstractmethod
     def run(self):
@@ -4,7 +4,8 @@
 # See: http://fledge-iot.readthedocs.io/
 # FLEDGE_END
 
-import json
+import asyncio
+
 from fledge.common import logger
 from fledge.common.storage_client.payload_builder import PayloadBuilder
 from fledge.common.storage_client.storage_client import StorageClientAsync
@@ -67,9 +68,9 @@ class Statistics(object):
                 payload_item = PayloadBuilder() \
                     .WHERE(["key", "=", k]) \
                     .EXPR(["value", "+", v]) \
-                    .payload()
-                payload['updates'].append(json.loads(payload_item))
-            await self._storage.update_tbl("statistics", json.dumps(payload, sort_keys=False))
+                    .chain_payload()
+                payload['updates'].append(payload_item)
+            await self._storage.update_tbl("statistics", payload)
         except Exception as ex:
             _logger.exception('Unable to bulk update statistics %s', str(ex))
             raise
@@ -147,6 +148,32 @@ class Statistics(object):
                 _logger.exception('Unable to create new statistic %s, error %s', key, str(ex))
                 raise
 
+    async def register_bulk(self, keys):
+        """ Register with a single insert the keys not yet in the statistics table
+
+        Args:
+            keys: dict containing statistics keys and their description
+
+        Returns:
+            None
+        """
+        if not self._registered_keys:
+            await self._load_keys()
+        registered_keys = set(self._registered_keys)
+        new_keys = {key: description for key, description in keys.items() if key not in registered_keys}
+        if not new_keys:
+            return
+        try:
+            payload = {"inserts": [{"key": key, "description": description, "value": 0, "previous_value": 0}
+                                   for key, description in new_keys.items()]}
+            await self._storage.insert_into_tbl("statistics", payload)
+            self._registered_keys.extend(new_keys)
+        except Exception:
+            """ Some keys may have been created in another process, reload keys and register the others one by one """
+            await self._load_keys()
+            for key, description in new_keys.items():
+                await self.register(key, description)
+
     async def _load_keys(self):
         self._registered_keys = []
         try:
@@ -156,3 +183,85 @@ class Statistics(object):
                 self._registered_keys.append(row['key'])
         except Exception as ex:
             _logger.exception('Failed to retrieve statistics keys, %s', str(ex))
+
+
+class StatisticsAccumulator(object):
+    """ Counts statistics increments in memory and writes them to the statistics table
+        with a single bulk update every flush interval.
+
+        Keys that are not yet in the statistics table are registered together, with a single insert,
+        before the update that first increments them. Increments are plain in memory operations, hence
+        the accumulator can be shared by all the coroutines of a process; the increments of a failed
+        flush are kept and written by the next one.
+    """
+
+    DEFAULT_FLUSH_INTERVAL = 5
+    """ Seconds between two writes of the accumulated increments """
+
+    def __init__(self, storage=None, flush_interval=None):
+        self._storage = storage
+        self._statistics = None
+        self._flush_interval = self.DEFAULT_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._increments = {}
+        """ Increments not yet written, by key """
+        self._descriptions = {}
+        """ Description of the keys that may need to be registered """
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = None
+
+    def increment(self, key, value_increment=1, description=None):
+        """ Add an increment to a statistics key, it is written to storage by the next flush
+
+        Args:
+            key: statistics key
+            value_increment: amount to increment the value by
+            description: description of the key, given if the key may not be registered yet
+        """
+        self._increments[key] = self._increments.get(key, 0) + value_increment
+        if description is not None and key not in self._descriptions:
+            self._descriptions[key] = description
+
+    async def flush(self):
+        """ Register the new keys and write the accumulated increments with a single bulk update """
+        async with self._flush_lock:
+            increments = {key: value for key, value in self._increments.items() if value != 0}
+            self._increments = {}
+            if not increments:
+                return
+            try:
+                if self._statistics is None:
+                    self._statistics = await create_statistics(self._storage)
+                new_keys = {key: self._descriptions[key] for key in increments if key in self._descriptions}
+                if new_keys:
+                    await self._statistics.register_bulk(new_keys)
+                    for key in new_keys:
+                        del self._descriptions[key]
+                await self._statistics.update_bulk(increments)
+            except Exception:
+                for key, value in increments.items():
+                    self._increments[key] = self._increments.get(key, 0) + value
+                raise
+
+    def start(self):
+        """ Start writing the accumulated increments every flush interval """
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_periodically())
+
+    async def stop(self):
+        """ Stop the periodic writes and write the increments still pending """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as ex:
+                _logger.error('Unable to write statistics, they will be written by the next flush: %s', str(ex))
@@ -12,6 +12,7 @@ __copyright__ = "Copyright (c) 2017 OSIsoft, LLC"
 __license__ = "Apache 2.0"
 __version__ = "${VERSION}"
 
+import asyncio
 import aiohttp
 import http.client
 import json
@@ -19,6 +20,7 @@ import time
 from abc import ABC, abstractmethod
 
 from fledge.common import logger
+from fledge.common.utils import release_session
 from fledge.common.service_record import ServiceRecord
 from fledge.common.storage_client.exceptions import *
 from fledge.common.storage_client.utils import Utils
@@ -49,7 +51,16 @@ class AbstractStorage(ABC):
 
 
 class StorageClientAsync(AbstractStorage):
+
+    CONNECTION_LIMIT = 100
+    """ maximum number of simultaneous connections kept with the storage service """
+
+    KEEPALIVE_TIMEOUT = 30
+    """ seconds an idle keep-alive connection is held open before it is released """
+
     def __init__(self, core_management_host, core_management_port, svc=None):
+        self._session = None
+        self._session_loop = None
         try:
             if svc:
                 self.service = svc
@@ -120,13 +131,36 @@ class StorageClientAsync(AbstractStorage):
     def disconnect(self):
         pass
 
+    def _get_session(self):
+        """ Return the long-lived client session of this instance, creating it on first use
+
+        The session holds a keep-alive connection pool towards the storage service; it is re-created if it was closed
+        or if the client is used from a different event loop than the one the session was bound to, in which case the
+        previous session is released first.
+        """
+        loop = asyncio.get_event_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            release_session(self._session)
+            connector = aiohttp.TCPConnector(limit=self.CONNECTION_LIMIT, keepalive_timeout=self.KEEPALIVE_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+
+    async def close_session(self):
+        """ Close the client session and release the pooled connections; to be awaited when the owning service stops
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     # FIXME: As per JIRA-615 strict=false at python side (interim solution)
     # fix is required at storage layer (error message with escape sequence using a single quote)
     async def insert_into_tbl(self, tbl_name, data):
         """ insert json payload into given table
 
         :param tbl_name:
-        :param data: JSON payload
+        :param data: JSON payload; a JSON str, a dict/list to be serialized or pre-encoded JSON bytes
         :return:
 
         :Example:
@@ -145,19 +179,20 @@ class StorageClientAsync(AbstractStorage):
         if not data:
             raise ValueError("Data to insert is missing")
 
-        if not Utils.is_json(data):
+        data = Utils.encode_payload(data)
+        if data is None:
             raise TypeError("Provided data to insert must be a valid JSON")
 
         post_url = '/storage/table/{tbl_name}'.format(tbl_name=tbl_name)
         url = 'http://' + self.base_url + post_url
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=data) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("POST %s, with payload: %s", post_url, data)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.post(url, data=data) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.info("POST %s, with payload: %s", post_url, data)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -165,7 +200,7 @@ class StorageClientAsync(AbstractStorage):
         """ update json payload for specified condition into given table
 
         :param tbl_name:
-        :param data: JSON payload
+        :param data: JSON payload; a JSON str, a dict/list to be serialized or pre-encoded JSON bytes
         :return:
 
         :Example:
@@ -188,20 +223,21 @@ class StorageClientAsync(AbstractStorage):
         if not data:
             raise ValueError("Data to update is missing")
 
-        if not Utils.is_json(data):
+        data = Utils.encode_payload(data)
+        if data is None:
             raise TypeError("Provided data to update must be a valid JSON")
 
         put_url = '/storage/table/{tbl_name}'.format(tbl_name=tbl_name)
 
         url = 'http://' + self.base_url + put_url
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url, data=data) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("PUT %s, with payload: %s", put_url, data)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.put(url, data=data) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.info("PUT %s, with payload: %s", put_url, data)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -209,7 +245,7 @@ class StorageClientAsync(AbstractStorage):
         """ Delete for specified condition from given table
 
         :param tbl_name:
-        :param condition: JSON payload
+        :param condition: JSON payload; a JSON str, a dict to be serialized or pre-encoded JSON bytes
         :return:
 
         :Example:
@@ -227,18 +263,20 @@ class StorageClientAsync(AbstractStorage):
 
         del_url = '/storage/table/{tbl_name}'.format(tbl_name=tbl_name)
 
-        if condition and (not Utils.is_json(condition)):
-            raise TypeError("condition payload must be a valid JSON")
+        if condition:
+            condition = Utils.encode_payload(condition)
+            if condition is None:
+                raise TypeError("condition payload must be a valid JSON")
 
         url = 'http://' + self.base_url + del_url
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, data=condition) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("DELETE %s, with payload: %s", del_url, condition if condition else '')
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.delete(url, data=condition) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.info("DELETE %s, with payload: %s", del_url, condition if condition else '')
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -262,14 +300,14 @@ class StorageClientAsync(AbstractStorage):
             get_url += '?{}'.format(query)
 
         url = 'http://' + self.base_url + get_url
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("GET %s", get_url)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.get(url) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.info("GET %s", get_url)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -277,7 +315,7 @@ class StorageClientAsync(AbstractStorage):
         """ Complex SELECT query for the specified table with a payload
 
         :param tbl_name:
-        :param query_payload: payload in valid JSON format
+        :param query_payload: payload in valid JSON format; a JSON str, a dict to be serialized or pre-encoded JSON bytes
         :return:
 
         :Example:
@@ -295,21 +333,22 @@ class StorageClientAsync(AbstractStorage):
         if not query_payload:
             raise ValueError("Query payload is missing")
 
-        if not Utils.is_json(query_payload):
+        query_payload = Utils.encode_payload(query_payload)
+        if query_payload is None:
             raise TypeError("Query payload must be a valid JSON")
 
         put_url = '/storage/table/{tbl_name}/query'.format(tbl_name=tbl_name)
 
         url = 'http://' + self.base_url + put_url
 
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url, data=query_payload) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("PUT %s, with query payload: %s", put_url, query_payload)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.put(url, data=query_payload) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.info("PUT %s, with query payload: %s", put_url, query_payload)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -326,14 +365,14 @@ class StorageClientAsync(AbstractStorage):
         data = {"id": str(int(time.time()))}
 
         url = 'http://' + self.base_url + post_url
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=json.dumps(data)) as resp:
-                status_code = resp.status
-                jdoc = await resp.text()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("POST %s", post_url)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.post(url, data=json.dumps(data)) as resp:
+            status_code = resp.status
+            jdoc = await resp.text()
+            if status_code not in range(200, 209):
+                _LOGGER.info("POST %s", post_url)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
         return json.loads(jdoc)
 
     async def put_snapshot(self, tbl_name, snapshot_id):
@@ -349,14 +388,14 @@ class StorageClientAsync(AbstractStorage):
         put_url = '/storage/table/{tbl_name}/snapshot/{id}'.format(tbl_name=tbl_name, id=snapshot_id)
 
         url = 'http://' + self.base_url + put_url
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url) as resp:
-                status_code = resp.status
-                jdoc = await resp.text()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("PUT %s", put_url)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.put(url) as resp:
+            status_code = resp.status
+            jdoc = await resp.text()
+            if status_code not in range(200, 209):
+                _LOGGER.info("PUT %s", put_url)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
         return json.loads(jdoc)
 
     async def delete_snapshot(self, tbl_name, snapshot_id):
@@ -372,14 +411,14 @@ class StorageClientAsync(AbstractStorage):
         delete_url = '/storage/table/{tbl_name}/snapshot/{id}'.format(tbl_name=tbl_name, id=snapshot_id)
 
         url = 'http://' + self.base_url + delete_url
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url) as resp:
-                status_code = resp.status
-                jdoc = await resp.text()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("DELETE %s", delete_url)
-                    _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.delete(url) as resp:
+            status_code = resp.status
+            jdoc = await resp.text()
+            if status_code not in range(200, 209):
+                _LOGGER.info("DELETE %s", delete_url)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
         return json.loads(jdoc)
 
     async def get_snapshot(self, tbl_name):
@@ -394,14 +433,44 @@ class StorageClientAsync(AbstractStorage):
         get_url = '/storage/table/{tbl_name}/snapshot'.format(tbl_name=tbl_name)
 
         url = 'http://' + self.base_url + get_url
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                status_code = resp.status
-                jdoc = await resp.text()
-                if status_code not in range(200, 209):
-                    _LOGGER.info("GET %s", get_url)
+        session = self._get_session()
+        async with session.get(url) as resp:
+            status_code = resp.status
+            jdoc = await resp.text()
+            if status_code not in range(200, 209):
+                _LOGGER.info("GET %s", get_url)
+                _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        return json.loads(jdoc)
+
+    async def statistics_snapshot(self, history_ts):
+        """Snapshot the statistics table into the statistics history
+
+        The storage service inserts value - previous_value of every statistic into statistics_history and rolls
+        previous_value forward to value in a single transaction, so increments made meanwhile are kept for the
+        next snapshot.
+
+        :param history_ts: history_ts of the new statistics_history rows
+        :return:
+        :raises StorageServerError: code 404 if the storage plugin does not support statistics snapshots
+
+        :Example:
+            curl -X POST http://0.0.0.0:8080/storage/statistics/snapshot -d '{"history_ts": "2018-05-08 14:06:40.517313+05:30"}'
+        """
+        post_url = '/storage/statistics/snapshot'
+        data = {"history_ts": history_ts}
+
+        url = 'http://' + self.base_url + post_url
+        session = self._get_session()
+        async with session.post(url, data=json.dumps(data)) as resp:
+            status_code = resp.status
+            jdoc = await resp.text()
+            if status_code not in range(200, 209):
+                # 404 is the answer of a storage plugin without snapshot support, the caller handles it
+                if status_code != 404:
+                    _LOGGER.info("POST %s, with payload: %s", post_url, data)
                     _LOGGER.error("Error code: %d, reason: %s, details: %s", resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
         return json.loads(jdoc)
 
 
@@ -415,7 +484,7 @@ class ReadingsStorageClientAsync(StorageClientAsync):
 
     async def append(self, readings):
         """
-        :param readings:
+        :param readings: a JSON str, a dict to be serialized or pre-encoded JSON bytes
         :return:
 
         :Example:
@@ -441,18 +510,19 @@ class ReadingsStorageClientAsync(StorageClientAsync):
         if not readings:
             raise ValueError("Readings payload is missing")
 
-        if not Utils.is_json(readings):
+        readings = Utils.encode_payload(readings)
+        if readings is None:
             raise TypeError("Readings payload must be a valid JSON")
 
         url = 'http://' + self._base_url + '/storage/reading'
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=readings) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.error("POST url %s with payload: %s, Error code: %d, reason: %s, details: %s",
-                                  '/storage/reading', readings, resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.post(url, data=readings) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.error("POST url %s with payload: %s, Error code: %d, reason: %s, details: %s",
+                              '/storage/reading', readings, resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -480,21 +550,21 @@ class ReadingsStorageClientAsync(StorageClientAsync):
 
         get_url = '/storage/reading?id={}&count={}'.format(reading_id, count)
         url = 'http://' + self._base_url + get_url
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.error("GET url: %s, Error code: %d, reason: %s, details: %s", url, resp.status,
-                                  resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.get(url) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.error("GET url: %s, Error code: %d, reason: %s, details: %s", url, resp.status,
+                              resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
     async def query(self, query_payload):
         """
 
-        :param query_payload:
+        :param query_payload: a JSON str, a dict to be serialized or pre-encoded JSON bytes
         :return:
         :Example:
             curl -X PUT http://0.0.0.0:8080/storage/reading/query -d @payload.json
@@ -512,18 +582,19 @@ class ReadingsStorageClientAsync(StorageClientAsync):
         if not query_payload:
             raise ValueError("Query payload is missing")
 
-        if not Utils.is_json(query_payload):
+        query_payload = Utils.encode_payload(query_payload)
+        if query_payload is None:
             raise TypeError("Query payload must be a valid JSON")
 
         url = 'http://' + self._base_url + '/storage/reading/query'
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url, data=query_payload) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.error("PUT url %s with query payload: %s, Error code: %d, reason: %s, details: %s",
-                                  '/storage/reading/query', query_payload, resp.status, resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.put(url, data=query_payload) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.error("PUT url %s with query payload: %s, Error code: %d, reason: %s, details: %s",
+                              '/storage/reading/query', query_payload, resp.status, resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
 
@@ -584,13 +655,13 @@ class ReadingsStorageClientAsync(StorageClientAsync):
             put_url = '/storage/reading/purge?asset={}'.format(asset)
 
         url = 'http://' + self._base_url + put_url
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url, data=None) as resp:
-                status_code = resp.status
-                jdoc = await resp.json()
-                if status_code not in range(200, 209):
-                    _LOGGER.error("PUT url %s, Error code: %d, reason: %s, details: %s", put_url, resp.status,
-                                  resp.reason, jdoc)
-                    raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
+        session = self._get_session()
+        async with session.put(url, data=None) as resp:
+            status_code = resp.status
+            jdoc = await resp.json()
+            if status_code not in range(200, 209):
+                _LOGGER.error("PUT url %s, Error code: %d, reason: %s, details: %s", put_url, resp.status,
+                              resp.reason, jdoc)
+                raise StorageServerError(code=resp.status, reason=resp.reason, error=jdoc)
 
         return jdoc
@@ -20,6 +20,9 @@ import json
 
 class Utils(object):
 
+    _json_encoder = json.dumps
+    """ callable used to serialize dict/list payloads, returning str or bytes """
+
     @staticmethod
     def is_json(payload):
         try:
@@ -27,3 +30,23 @@ class Utils(object):
         except (TypeError, ValueError):  # JSONDecodeError is a subclass of ValueError
             return False
         return True
+
+    @classmethod
+    def set_json_encoder(cls, encoder=None):
+        """ Plug in a faster JSON encoder (e.g. orjson.dumps) for dict/list payloads; None restores json.dumps """
+        cls._json_encoder = json.dumps if encoder is None else encoder
+
+    @classmethod
+    def encode_payload(cls, payload):
+        """ Return the payload in the form sent to the storage service, or None if it is not a valid JSON payload
+
+        A dict or list is serialized exactly once with the configured encoder, bytes are trusted to be already encoded
+        JSON and are passed through untouched; only a str payload is parsed to validate it.
+        """
+        if isinstance(payload, (dict, list)):
+            return cls._json_encoder(payload)
+        if isinstance(payload, (bytes, bytearray)):
+            return payload
+        if isinstance(payload, str) and cls.is_json(payload):
+            return payload
+        return None
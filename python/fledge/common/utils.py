@@ -87,6 +87,24 @@ def eprint(*args, **kwargs):
     print(*args, *kwargs, file=sys.stderr)
 
 
+def release_session(session):
+    """ Release an aiohttp client session bound to an event loop that is no longer the current one
+
+    The session cannot be awaited from the current loop, so it is detached and its connector closed at once, which
+    closes the pooled connections without an "Unclosed client session" warning.
+    """
+    if session is None or session.closed:
+        return
+    connector = session.connector
+    session.detach()
+    if connector is not None:
+        try:
+            connector.close()
+        except RuntimeError:
+            # The loop of the connections is already closed
+            pass
+
+
 def read_os_release():
     """ General information to identifying the operating system """
     import ast
@@ -71,13 +71,9 @@ async def auth_middleware(app, handler):
 
         if token:
             try:
-                # validate the token and get user id
-                uid = await User.Objects.validate_token(token)
-                # extend the token expiry, as token is valid
-                # and no bad token exception raised
-                await User.Objects.refresh_token_expiry(token)
-                # set the user to request object
-                request.user = await User.Objects.get(uid=uid)
+                # validate the token, extend its expiry and set the user to request object;
+                # verified tokens are cached for a short time
+                request.user = await User.Objects.get_user_for_token(token)
                 # set the token to request
                 request.token = token
                 # set if user is admin
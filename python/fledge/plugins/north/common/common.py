@@ -9,6 +9,7 @@
 """
 
 import asyncio
+import string
 
 from fledge.common.configuration_manager import ConfigurationManager
 
@@ -111,6 +112,85 @@ def evaluate_type(value):
     return evaluated_type
 
 
+_INTEGER_EXACT_LIMIT = 2 ** 53
+""" Integers up to this magnitude are exactly represented by a float, so evaluate_type sees them as integers """
+
+_NON_NUMERIC_FIRST_CHARS = frozenset(string.ascii_letters) - frozenset("iInN")
+""" A string starting with one of these chars cannot be converted by float(), i/n are kept for inf/nan """
+
+
+def _convert_integer(value):
+    """ Fast path of convert_to_type for an int value"""
+    if -_INTEGER_EXACT_LIMIT <= value <= _INTEGER_EXACT_LIMIT:
+        return value
+    return convert_to_type(value)
+
+
+def _convert_float(value):
+    """ Fast path of convert_to_type for a float value, nan and infinite are left to convert_to_type"""
+    if value - value == 0:
+        return value
+    return convert_to_type(value)
+
+
+def _convert_string(value):
+    """ Fast path of convert_to_type for a str value, it is parsed once instead of up to four times"""
+    if not value or value[0] in _NON_NUMERIC_FIRST_CHARS:
+        return value
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    if number - number != 0:
+        return convert_to_type(value)
+    integer = int(number)
+    return integer if str(integer) == value else number
+
+
+def _unchanged(value):
+    return value
+
+
+_TYPE_CONVERTERS = {
+    int: _convert_integer,
+    float: _convert_float,
+    str: _convert_string,
+    bool: float,
+    list: _unchanged,
+}
+""" convert_to_type specialised on the type of the value, other types fall back to convert_to_type """
+
+
+def convert_reading_types(reading):
+    """Converts in place the datapoints of a reading to the type in relation to their actual value,
+    for example "180.2" to float 180.2
+
+    The result is the same as calling convert_to_type on every top level datapoint and on the datapoints of the
+    dictionaries nested at the second level, but the conversion is selected on the type of the value
+    so that values that are already numbers are returned as they are.
+
+     Args:
+        reading : dictionary of the datapoints of a reading
+     Returns:
+         the reading with the converted values
+     Raises:
+         TypeError, OverflowError: as convert_to_type does, for example for None or infinite values
+     """
+
+    converters = _TYPE_CONVERTERS
+    for name, value in reading.items():
+        converter = converters.get(type(value))
+        if converter is not None:
+            reading[name] = converter(value)
+        elif isinstance(value, dict):
+            for nested_value in value.values():
+                if isinstance(nested_value, dict):
+                    convert_reading_types(nested_value)
+        else:
+            reading[name] = convert_to_type(value)
+    return reading
+
+
 def identify_unique_asset_codes(raw_data):
     """Identify unique asset codes in the data block
 
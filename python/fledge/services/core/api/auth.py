@@ -488,11 +488,12 @@ async def update_me(request):
             result = await storage_client.query_tbl_with_payload("user_logins", payload)
             if len(result['rows']) == 0:
                 raise User.DoesNotExist
-            payload = PayloadBuilder().SET(real_name=real_name.strip()).WHERE(['id', '=',
-                                                                               result['rows'][0]['user_id']]).payload()
+            user_id = result['rows'][0]['user_id']
+            payload = PayloadBuilder().SET(real_name=real_name.strip()).WHERE(['id', '=', user_id]).payload()
             message = "Something went wrong"
             try:
                 result = await storage_client.update_tbl("users", payload)
+                User.Objects.invalidate_user_cache(user_id)
                 if result['response'] == 'updated':
                     # TODO: FOGL-1226 At the moment only real name can update
                     message = "Real name has been updated successfully!"
@@ -679,6 +680,7 @@ async def enable_user(request):
                     raise User.DoesNotExist
                 payload = PayloadBuilder().SET(enabled=user_data['enabled']).WHERE(['id', '=', user_id]).payload()
                 result = await storage_client.update_tbl("users", payload)
+                User.Objects.invalidate_user_cache(user_id)
                 # Remove ott token for this enabled/disabled user.
                 __remove_ott_for_user(user_id)
                 if result['response'] == 'updated':
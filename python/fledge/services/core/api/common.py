@@ -9,7 +9,6 @@ import time
 import json
 import logging
 import socket
-import subprocess
 
 from aiohttp import web
 from functools import lru_cache
@@ -32,6 +31,15 @@ __start_time = time.time()
 
 _logger = logger.setup(__name__, level=logging.INFO)
 
+HOST_DETAILS_REFRESH_SECONDS = 60
+""" Seconds for which the host name and addresses reported by ping are reused """
+
+STATS_SNAPSHOT_SECONDS = 5
+""" Seconds for which the statistics reported by ping are reused """
+
+_host_details = {'expires': 0, 'name': None, 'addresses': [], 'pending': None}
+_stats_snapshot = {'expires': 0, 'values': None, 'pending': None}
+
 _help = """
     -------------------------------------------------------------------------------
     | GET             | /fledge/ping                                             |
@@ -73,13 +81,8 @@ async def ping(request):
 
     since_started = time.time() - __start_time
 
-    stats_request = request.clone(rel_url='fledge/statistics')
-    data_read, data_sent, data_purged = await get_stats(stats_request)
-
-    host_name = socket.gethostname()
-    # all addresses for the host
-    all_ip_addresses_cmd_res = subprocess.run(['hostname', '-I'], stdout=subprocess.PIPE)
-    ip_addresses = all_ip_addresses_cmd_res.stdout.decode('utf-8').replace("\n", "").strip().split(" ")
+    data_read, data_sent, data_purged = await _get_stats_snapshot(request)
+    host_name, ip_addresses = await _get_host_details()
 
     svc_name = server.Server._service_name
 
@@ -109,6 +112,61 @@ async def ping(request):
                               })
 
 
+async def _get_host_details():
+    """ Host name and all addresses of the host, resolved again every HOST_DETAILS_REFRESH_SECONDS
+
+    Concurrent pings with out of date details share a single resolution.
+    """
+    if _host_details['name'] is not None and time.monotonic() < _host_details['expires']:
+        return _host_details['name'], _host_details['addresses']
+    pending = _host_details['pending']
+    if pending is None:
+        pending = asyncio.ensure_future(_resolve_host_details())
+        pending.add_done_callback(_host_details_resolved)
+        _host_details['pending'] = pending
+    # A ping that goes away must not cancel the resolution the others are waiting for
+    return await asyncio.shield(pending)
+
+
+async def _resolve_host_details():
+    host_name = socket.gethostname()
+    # all addresses for the host
+    proc = await asyncio.create_subprocess_exec('hostname', '-I', stdout=asyncio.subprocess.PIPE)
+    stdout, _ = await proc.communicate()
+    ip_addresses = stdout.decode('utf-8').replace("\n", "").strip().split(" ")
+    return host_name, ip_addresses
+
+
+def _host_details_resolved(pending):
+    _host_details['pending'] = None
+    if not pending.cancelled() and pending.exception() is None:
+        _host_details['name'], _host_details['addresses'] = pending.result()
+        _host_details['expires'] = time.monotonic() + HOST_DETAILS_REFRESH_SECONDS
+
+
+async def _get_stats_snapshot(request):
+    """ data_read, data_sent and data_purged, read from storage at most once every STATS_SNAPSHOT_SECONDS
+
+    Concurrent pings with an out of date snapshot share a single read.
+    """
+    if _stats_snapshot['values'] is not None and time.monotonic() < _stats_snapshot['expires']:
+        return _stats_snapshot['values']
+    pending = _stats_snapshot['pending']
+    if pending is None:
+        pending = asyncio.ensure_future(get_stats(request.clone(rel_url='fledge/statistics')))
+        pending.add_done_callback(_stats_snapshot_read)
+        _stats_snapshot['pending'] = pending
+    # A ping that goes away must not cancel the read the others are waiting for
+    return await asyncio.shield(pending)
+
+
+def _stats_snapshot_read(pending):
+    _stats_snapshot['pending'] = None
+    if not pending.cancelled() and pending.exception() is None:
+        _stats_snapshot['values'] = pending.result()
+        _stats_snapshot['expires'] = time.monotonic() + STATS_SNAPSHOT_SECONDS
+
+
 async def get_stats(req):
     """
     :param req: a clone of 'fledge/statistics' endpoint request
@@ -471,6 +471,7 @@ async def _delete_configuration_category(storage: StorageClientAsync, key: str)
     config_mgr = ConfigurationManager(storage)
     config_mgr.delete_category_related_things(key)
     config_mgr._cacheManager.remove(key)
+    config_mgr._invalidate_category_tree()
 
 
 def _diff(lst1: List[str], lst2: List[str]) -> List[str]:
@@ -22,6 +22,7 @@ _help = """
     ----------------------------------------------------------
     | GET            | /fledge/health/storage               |
     | GET            | /fledge/health/logging               |
+    | GET            | /fledge/health/cache                 |
     ----------------------------------------------------------
 """
 _LOGGER = logger.setup(__name__, level=logging.INFO)
@@ -213,3 +214,35 @@ async def get_storage_health(request: web.Request) -> web.Response:
         raise web.HTTPInternalServerError(reason=msg, body=json.dumps({"message": msg}))
     else:
         return web.json_response(response)
+
+
+async def get_cache_health(request: web.Request) -> web.Response:
+    """
+     Return the usage and counters of the caches of the core.
+    Args:
+       request: None
+
+    Returns:
+           Return the usage and counters of the caches of the core.
+           Sample Response :
+
+           {
+              "configuration": {
+                "size": 128,
+                "maxSize": 512,
+                "bytes": 402311,
+                "maxBytes": 16777216,
+                "hit": 10391,
+                "miss": 140,
+                "evictions": 0
+              }
+           }
+
+    :Example:
+           curl -X GET http://localhost:8081/fledge/health/cache
+    """
+    from fledge.common.configuration_manager import ConfigurationManager
+    from fledge.services.core import connect
+
+    cf_mgr = ConfigurationManager(connect.get_storage_async())
+    return web.json_response({"configuration": cf_mgr._cacheManager.stats()})
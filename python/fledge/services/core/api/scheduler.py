@@ -398,17 +398,59 @@ async def get_schedule(request):
         raise web.HTTPNotFound(reason=str(ex))
 
 
+async def _bulk_schedule_ids(data):
+    """ Returns the schedule ids named by the schedule_ids and schedule_names lists of a bulk request """
+    sch_ids = data.get('schedule_ids', [])
+    sch_names = data.get('schedule_names', [])
+    if not isinstance(sch_ids, list) or not isinstance(sch_names, list):
+        raise web.HTTPBadRequest(reason='schedule_ids and schedule_names must be lists')
+    if not sch_ids and not sch_names:
+        raise web.HTTPBadRequest(reason='Schedule names or IDs are required')
+
+    schedule_ids = []
+    for sch_id in sch_ids:
+        try:
+            schedule_ids.append(uuid.UUID(sch_id))
+        except (TypeError, ValueError, AttributeError):
+            raise web.HTTPNotFound(reason="No Schedule with ID {}".format(sch_id))
+
+    if sch_names:
+        storage_client = connect.get_storage_async()
+        payload = PayloadBuilder().SELECT("id", "schedule_name").WHERE(['schedule_name', 'in', sch_names]).payload()
+        result = await storage_client.query_tbl_with_payload('schedules', payload)
+        ids_by_name = {row['schedule_name']: row['id'] for row in result['rows']}
+        for sch_name in sch_names:
+            if sch_name not in ids_by_name:
+                raise web.HTTPNotFound(reason="No Schedule with name {}".format(sch_name))
+            schedule_ids.append(uuid.UUID(ids_by_name[sch_name]))
+    return schedule_ids
+
+
+def _bulk_response(result):
+    return web.json_response({'schedules': [{'scheduleId': str(sch_id), 'status': status, 'message': reason}
+                                            for sch_id, (status, reason) in result.items()]})
+
+
 async def enable_schedule_with_name(request):
     """ Enables the schedule for given schedule_name or schedule_id in request payload
 
     curl -X PUT http://localhost:8081/fledge/schedule/enable  -d '{"schedule_name": "a schedule name"}'
 
+    Several schedules are enabled at once with a list of names and/or IDs
+    curl -X PUT http://localhost:8081/fledge/schedule/enable  -d '{"schedule_names": ["sine", "random"]}'
+
     :param request: {"schedule_name": "sinusoid"} or {"schedule_id": "uuid of schedule"}
+                    or {"schedule_names": [...], "schedule_ids": [...]}
     :return:
     """
     try:
         data = await request.json()
 
+        if 'schedule_ids' in data or 'schedule_names' in data:
+            schedule_ids = await _bulk_schedule_ids(data)
+            result = await server.Server.scheduler.enable_schedules(schedule_ids)
+            return _bulk_response(result)
+
         sch_name = data.get('schedule_name', None)
         sch_id = data.get('schedule_id', None)
 
@@ -450,12 +492,21 @@ async def disable_schedule_with_name(request):
 
     curl -X PUT http://localhost:8081/fledge/schedule/disable -d '{"schedule_name": "a schedule name"}'
 
+    Several schedules are disabled at once with a list of names and/or IDs
+    curl -X PUT http://localhost:8081/fledge/schedule/disable -d '{"schedule_names": ["sine", "random"]}'
+
     :param request: {"schedule_name": "sinusoid"} or {"schedule_id": "uuid of schedule"}
+                    or {"schedule_names": [...], "schedule_ids": [...]}
     :return:
     """
     try:
         data = await request.json()
 
+        if 'schedule_ids' in data or 'schedule_names' in data:
+            schedule_ids = await _bulk_schedule_ids(data)
+            result = await server.Server.scheduler.disable_schedules(schedule_ids)
+            return _bulk_response(result)
+
         sch_name = data.get('schedule_name', None)
         sch_id = data.get('schedule_id', None)
 
@@ -3,11 +3,19 @@
 # FLEDGE_BEGIN
 # See: http://fledge-iot.readthedocs.io/
 # FLEDGE_END
+import asyncio
+import collections
 import datetime
+import itertools
+import json
+import math
+import time
 from aiohttp import web
 
 from fledge.common.storage_client.payload_builder import PayloadBuilder
 from fledge.services.core import connect
+from fledge.services.core import server
+from fledge.services.core.scheduler.exceptions import NotReadyError
 from fledge.services.core.scheduler.scheduler import Scheduler
 
 __author__ = "Amarendra K. Sinha, Ashish Jabble"
@@ -23,6 +31,128 @@ _help = """
     ------------------------------------------------------------------------------
 """
 
+_STATS_COLLECTOR_PROCESS = 'stats collector'
+
+_HISTORY_AGGREGATES = ('sum', 'avg', 'max')
+""" Aggregates of the statistics in a time bucket of a downsampled history """
+
+_HISTORY_CHUNK_POINTS = 1000
+""" Statistics history points sent in a chunk of the response """
+
+_RECENT_HISTORY_SECONDS = 3600
+""" Span of statistics history kept in memory to compute rates """
+
+
+class _RecentHistory:
+    """ Per key ring buffer of the most recent statistics_history (history_ts, value) pairs
+
+    Rates are averaged over the values of a key whose history_ts falls within the period, as the statistics_history
+    query with a 'newer' condition does, so that a stalled or disabled stats collector gives a rate of 0.
+    Rows written since the previous refresh are fetched by id, in a single query for all the keys.
+    """
+
+    def __init__(self):
+        self._rows = {}
+        """ key -> deque of the most recent (history_ts in seconds since the epoch, value) pairs """
+        self._interval = None
+        self._capacity = 0
+        self._last_id = None
+        self._refreshed_at = 0
+        self._lock = None
+        self._lock_loop = None
+
+    def reset(self):
+        self._rows = {}
+        self._interval = None
+        self._capacity = 0
+        self._last_id = None
+        self._refreshed_at = 0
+
+    @staticmethod
+    def covers(period):
+        return period * 60 <= _RECENT_HISTORY_SECONDS
+
+    @staticmethod
+    def _timestamp(history_ts):
+        """ Seconds since the epoch of a history_ts formatted as YYYY-MM-DD HH24:MI:SS.MS in local time """
+        fmt = '%Y-%m-%d %H:%M:%S.%f' if '.' in history_ts else '%Y-%m-%d %H:%M:%S'
+        return datetime.datetime.strptime(history_ts, fmt).timestamp()
+
+    def _get_lock(self):
+        # Created on first use, as on Python < 3.10 a lock is bound to the event loop current at its creation
+        loop = asyncio.get_event_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def refresh(self, storage_client, interval):
+        async with self._get_lock():
+            now = time.monotonic()
+            if interval != self._interval or now - self._refreshed_at > _RECENT_HISTORY_SECONDS:
+                # First use, a new stats collector interval or a ring too old to catch up with by id
+                self.reset()
+                self._interval = interval
+                # Room for an hour of history at the schedule interval, with some slack for late runs
+                self._capacity = math.ceil(_RECENT_HISTORY_SECONDS / interval) * 2
+                where = ['history_ts', 'newer', _RECENT_HISTORY_SECONDS]
+            else:
+                where = ['id', '>', self._last_id]
+            payload = PayloadBuilder().SELECT(("id", "key", "value", "history_ts")) \
+                .ALIAS("return", ("history_ts", "history_ts")) \
+                .FORMAT("return", ("history_ts", "YYYY-MM-DD HH24:MI:SS.MS")) \
+                .WHERE(where).ORDER_BY(["id", "asc"]).payload()
+            result = await storage_client.query_tbl_with_payload('statistics_history', payload)
+            for row in result['rows']:
+                try:
+                    values = self._rows[row['key']]
+                except KeyError:
+                    values = self._rows[row['key']] = collections.deque(maxlen=self._capacity)
+                values.append((self._timestamp(row['history_ts']), int(row['value'])))
+            if result['rows']:
+                self._last_id = result['rows'][-1]['id']
+            elif self._last_id is None:
+                self._last_id = 0
+            self._refreshed_at = now
+
+    def rate(self, key, period):
+        """ Average per minute of the values of key written in the last period minutes """
+        values = self._rows.get(key)
+        if not values:
+            return 0
+        since = time.time() - period * 60
+        in_period = [value for _, value in itertools.takewhile(lambda row: row[0] > since, reversed(values))]
+        if not in_period:
+            return 0
+        return (sum(in_period) / len(in_period)) * (60 / self._interval)
+
+
+_recent_history = _RecentHistory()
+
+
+async def _get_stats_collector_interval(storage_client):
+    """ Schedule interval of the stats collector in seconds
+
+    Taken from the scheduler of the core, the schedules table is only read before the scheduler is ready.
+    """
+    try:
+        schedules = await server.Server.scheduler.get_schedules()
+    except (AttributeError, NotReadyError):
+        scheduler_payload = PayloadBuilder().SELECT("schedule_interval").WHERE(
+            ['process_name', '=', _STATS_COLLECTOR_PROCESS]).payload()
+        result = await storage_client.query_tbl_with_payload('schedules', scheduler_payload)
+        if len(result['rows']) > 0:
+            scheduler = Scheduler()
+            interval_days, interval_dt = scheduler.extract_day_time_from_interval(
+                result['rows'][0]['schedule_interval'])
+            return datetime.timedelta(days=interval_days, hours=interval_dt.hour, minutes=interval_dt.minute,
+                                      seconds=interval_dt.second).total_seconds()
+    else:
+        for schedule in schedules:
+            if schedule.process_name == _STATS_COLLECTOR_PROCESS and schedule.repeat:
+                return schedule.repeat.total_seconds()
+    raise web.HTTPNotFound(reason="No stats collector schedule found")
+
 
 #################################
 #  Statistics
@@ -46,6 +176,36 @@ async def get_statistics(request):
     return web.json_response(result['rows'])
 
 
+def _pivot_statistics_history(rows):
+    """ Pivot (history_ts, key, value) rows into one dict per history_ts in a single pass """
+    by_ts = {}
+    for row in rows:
+        ts = row['history_ts']
+        try:
+            by_ts[ts][row['key']] = row['value']
+        except KeyError:
+            by_ts[ts] = {'history_ts': ts, row['key']: row['value']}
+    # An empty history is reported as a single empty set of statistics
+    return list(by_ts.values()) or [{}]
+
+
+async def _stream_statistics_history(request, interval, statistics):
+    """ Send the statistics history as chunked JSON, a block of points at a time """
+    response = web.StreamResponse()
+    # As web.json_response sends it
+    response.content_type = 'application/json'
+    response.charset = 'utf-8'
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    await response.write('{{"interval": {}, "statistics": ['.format(json.dumps(interval)).encode())
+    for start in range(0, len(statistics), _HISTORY_CHUNK_POINTS):
+        chunk = ', '.join(json.dumps(point) for point in statistics[start:start + _HISTORY_CHUNK_POINTS])
+        await response.write(((', ' if start else '') + chunk).encode())
+    await response.write(b']}')
+    await response.write_eof()
+    return response
+
+
 async def get_statistics_history(request):
     """
     Args:
@@ -58,22 +218,17 @@ async def get_statistics_history(request):
             curl -X GET http://localhost:8081/fledge/statistics/history?limit=1
             curl -X GET http://localhost:8081/fledge/statistics/history?key=READINGS
             curl -X GET http://localhost:8081/fledge/statistics/history?key=READINGS,PURGED,UNSENT&minutes=60
+            curl -X GET http://localhost:8081/fledge/statistics/history?key=READINGS&days=30&maxPoints=500
+            curl -X GET http://localhost:8081/fledge/statistics/history?key=READINGS&hours=12&resolution=600&aggregate=max
+
+    resolution (seconds) or maxPoints (points per statistic over the requested minutes, hours or days) aggregate the
+    history in time buckets in the storage service, with the sum (default), avg or max of each statistic in the bucket.
+    The interval of the response is then the bucket size.
     """
     storage_client = connect.get_storage_async()
     # To find the interval in secs from stats collector schedule
-    scheduler_payload = PayloadBuilder().SELECT("schedule_interval").WHERE(
-        ['process_name', '=', 'stats collector']).payload()
-    result = await storage_client.query_tbl_with_payload('schedules', scheduler_payload)
-    if len(result['rows']) > 0:
-        scheduler = Scheduler()
-        interval_days, interval_dt = scheduler.extract_day_time_from_interval(result['rows'][0]['schedule_interval'])
-        interval = datetime.timedelta(days=interval_days, hours=interval_dt.hour, minutes=interval_dt.minute, seconds=interval_dt.second)
-        interval_in_secs = interval.total_seconds()
-    else:
-        raise web.HTTPNotFound(reason="No stats collector schedule found")
-    stats_history_chain_payload = PayloadBuilder().SELECT(("history_ts", "key", "value"))\
-        .ALIAS("return", ("history_ts", 'history_ts')).FORMAT("return", ("history_ts", "YYYY-MM-DD HH24:MI:SS.MS"))\
-        .ORDER_BY(['history_ts', 'desc']).WHERE(['1', '=', 1]).chain_payload()
+    interval_in_secs = await _get_stats_collector_interval(storage_client)
+    stats_history_chain_payload = PayloadBuilder().WHERE(['1', '=', 1]).chain_payload()
 
     if 'key' in request.query:
         key = request.query['key']
@@ -101,6 +256,11 @@ async def get_statistics_history(request):
     except ValueError:
         raise web.HTTPBadRequest(reason="Time unit must be a positive integer")
 
+    bucket_size = _history_bucket_size(request.query, val, interval_in_secs)
+    aggregate = request.query.get('aggregate', 'sum')
+    if aggregate not in _HISTORY_AGGREGATES:
+        raise web.HTTPBadRequest(reason="aggregate must be one of {}".format(', '.join(_HISTORY_AGGREGATES)))
+
     if 'limit' in request.query and request.query['limit'] != '':
         try:
             limit = int(request.query['limit'])
@@ -124,31 +284,50 @@ async def get_statistics_history(request):
         except ValueError:
             raise web.HTTPBadRequest(reason="Limit must be a positive integer")
 
-    stats_history_payload = PayloadBuilder(stats_history_chain_payload).payload()
+    if bucket_size is None:
+        stats_history_payload = PayloadBuilder(stats_history_chain_payload).SELECT(("history_ts", "key", "value"))\
+            .ALIAS("return", ("history_ts", 'history_ts')).FORMAT("return", ("history_ts", "YYYY-MM-DD HH24:MI:SS.MS"))\
+            .ORDER_BY(['history_ts', 'desc']).payload()
+    else:
+        # Time buckets are sorted latest first by the storage service, sort can not be used along with them
+        stats_history_payload = PayloadBuilder(stats_history_chain_payload).AGGREGATE([aggregate, "value"])\
+            .ALIAS("aggregate", ("value", aggregate, "value")).GROUP_BY("key")\
+            .TIMEBUCKET("history_ts", str(bucket_size), "YYYY-MM-DD HH24:MI:SS", "history_ts").payload()
+        interval_in_secs = bucket_size
     result_from_storage = await storage_client.query_tbl_with_payload('statistics_history', stats_history_payload)
-    group_dict = []
-    for row in result_from_storage['rows']:
-        new_dict = {'history_ts': row['history_ts'], row['key']: row['value']}
-        group_dict.append(new_dict)
-
-    results = []
-    temp_dict = {}
-    previous_ts = None
-    for row in group_dict:
-        # first time or when history_ts changes
-        if previous_ts is None or previous_ts != row['history_ts']:
-            if previous_ts is not None:
-                results.append(temp_dict)
-            previous_ts = row['history_ts']
-            temp_dict = {'history_ts': previous_ts}
-
-        # Append statistics key to temp dict
-        for key, value in row.items():
-            temp_dict.update({key: value})
-
-    # Append the last set of records which do not get appended above
-    results.append(temp_dict)
-    return web.json_response({"interval": interval_in_secs, 'statistics': results})
+    return await _stream_statistics_history(request, interval_in_secs,
+                                            _pivot_statistics_history(result_from_storage['rows']))
+
+
+def _history_bucket_size(query, period, interval):
+    """ Time bucket size in seconds for a downsampled statistics history, None for the raw history
+
+    Args:
+        query: request parameters
+        period: seconds of history requested, 0 for the whole history
+        interval: stats collector interval in seconds
+    """
+    try:
+        if 'resolution' in query and query['resolution'] != '':
+            resolution = int(query['resolution'])
+            if resolution <= 0:
+                raise ValueError
+            return resolution
+    except ValueError:
+        raise web.HTTPBadRequest(reason="resolution must be a positive integer")
+    try:
+        if 'maxPoints' in query and query['maxPoints'] != '':
+            max_points = int(query['maxPoints'])
+            if max_points <= 0:
+                raise ValueError
+        else:
+            return None
+    except ValueError:
+        raise web.HTTPBadRequest(reason="maxPoints must be a positive integer")
+    if period == 0:
+        raise web.HTTPBadRequest(reason="maxPoints requires the minutes, hours or days of history to return")
+    # No bucket smaller than the interval at which the history is written
+    return max(math.ceil(period / max_points), math.ceil(interval))
 
 
 async def get_statistics_rate(request: web.Request) -> web.Response:
@@ -162,10 +341,11 @@ async def get_statistics_rate(request: web.Request) -> web.Response:
 
       Implementation:
           Calculation via: (sum(value) / count(value)) * 60 / (<statistic history interval>)
-          Queries for above example:
-          select key, 4 * (sum(value) / count(value)) from statistics_history where history_ts >= datetime('now', '-1 Minute') and key in ("SINUSOID", "FASTSINUSOID", "READINGS" ) group by key;
-          select key, 4 * (sum(value) / count(value)) from statistics_history where history_ts >= datetime('now', '-5 Minute') and key in ("SINUSOID", "FASTSINUSOID", "READINGS" ) group by key;
-          select key, 4 * (sum(value) / count(value)) from statistics_history where history_ts >= datetime('now', '-15 Minute') and key in ("SINUSOID", "FASTSINUSOID", "READINGS" ) group by key;
+          Periods up to an hour are computed from the recent statistics history kept in memory, which is brought
+          up to date with the rows written since the previous call:
+          select id, key, value from statistics_history where id > <last id> order by id;
+          Longer periods use one grouped query each, for all the statistics:
+          select key, sum(value), count(value) from statistics_history where history_ts >= datetime('now', '-1440 Minute') and key in ("SINUSOID", "FASTSINUSOID", "READINGS") group by key;
       """
     params = request.query
     if 'periods' not in params:
@@ -191,39 +371,20 @@ async def get_statistics_rate(request: web.Request) -> web.Response:
     stats = params['statistics']
     stat_split_list = list(filter(None, [x for x in stats.split(',')]))
     storage_client = connect.get_storage_async()
-    # To find the interval in secs from stats collector schedule
-    scheduler_payload = PayloadBuilder().SELECT("schedule_interval").WHERE(
-        ['process_name', '=', 'stats collector']).payload()
-    result = await storage_client.query_tbl_with_payload('schedules', scheduler_payload)
-    if len(result['rows']) > 0:
-        scheduler = Scheduler()
-        interval_days, interval_dt = scheduler.extract_day_time_from_interval(result['rows'][0]['schedule_interval'])
-        interval_in_secs = datetime.timedelta(days=interval_days, hours=interval_dt.hour, minutes=interval_dt.minute,
-                                              seconds=interval_dt.second).total_seconds()
-    else:
-        raise web.HTTPNotFound(reason="No stats collector schedule found")
-    ts = datetime.datetime.now().timestamp()
-    resp = []
-    for x, y in [(x, y) for x in period_split_list for y in stat_split_list]:
-        time_diff = ts - int(x)
-        # TODO: FOGL-4102
-        # For example:
-        # time_diff = 1590066814.037321
-        # ERROR: PostgreSQL storage plugin raising error: ERROR:  invalid input syntax for type timestamp with time zone: "1590066814.037321"
-        # "where": {"column": "history_ts", "condition": ">=", "value": "1590066814.037321"} - Payload works with sqlite engine BUT not with postgres
-        # To overcome above problem on postgres - I have used "dt = 2020-05-21 13:13:34" - but I see some deviations in results for both engines when we use datetime format
+    interval_in_secs = await _get_stats_collector_interval(storage_client)
+    await _recent_history.refresh(storage_client, interval_in_secs)
+    rate_dict = {stat: {} for stat in stat_split_list}
+    for period in period_split_list:
+        if _recent_history.covers(int(period)):
+            for stat in stat_split_list:
+                rate_dict[stat][period] = _recent_history.rate(stat, int(period))
+            continue
         _payload = PayloadBuilder().SELECT("key").AGGREGATE(["sum", "value"]).AGGREGATE(["count", "value"]).WHERE(
-            ['history_ts', '>=', str(time_diff)]).AND_WHERE(['key', '=', y]).chain_payload()
+            ['history_ts', 'newer', int(period) * 60]).AND_WHERE(['key', 'in', stat_split_list]).chain_payload()
         stats_rate_payload = PayloadBuilder(_payload).GROUP_BY("key").payload()
         result = await storage_client.query_tbl_with_payload("statistics_history", stats_rate_payload)
-        temp_dict = {y: {x: 0}}
-        if result['rows']:
-            calculated_formula_str = (int(result['rows'][0]['sum_value']) / int(result['rows'][0]['count_value'])
-                                      ) * (60 / int(interval_in_secs))
-            temp_dict = {y: {x: calculated_formula_str}}
-        resp.append(temp_dict)
-    rate_dict = {}
-    for d in resp:
-        for k, v in d.items():
-            rate_dict[k] = {**rate_dict[k], **v} if k in rate_dict else v
+        rates = {row['key']: (int(row['sum_value']) / int(row['count_value'])) * (60 / int(interval_in_secs))
+                 for row in result['rows']}
+        for stat in stat_split_list:
+            rate_dict[stat][period] = rates.get(stat, 0)
     return web.json_response({"rates": rate_dict})
@@ -19,13 +19,23 @@ __version__ = "${VERSION}"
 _logger = logger.setup(__name__)
 
 
+_storage = None
+""" StorageClientAsync shared by all core callers, so that they share its pooled connections """
+
+_readings = None
+""" ReadingsStorageClientAsync shared by all core callers """
+
+
 # TODO: Needs refactoring or better way to allow global discovery in core process
 def get_storage_async():
     """ Storage Object """
+    global _storage
     try:
         services = ServiceRegistry.get(name="Fledge Storage")
         storage_svc = services[0]
-        _storage = StorageClientAsync(core_management_host=None, core_management_port=None,
+        # Re-create the client only when the storage service (re)registered with a different record
+        if _storage is None or _storage.service is not storage_svc:
+            _storage = StorageClientAsync(core_management_host=None, core_management_port=None,
                                  svc=storage_svc)
         # _logger.info(type(_storage))
     except Exception as ex:
@@ -36,13 +46,23 @@ def get_storage_async():
 # TODO: Needs refactoring or better way to allow global discovery in core process
 def get_readings_async():
     """ Storage Object """
+    global _readings
     try:
         services = ServiceRegistry.get(name="Fledge Storage")
         storage_svc = services[0]
-        _readings = ReadingsStorageClientAsync(core_mgt_host=None, core_mgt_port=None,
+        if _readings is None or _readings.service is not storage_svc:
+            _readings = ReadingsStorageClientAsync(core_mgt_host=None, core_mgt_port=None,
                                  svc=storage_svc)
         # _logger.info(type(_storage))
     except Exception as ex:
         _logger.exception(str(ex))
         raise
     return _readings
+
+
+async def close_storage_sessions():
+    """ Release the pooled connections of the shared storage clients """
+    if _storage is not None:
+        await _storage.close_session()
+    if _readings is not None:
+        await _readings.close_session()
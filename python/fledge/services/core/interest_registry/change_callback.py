@@ -15,6 +15,7 @@ from fledge.services.core.service_registry import exceptions as service_registry
 from fledge.services.core.interest_registry.interest_registry import InterestRegistry
 from fledge.services.core.interest_registry import exceptions as interest_registry_exceptions
 from fledge.common import logger
+from fledge.common.utils import release_session
 
 __copyright__ = "Copyright (c) 2017 OSIsoft, LLC"
 __license__ = "Apache 2.0"
@@ -22,16 +23,119 @@ __version__ = "${VERSION}"
 
 _LOGGER = logger.setup(__name__)
 
+_NOTIFY_TIMEOUT = 30
+""" Seconds allowed to each microservice to acknowledge a notification """
+
+_MAX_CONCURRENT_NOTIFICATIONS = 16
+""" Maximum number of notifications in flight at any time """
+
+_HEADERS = {'content-type': 'application/json'}
+
+_session = None
+_session_loop = None
+_semaphore = None
+
+_notifying = set()
+""" Categories whose change is being notified """
+
+_changed = set()
+""" Categories changed again while their previous change was being notified """
+
+
+def _get_session():
+    """ Return the client session and semaphore shared by all notifications, creating them on first use
+
+    The session keeps a keep-alive connection pool towards the microservices management APIs; it is re-created if it
+    was closed or if it is used from a different event loop than the one it was bound to, in which case the previous
+    session is released first.
+    """
+    global _session, _session_loop, _semaphore
+    loop = asyncio.get_event_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        release_session(_session)
+        _session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=_NOTIFY_TIMEOUT))
+        _session_loop = loop
+        _semaphore = asyncio.Semaphore(_MAX_CONCURRENT_NOTIFICATIONS)
+    return _session, _semaphore
+
+
+async def close_session():
+    """ Close the shared client session; to be awaited when the core stops """
+    global _session, _session_loop, _semaphore
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+    _semaphore = None
+
+
+async def _notify_microservice(session, semaphore, method, microservice_uuid, entry_point, data):
+    # get microservice management server info of microservice through service registry
+    try:
+        service_record = ServiceRegistry.get(idx=microservice_uuid)[0]
+    except service_registry_exceptions.DoesNotExist:
+        _LOGGER.exception("Unable to notify microservice with uuid %s as it is not found in the service registry",
+                          microservice_uuid)
+        return
+    url = "{}://{}:{}/fledge/{}".format(service_record._protocol, service_record._address,
+                                        service_record._management_port, entry_point)
+    async with semaphore:
+        try:
+            async with getattr(session, method)(url, data=data, headers=_HEADERS) as resp:
+                await resp.text()
+                status_code = resp.status
+                if status_code in range(400, 500):
+                    _LOGGER.error("Bad request error code: %d, reason: %s", status_code, resp.reason)
+                if status_code in range(500, 600):
+                    _LOGGER.error("Server error code: %d, reason: %s", status_code, resp.reason)
+        except asyncio.TimeoutError:
+            _LOGGER.error("Unable to notify microservice with uuid %s as it did not respond within %s seconds",
+                          microservice_uuid, _NOTIFY_TIMEOUT)
+        except Exception as ex:
+            _LOGGER.exception("Unable to notify microservice with uuid %s due to exception: %s", microservice_uuid,
+                              str(ex))
+
+
+async def _notify(method, entry_point, notifications):
+    """ Send notifications concurrently, at most _MAX_CONCURRENT_NOTIFICATIONS at a time
+
+    Args:
+        method (str): HTTP method of the entry point
+        entry_point (str): management API entry point, relative to /fledge/
+        notifications (list): tuples (interest record, payload dict)
+    """
+    session, semaphore = _get_session()
+    await asyncio.gather(*[_notify_microservice(session, semaphore, method, i._microservice_uuid, entry_point,
+                                                json.dumps(payload, sort_keys=True))
+                           for i, payload in notifications])
+
 
 async def run(category_name):
     """ Callback run by configuration category to notify changes to interested microservices
 
-    Note: this method is async as needed
+    Note: this method is async as needed. If the category changes again while a change is being notified, the
+    changes are coalesced: the category is read again once the current notifications are done and only its latest
+    state is sent.
 
     Args:
         configuration_name (str): name of category that was changed
     """
+    if category_name in _notifying:
+        _changed.add(category_name)
+        return
+    _notifying.add(category_name)
+    try:
+        while True:
+            _changed.discard(category_name)
+            await _run_change(category_name)
+            if category_name not in _changed:
+                break
+    finally:
+        _notifying.discard(category_name)
+        _changed.discard(category_name)
+
 
+async def _run_change(category_name):
     # get all interest records regarding category_name
     cfg_mgr = ConfigurationManager()
     interest_registry = InterestRegistry(cfg_mgr)
@@ -41,31 +145,10 @@ async def run(category_name):
         return
 
     category_value = await cfg_mgr.get_category_all_items(category_name)
-    payload = {"category" : category_name, "items" : category_value}
-    headers = {'content-type': 'application/json'}
+    payload = {"category": category_name, "items": category_value}
 
     # for each microservice interested in category_name, notify change
-    for i in interest_records:
-        # get microservice management server info of microservice through service registry
-        try: 
-            service_record = ServiceRegistry.get(idx=i._microservice_uuid)[0]
-        except service_registry_exceptions.DoesNotExist:
-            _LOGGER.exception("Unable to notify microservice with uuid %s as it is not found in the service registry", i._microservice_uuid)
-            continue
-        url = "{}://{}:{}/fledge/change".format(service_record._protocol, service_record._address, service_record._management_port)
-
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, data=json.dumps(payload, sort_keys=True), headers=headers) as resp:
-                    result = await resp.text()
-                    status_code = resp.status
-                    if status_code in range(400, 500):
-                        _LOGGER.error("Bad request error code: %d, reason: %s", status_code, resp.reason)
-                    if status_code in range(500, 600):
-                        _LOGGER.error("Server error code: %d, reason: %s", status_code, resp.reason)
-            except Exception as ex:
-                _LOGGER.exception("Unable to notify microservice with uuid %s due to exception: %s", i._microservice_uuid, str(ex))
-                continue
+    await _notify('post', 'change', [(i, payload) for i in interest_records])
 
 
 async def run_child_create(parent_category_name, child_category_list):
@@ -84,34 +167,15 @@ async def run_child_create(parent_category_name, child_category_list):
     except interest_registry_exceptions.DoesNotExist:
         return
 
+    notifications = []
     for child_category in child_category_list:
-
         category_value = await cfg_mgr.get_category_all_items(child_category)
-        payload = {"parent_category" : parent_category_name, "category" : child_category, "items" : category_value}
-        headers = {'content-type': 'application/json'}
-
-        # for each microservice interested in category_name, notify change
-        for i in interest_records:
-            # get microservice management server info of microservice through service registry
-            try:
-                service_record = ServiceRegistry.get(idx=i._microservice_uuid)[0]
-            except service_registry_exceptions.DoesNotExist:
-                _LOGGER.exception("Unable to notify microservice with uuid %s as it is not found in the service registry", i._microservice_uuid)
-                continue
-            url = "{}://{}:{}/fledge/child_create".format(service_record._protocol, service_record._address, service_record._management_port)
-
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.post(url, data=json.dumps(payload, sort_keys=True), headers=headers) as resp:
-                        result = await resp.text()
-                        status_code = resp.status
-                        if status_code in range(400, 500):
-                            _LOGGER.error("Bad request error code: %d, reason: %s", status_code, resp.reason)
-                        if status_code in range(500, 600):
-                            _LOGGER.error("Server error code: %d, reason: %s", status_code, resp.reason)
-                except Exception as ex:
-                    _LOGGER.exception("Unable to notify microservice with uuid %s due to exception: %s", i._microservice_uuid, str(ex))
-                    continue
+        payload = {"parent_category": parent_category_name, "category": child_category, "items": category_value}
+        notifications.extend((i, payload) for i in interest_records)
+
+    # for each microservice interested in category_name, notify change
+    await _notify('post', 'child_create', notifications)
+
 
 async def run_child_delete(parent_category_name, child_category):
     """ Call the child_delete Management API
@@ -130,32 +194,11 @@ async def run_child_delete(parent_category_name, child_category):
         return
 
     category_value = await cfg_mgr.get_category_all_items(child_category)
-    payload = {"parent_category" : parent_category_name, "category" : child_category, "items" : category_value}
-    headers = {'content-type': 'application/json'}
+    payload = {"parent_category": parent_category_name, "category": child_category, "items": category_value}
 
     # for each microservice interested in category_name, notify change
-    for i in interest_records:
-        # get microservice management server info of microservice through service registry
-        try:
-            service_record = ServiceRegistry.get(idx=i._microservice_uuid)[0]
-        except service_registry_exceptions.DoesNotExist:
-            _LOGGER.exception("Unable to notify microservice with uuid %s as it is not found in the service registry", i._microservice_uuid)
-            continue
-
-        url = "{}://{}:{}/fledge/child_delete".format(service_record._protocol, service_record._address, service_record._management_port)
-
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.delete(url, data=json.dumps(payload, sort_keys=True), headers=headers) as resp:
-                    result = await resp.text()
-                    status_code = resp.status
-                    if status_code in range(400, 500):
-                        _LOGGER.error("Bad request error code: %d, reason: %s", status_code, resp.reason)
-                    if status_code in range(500, 600):
-                        _LOGGER.error("Server error code: %d, reason: %s", status_code, resp.reason)
-            except Exception as ex:
-                _LOGGER.exception("Unable to notify microservice with uuid %s due to exception: %s", i._microservice_uuid, str(ex))
-                continue
+    await _notify('delete', 'child_delete', [(i, payload) for i in interest_records])
+
 
 async def run_child(parent_category_name, child_category_list, operation):
     """ Callback run by configuration category to notify changes to interested microservices
@@ -40,6 +40,15 @@ class InterestRegistry(InterestRegistrySingleton):
     _registered_interests = None
     """ maintains the list of InterestRecord objects """
 
+    _INDEXED_ATTRIBUTES = ('_registration_id', '_microservice_uuid', '_category_name')
+    """ attributes of InterestRecord that are indexed, the most selective first """
+
+    _indexes = None
+    """ attribute value to the list of InterestRecord objects with that value, in registration order """
+
+    _indexed_interests = None
+    _indexed_count = 0
+
     _configuration_manager = None
     """ ConfigurationManager used by InterestRegistry """
 
@@ -58,12 +67,34 @@ class InterestRegistry(InterestRegistrySingleton):
             self._configuration_manager = configuration_manager
         if self._registered_interests is None:
             self._registered_interests = list()
-    
+
+    def _index_interest(self, indexes, interest_record):
+        for attribute in self._INDEXED_ATTRIBUTES:
+            indexes[attribute].setdefault(getattr(interest_record, attribute), []).append(interest_record)
+
+    def _get_indexes(self):
+        """ Returns the indexes of the registered interests, rebuilt if the list has been replaced or altered
+        directly
+        """
+        if self._indexed_interests is not self._registered_interests or \
+                self._indexed_count != len(self._registered_interests):
+            self._indexes = {attribute: dict() for attribute in self._INDEXED_ATTRIBUTES}
+            for interest_record in self._registered_interests:
+                self._index_interest(self._indexes, interest_record)
+            self._indexed_interests = self._registered_interests
+            self._indexed_count = len(self._registered_interests)
+        return self._indexes
+
     def and_filter(self, **kwargs):
         """ Used to filter InterestRecord objects based on attribute values.
         """
-        interest_records = None
-        interest_records = [s for s in self._registered_interests if all(getattr(s, k, None) == v for k, v in kwargs.items() if v is not None)]
+        conditions = {k: v for k, v in kwargs.items() if v is not None}
+        interest_records = self._registered_interests
+        for attribute in self._INDEXED_ATTRIBUTES:
+            if attribute in conditions:
+                interest_records = self._get_indexes()[attribute].get(conditions.pop(attribute), [])
+                break
+        interest_records = [s for s in interest_records if all(getattr(s, k, None) == v for k, v in conditions.items())]
         return interest_records
 
     def get(self, registration_id=None, category_name=None, microservice_uuid=None):
@@ -166,7 +197,10 @@ class InterestRegistry(InterestRegistrySingleton):
         # create new InterestRecord
         registered_interest = InterestRecord(registration_id, microservice_uuid, category_name)
         # add interest record to list of registered interests
+        indexes = self._get_indexes()
         self._registered_interests.append(registered_interest)
+        self._index_interest(indexes, registered_interest)
+        self._indexed_count += 1
 
         return registration_id
 
@@ -184,7 +218,14 @@ class InterestRegistry(InterestRegistrySingleton):
         try: 
             registered_interests = self.get(registration_id=registration_id)
             interest_record = registered_interests[0]
-            self._registered_interests.remove(registered_interests[0])
+            indexes = self._get_indexes()
+            self._registered_interests.remove(interest_record)
+            for attribute in self._INDEXED_ATTRIBUTES:
+                bucket = indexes[attribute][getattr(interest_record, attribute)]
+                bucket.remove(interest_record)
+                if not bucket:
+                    del indexes[attribute][getattr(interest_record, attribute)]
+            self._indexed_count -= 1
         except interest_registry_exceptions.DoesNotExist:
             raise
         # remove entry from configuration manager if no registered interests exist for this category_name
@@ -265,6 +265,7 @@ def setup(app):
     # Health related calls
     app.router.add_route('GET', '/fledge/health/storage', health.get_storage_health)
     app.router.add_route('GET', '/fledge/health/logging', health.get_logging_health)
+    app.router.add_route('GET', '/fledge/health/cache', health.get_cache_health)
 
     # Proxy Admin API setup with regex
     proxy.admin_api_setup(app)
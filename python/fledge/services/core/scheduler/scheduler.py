@@ -9,6 +9,8 @@
 import asyncio
 import collections
 import datetime
+import heapq
+import itertools
 import logging
 import math
 import time
@@ -68,7 +70,7 @@ class Scheduler(object):
 
     class _TaskProcess(object):
         """Tracks a running task with some flags"""
-        __slots__ = ['task_id', 'process', 'cancel_requested', 'schedule', 'start_time', 'future']
+        __slots__ = ['task_id', 'process', 'cancel_requested', 'schedule', 'start_time', 'future', 'ended']
 
         def __init__(self):
             self.task_id = None  # type: uuid.UUID
@@ -79,6 +81,8 @@ class Scheduler(object):
             self.start_time = None  # type: int
             """Epoch time when the task was started"""
             self.future = None
+            self.ended = None  # type: asyncio.Future
+            """Resolved when the task is removed from the scheduler records, created by :meth:`_wait_for_task_end`"""
 
     # TODO: Methods that accept a schedule and look in _schedule_executions
     # should accept schedule_execution instead. Add reference to schedule
@@ -87,21 +91,105 @@ class Scheduler(object):
     class _ScheduleExecution(object):
         """Tracks information about schedules"""
 
-        __slots__ = ['next_start_time', 'task_processes', 'start_now']
+        __slots__ = ['_next_start_time', 'task_processes', '_start_now', 'schedule_id', 'timer_queue', 'timer_seq',
+                     'launch_pending']
 
-        def __init__(self):
-            self.next_start_time = None
-            """When to next start a task for the schedule"""
+        def __init__(self, schedule_id=None, timer_queue=None):
+            self._next_start_time = None
             self.task_processes = dict()
             """dict of task id to _TaskProcess"""
-            self.start_now = False
+            self._start_now = False
+            self.schedule_id = schedule_id  # type: uuid.UUID
+            self.timer_queue = timer_queue  # type: Scheduler._TimerQueue
+            """Queue told about every change of next_start_time and start_now"""
+            self.timer_seq = None  # type: int
+            """Sequence number of the latest timer queue entry for next_start_time"""
+            self.launch_pending = False
+            """True while a task for the schedule waits in the launch queue"""
+
+        @property
+        def next_start_time(self):
+            """When to next start a task for the schedule"""
+            return self._next_start_time
+
+        @next_start_time.setter
+        def next_start_time(self, value):
+            self._next_start_time = value
+            if self.timer_queue is not None:
+                self.timer_queue.push(self, value)
+
+        @property
+        def start_now(self):
             """True when a task is queued to start via :meth:`start_task`"""
+            return self._start_now
+
+        @start_now.setter
+        def start_now(self, value):
+            self._start_now = value
+            if value and self.timer_queue is not None:
+                self.timer_queue.push(self, self.timer_queue.NOW)
+
+    class _TimerQueue(object):
+        """Priority queue of schedule executions ordered by the time their next task is due
+
+        Entries are invalidated lazily: changing next_start_time pushes a new entry and leaves the previous one in the
+        heap. An entry is stale, and dropped when it reaches the head, unless it is the latest one pushed for its
+        execution. Executions queued with start_now are pushed with the time :attr:`NOW`, ahead of every timer.
+        """
+
+        __slots__ = ['_heap', '_seq', '_compact_size']
+
+        NOW = float('-inf')
+
+        _MIN_COMPACT_SIZE = 64
+        """Stale entries are purged when the heap grows beyond twice its size after the last purge, or this size"""
+
+        def __init__(self):
+            self._heap = []
+            self._seq = itertools.count()
+            self._compact_size = self._MIN_COMPACT_SIZE
+
+        def __len__(self):
+            return len(self._heap)
+
+        def _is_current(self, entry):
+            when, seq, schedule_execution = entry
+            return schedule_execution.timer_queue is self and (
+                schedule_execution.start_now if when == self.NOW else seq == schedule_execution.timer_seq)
+
+        def push(self, schedule_execution, when):
+            seq = next(self._seq)
+            if when is not self.NOW:
+                schedule_execution.timer_seq = seq
+                if when is None:
+                    return
+            heapq.heappush(self._heap, (when, seq, schedule_execution))
+            if len(self._heap) > self._compact_size:
+                self._heap = [entry for entry in self._heap if self._is_current(entry)]
+                heapq.heapify(self._heap)
+                self._compact_size = max(self._MIN_COMPACT_SIZE, 2 * len(self._heap))
+
+        def head(self):
+            """Returns (when, schedule_execution) for the first entry that is not stale, None if there is none"""
+            while self._heap:
+                if self._is_current(self._heap[0]):
+                    when, _, schedule_execution = self._heap[0]
+                    return when, schedule_execution
+                heapq.heappop(self._heap)
+            return None
+
+        def pop(self):
+            heapq.heappop(self._heap)
 
     # Constant class attributes
     _DEFAULT_MAX_RUNNING_TASKS = 50
     """Maximum number of running tasks allowed at any given time"""
     _DEFAULT_MAX_COMPLETED_TASK_AGE_DAYS = 30
     """Maximum age of rows in the task table that have finished, in days"""
+    _DEFAULT_MAX_CONCURRENT_LAUNCHES = 4
+    """Maximum number of processes starting up at any given time"""
+    _DEFAULT_LAUNCH_JITTER_SECONDS = 10
+    """Interval schedules that fall due together are spread over this number of seconds"""
     _DELETE_TASKS_LIMIT = 500
     """The maximum number of rows to delete in the tasks table in a single transaction"""
 
@@ -117,6 +205,18 @@ class Scheduler(object):
     _STOP_WAIT_SECONDS = 5
     """Wait this number of seconds in :meth:`stop` for tasks to stop"""
 
+    _SERVICE_STOP_WAIT_SECONDS = 10
+    """Wait this number of seconds when disabling a schedule for its service to unregister"""
+
+    _LAUNCH_SETTLE_SECONDS = 5
+    """A launched process counts as starting up until it exits, its service registers or this number of seconds"""
+
+    _LAUNCH_POLL_SECONDS = 0.5
+    """While launches are held back, check this often whether a service has registered"""
+
+    _STARTUP_LAUNCH_PRIORITY = 0
+    _DEFAULT_LAUNCH_PRIORITY = 1
+
     _PURGE_TASKS_FREQUENCY_SECONDS = _DAY_SECONDS
     """How frequently to purge the tasks table"""
 
@@ -155,6 +255,10 @@ class Scheduler(object):
         """When the scheduler started"""
         self._max_running_tasks = None  # type: int
         """Maximum number of tasks that can execute at any given time"""
+        self._max_concurrent_launches = self._DEFAULT_MAX_CONCURRENT_LAUNCHES
+        """Maximum number of processes starting up at any given time, 0 for no limit"""
+        self._launch_jitter_seconds = self._DEFAULT_LAUNCH_JITTER_SECONDS
+        """Spread of the first start time of interval schedules"""
         self._paused = False
         """When True, the scheduler will not start any new tasks"""
         self._process_scripts = dict()
@@ -163,6 +267,18 @@ class Scheduler(object):
         """Dictionary of schedules.id to _ScheduleRow"""
         self._schedule_executions = dict()
         """Dictionary of schedules.id to _ScheduleExecution"""
+        self._timer_queue = self._TimerQueue()
+        """Schedule executions in the order their next task is due"""
+        self._launch_queue = []
+        """Heap of (priority, due time, sequence, _ScheduleExecution) for due tasks waiting to start"""
+        self._launch_seq = itertools.count()
+        self._launches = []
+        """List of (deadline, _TaskProcess) for processes that are starting up"""
+        self._launches_deferred = False
+        """True while launches are held back by max_concurrent_launches"""
+        self._launch_stats = {"launched": 0, "deferred": 0, "maxQueueDepth": 0, "totalLatency": 0.0,
+                              "maxLatency": 0.0}
+        """Counters reported by :meth:`get_launch_statistics`"""
         self._task_processes = dict()
         """Dictionary of tasks.id to _TaskProcess"""
         self._check_processes_pending = False
@@ -258,6 +374,14 @@ class Scheduler(object):
         elif schedule.exclusive:
             self._schedule_next_task(schedule)
 
+        if schedule_deleted:
+            if not schedule_execution.task_processes and \
+                    self._schedule_executions.get(schedule.id) is schedule_execution:
+                self._remove_schedule_execution(schedule.id)
+        elif schedule_execution.start_now and schedule.exclusive:
+            # A manual execution queued while the task was running can start now
+            schedule_execution.start_now = True
+
         if schedule.type != Schedule.Type.STARTUP:
             if exit_code < 0 and task_process.cancel_requested:
                 state = Task.State.CANCELED
@@ -287,10 +411,14 @@ class Scheduler(object):
         # This must occur after all awaiting. The size of _task_processes
         # is used by stop() to determine whether the scheduler can stop.
         del self._task_processes[task_process.task_id]
+        self._task_ended(task_process)
 
-    async def _start_task(self, schedule: _ScheduleRow, dryrun=False) -> None:
+    async def _start_task(self, schedule: _ScheduleRow, dryrun=False) -> _TaskProcess:
         """Starts a task process
 
+        Returns:
+            The started _TaskProcess, None for a dry run
+
         Raises:
             EnvironmentError: If the process could not start
         """
@@ -340,7 +468,7 @@ class Scheduler(object):
             raise
 
         if dryrun:
-            return
+            return None
 
         task_id = uuid.uuid4()
         task_process.process = process
@@ -376,6 +504,7 @@ class Scheduler(object):
                 self._logger.exception('Insert failed: %s', insert_payload)
                 # The process has started. Regardless of this error it must be waited on.
             self._task_processes[task_id].future = asyncio.ensure_future(self._wait_for_task_completion(task_process))
+        return task_process
 
     async def purge_tasks(self):
         """Deletes rows from the tasks table"""
@@ -414,77 +543,171 @@ class Scheduler(object):
                     time.time() - self._last_task_purge_time) >= self._PURGE_TASKS_FREQUENCY_SECONDS):
             self._purge_tasks_task = asyncio.ensure_future(self.purge_tasks())
 
+    def _new_schedule_execution(self, schedule_id):
+        """Creates the _ScheduleExecution of a schedule, attached to the timer queue"""
+        schedule_execution = self._ScheduleExecution(schedule_id, self._timer_queue)
+        self._schedule_executions[schedule_id] = schedule_execution
+        return schedule_execution
+
+    def _remove_schedule_execution(self, schedule_id):
+        """Removes the _ScheduleExecution of a schedule; its timer queue entries become stale"""
+        schedule_execution = self._schedule_executions.pop(schedule_id)
+        schedule_execution.timer_queue = None
+
     async def _check_schedules(self):
-        """Starts tasks according to schedules based on the current time"""
-        earliest_start_time = None
+        """Starts tasks according to schedules based on the current time
 
-        # Can not iterate over _schedule_executions - it can change mid-iteration
-        for schedule_id in list(self._schedule_executions.keys()):
-            if self._paused or len(self._task_processes) >= self._max_running_tasks:
-                return None
+        Only the due entries at the head of the timer queue are visited. Due tasks go to the launch queue and are
+        started by :meth:`_launch_tasks`.
 
-            schedule_execution = self._schedule_executions[schedule_id]
+        Returns:
+            The earliest time to check schedules again, or None if no timer is pending or no task can be started
+        """
+        if self._paused or len(self._task_processes) >= self._max_running_tasks:
+            return None
+
+        now = self.current_time if self.current_time else time.time()
+        next_start_time = None
+        while True:
+            head = self._timer_queue.head()
+            if head is None:
+                break
+            when, schedule_execution = head
+            if when > now:
+                next_start_time = when
+                break
+
+            self._timer_queue.pop()
+            schedule_id = schedule_execution.schedule_id
+            if self._schedule_executions.get(schedule_id) is not schedule_execution:
+                continue
 
             try:
                 schedule = self._schedules[schedule_id]
             except KeyError:
                 # The schedule has been deleted
                 if not schedule_execution.task_processes:
-                    del self._schedule_executions[schedule_id]
+                    self._remove_schedule_execution(schedule_id)
                 continue
 
+            # A disabled schedule is queued again by enable_schedule
             if schedule.enabled is False:
                 continue
 
+            # An exclusive schedule is queued again when its running task completes
             if schedule.exclusive and schedule_execution.task_processes:
                 continue
 
-            # next_start_time is None when repeat is None until the
-            # task completes, at which time schedule_execution is removed
-            next_start_time = schedule_execution.next_start_time
-            if not next_start_time and not schedule_execution.start_now:
-                if not schedule_execution.task_processes:
-                    del self._schedule_executions[schedule_id]
-                continue
-
-            if next_start_time and not schedule_execution.start_now:
-                now = self.current_time if self.current_time else time.time()
-                right_time = now >= next_start_time
-            else:
-                right_time = False
-
-            if right_time or schedule_execution.start_now:
-                # Start a task
-
-                if not right_time:
-                    # Manual start - don't change next_start_time
-                    pass
-                elif schedule.exclusive:
-                    # Exclusive tasks won't start again until they terminate
-                    # Or the schedule doesn't repeat
-                    next_start_time = None
-                else:
-                    # _schedule_next_task alters next_start_time
-                    self._schedule_next_task(schedule)
-                    next_start_time = schedule_execution.next_start_time
+            # A queued manual execution starts a task without changing next_start_time
+            right_time = when != self._timer_queue.NOW and not schedule_execution.start_now
+            if right_time and not schedule.exclusive:
+                # _schedule_next_task alters next_start_time
+                # Exclusive tasks won't start again until they terminate
+                self._schedule_next_task(schedule)
+
+            # A schedule that is already waiting in the launch queue starts a single task
+            if not schedule_execution.launch_pending:
+                self._queue_launch(schedule, schedule_execution, when if right_time else now)
+            schedule_execution.start_now = False
+
+        retry_time = await self._launch_tasks()
+        if retry_time is not None and (next_start_time is None or retry_time < next_start_time):
+            return retry_time
+        return next_start_time
+
+    def _queue_launch(self, schedule, schedule_execution, due):
+        """Adds a due task to the launch queue, STARTUP schedules ahead of the others"""
+        priority = self._STARTUP_LAUNCH_PRIORITY if schedule.type == Schedule.Type.STARTUP \
+            else self._DEFAULT_LAUNCH_PRIORITY
+        heapq.heappush(self._launch_queue, (priority, due, next(self._launch_seq), schedule_execution))
+        schedule_execution.launch_pending = True
+        if len(self._launch_queue) > self._launch_stats["maxQueueDepth"]:
+            self._launch_stats["maxQueueDepth"] = len(self._launch_queue)
+
+    def _is_launching(self, launch, now):
+        """Whether a launched process is still starting up"""
+        deadline, task_process = launch
+        if deadline <= now:
+            return False
+        if task_process is None:
+            return True
+        if task_process.task_id not in self._task_processes:
+            return False
+        schedule = task_process.schedule
+        # ServiceRegistry drops the startup token when the service registers
+        return schedule.type != Schedule.Type.STARTUP or ServiceRegistry.getStartupToken(schedule.name) is not None
 
-                await self._start_task(schedule)
+    async def _launch_tasks(self):
+        """Starts the tasks in the launch queue while fewer than max_concurrent_launches processes are starting up
 
-                # Queued manual execution is ignored when it was
-                # already time to run the task. The task doesn't
-                # start twice even when nonexclusive.
-                # The choice to put this after "await" above was
-                # deliberate. The above "await" could have allowed
-                # queue_task() to run. The following line
-                # will undo that because, after all, the task started.
-                schedule_execution.start_now = False
+        Returns:
+            When to try again if launches are held back, otherwise None
+        """
+        while self._launch_queue:
+            if self._paused or len(self._task_processes) >= self._max_running_tasks:
+                return None
 
-            # Keep track of the earliest next_start_time
-            if next_start_time and (earliest_start_time is None or
-                                            earliest_start_time > next_start_time):
-                earliest_start_time = next_start_time
+            now = self.current_time if self.current_time else time.time()
+            if self._max_concurrent_launches > 0:
+                self._launches = [launch for launch in self._launches if self._is_launching(launch, now)]
+                if len(self._launches) >= self._max_concurrent_launches:
+                    if not self._launches_deferred:
+                        self._launches_deferred = True
+                        self._launch_stats["deferred"] += 1
+                        self._logger.info("Holding back process launches: %s queued, %s starting up",
+                                          len(self._launch_queue), len(self._launches))
+                    return min(min(deadline for deadline, _ in self._launches), now + self._LAUNCH_POLL_SECONDS)
+
+            _, due, _, schedule_execution = heapq.heappop(self._launch_queue)
+            schedule_execution.launch_pending = False
+            schedule_id = schedule_execution.schedule_id
+            if self._schedule_executions.get(schedule_id) is not schedule_execution:
+                continue
+            schedule = self._schedules.get(schedule_id)
+            if schedule is None:
+                if not schedule_execution.task_processes:
+                    self._remove_schedule_execution(schedule_id)
+                continue
+            if schedule.enabled is False or (schedule.exclusive and schedule_execution.task_processes):
+                continue
 
-        return earliest_start_time
+            task_process = await self._start_task(schedule)
+
+            # Queued manual execution is ignored when it was
+            # already time to run the task. The task doesn't
+            # start twice even when nonexclusive.
+            # The choice to put this after "await" above was
+            # deliberate. The above "await" could have allowed
+            # queue_task() to run. The following line
+            # will undo that because, after all, the task started.
+            schedule_execution.start_now = False
+
+            started = self.current_time if self.current_time else time.time()
+            self._launches.append((started + self._LAUNCH_SETTLE_SECONDS, task_process))
+            latency = max(0.0, started - due)
+            self._launch_stats["launched"] += 1
+            self._launch_stats["totalLatency"] += latency
+            if latency > self._launch_stats["maxLatency"]:
+                self._launch_stats["maxLatency"] = latency
+
+        if self._launches_deferred:
+            self._launches_deferred = False
+            self._logger.info("Launch queue drained, maximum launch latency %.1f seconds",
+                              self._launch_stats["maxLatency"])
+        return None
+
+    def get_launch_statistics(self) -> dict:
+        """Returns the launch queue depth, the number of processes starting up and the launch latency in seconds"""
+        launched = self._launch_stats["launched"]
+        return {
+            "queued": len(self._launch_queue),
+            "starting": len(self._launches),
+            "maxQueueDepth": self._launch_stats["maxQueueDepth"],
+            "launched": launched,
+            "deferred": self._launch_stats["deferred"],
+            "averageLatency": self._launch_stats["totalLatency"] / launched if launched else 0.0,
+            "maxLatency": self._launch_stats["maxLatency"]
+        }
 
     async def _scheduler_loop(self):
         """Main loop for the scheduler"""
@@ -637,8 +860,7 @@ class Scheduler(object):
         try:
             schedule_execution = self._schedule_executions[schedule.id]
         except KeyError:
-            schedule_execution = self._ScheduleExecution()
-            self._schedule_executions[schedule.id] = schedule_execution
+            schedule_execution = self._new_schedule_execution(schedule.id)
 
         if schedule.type == Schedule.Type.INTERVAL:
             advance_seconds = schedule.repeat_seconds
@@ -656,7 +878,7 @@ class Scheduler(object):
             else:
                 advance_seconds = 0
 
-            schedule_execution.next_start_time = self._start_time + advance_seconds
+            schedule_execution.next_start_time = self._start_time + advance_seconds + self._launch_offset(schedule)
         elif schedule.type == Schedule.Type.TIMED:
             self._schedule_next_timed_task(
                 schedule,
@@ -670,6 +892,15 @@ class Scheduler(object):
                 "Scheduled task for schedule '%s' to start at %s", schedule.name,
                 datetime.datetime.fromtimestamp(schedule_execution.next_start_time))
 
+    def _launch_offset(self, schedule):
+        """Offset of the start times of an interval schedule, so that schedules with the same repeat interval
+        do not all fall due together. It is derived from the schedule id and stays the same across restarts.
+        """
+        spread = min(self._launch_jitter_seconds, schedule.repeat_seconds or 0)
+        if spread <= 0:
+            return 0
+        return (schedule.id.int % 1000) / 1000 * spread
+
     async def _get_process_scripts(self):
         try:
             self._logger.debug('Database command: %s', "scheduled_processes")
@@ -759,6 +990,22 @@ class Scheduler(object):
                 "default": str(self._DEFAULT_MAX_COMPLETED_TASK_AGE_DAYS),
                 "displayName": "Max Age Of Task (In days)"
             },
+            "max_concurrent_launches": {
+                "description": "Maximum number of processes that can be starting up at any given time, "
+                               "0 for no limit. Services are started ahead of tasks",
+                "type": "integer",
+                "default": str(self._DEFAULT_MAX_CONCURRENT_LAUNCHES),
+                "minimum": "0",
+                "displayName": "Max Concurrent Launches"
+            },
+            "launch_jitter_seconds": {
+                "description": "Interval schedules are offset by up to this number of seconds so that "
+                               "schedules with the same interval do not start together",
+                "type": "integer",
+                "default": str(self._DEFAULT_LAUNCH_JITTER_SECONDS),
+                "minimum": "0",
+                "displayName": "Launch Jitter (In seconds)"
+            },
         }
 
         cfg_manager = ConfigurationManager(self._storage_async)
@@ -768,6 +1015,8 @@ class Scheduler(object):
         self._max_running_tasks = int(config['max_running_tasks']['value'])
         self._max_completed_task_age = datetime.timedelta(
             seconds=int(config['max_completed_task_age_days']['value']) * self._DAY_SECONDS)
+        self._max_concurrent_launches = int(config['max_concurrent_launches']['value'])
+        self._launch_jitter_seconds = int(config['launch_jitter_seconds']['value'])
 
     async def start(self):
         """Starts the scheduler
@@ -1203,8 +1452,9 @@ class Scheduler(object):
                 schedule = task_process.schedule
                 schedule_type = schedule.type
                 if schedule_type == Schedule.Type.STARTUP:  # If schedule is a service e.g. South services
-                    del self._schedule_executions[schedule.id]
+                    self._remove_schedule_execution(schedule.id)
                     del self._task_processes[task_process.task_id]
+                    self._task_ended(task_process)
                     self._logger.info("Service {} records successfully removed".format(service_name))
                     return True
         except KeyError:
@@ -1215,41 +1465,12 @@ class Scheduler(object):
                                                                                      schedule_type))
         return False
 
-    async def disable_schedule(self, schedule_id: uuid.UUID, bypass_check=None, record_audit_trail=True):
-        """
-        Find running Schedule, Terminate running process, Disable Schedule, Update database
+    async def _stop_schedule_task(self, schedule_id: uuid.UUID) -> None:
+        """Terminates the task running for a schedule, if any, and waits for it to end
 
-        Args: schedule_id:
-        Returns:
+        A task process is awaited until it exits. A service is asked to shut down and awaited until it unregisters,
+        for at most _SERVICE_STOP_WAIT_SECONDS.
         """
-        if self._paused or not self._ready:
-            raise NotReadyError()
-
-        # Find running task for the schedule.
-        # self._task_processes contains ALL tasks including STARTUP tasks.
-        try:
-            schedule = await self.get_schedule(schedule_id)
-        except ScheduleNotFoundError:
-            self._logger.exception("No such Schedule %s", str(schedule_id))
-            return False, "No such Schedule"
-
-        if bypass_check is None and schedule.enabled is False:
-            self._logger.info("Schedule %s already disabled", str(schedule_id))
-            return True, "Schedule {} already disabled".format(str(schedule_id))
-
-        # Disable Schedule - update the schedule in memory
-        self._schedules[schedule_id] = self._schedules[schedule_id]._replace(enabled=False)
-
-        # Update database
-        update_payload = PayloadBuilder().SET(enabled='f').WHERE(['id', '=', str(schedule_id)]).payload()
-        try:
-            self._logger.debug('Database command: %s', update_payload)
-            res = await self._storage_async.update_tbl("schedules", update_payload)
-        except Exception:
-            self._logger.exception('Update failed: %s', update_payload)
-            raise RuntimeError('Update failed: %s', update_payload)
-        await asyncio.sleep(1)
-
         # If a task is running for the schedule, then terminate the process
         task_id = None
         task_process = None
@@ -1267,12 +1488,13 @@ class Scheduler(object):
         if task_id is not None:
             schedule = task_process.schedule
             if schedule.type == Schedule.Type.STARTUP:  # If schedule is a service e.g. South services
+                service_stopping = False
                 try:
                     found_services = ServiceRegistry.get(name=schedule.name)
                     service = found_services[0]
                     if await utils.ping_service(service) is True:
                         # Shutdown will take care of unregistering the service from core
-                        await utils.shutdown_service(service)
+                        service_stopping = await utils.shutdown_service(service)
                 except:
                     # Service registry does not exist but Scheduler records for service exist, hence remove records
                     try:
@@ -1288,6 +1510,10 @@ class Scheduler(object):
                     task_process.process.terminate()
                 except ProcessLookupError:
                     pass  # Process has terminated
+                if service_stopping and not await self._wait_for_task_end(task_process,
+                                                                          self._SERVICE_STOP_WAIT_SECONDS):
+                    self._logger.warning("Service '%s' did not unregister within %s seconds of its shutdown",
+                                         schedule.name, self._SERVICE_STOP_WAIT_SECONDS)
             else: # else it is a Task e.g. North tasks
                 # Terminate process
                 try:
@@ -1313,15 +1539,85 @@ class Scheduler(object):
                 if task_future.cancel() is True:
                     await self._wait_for_task_completion(task_process)
 
+    async def _wait_for_task_end(self, task_process: _TaskProcess, timeout) -> bool:
+        """Waits until a task process is removed from the scheduler records
+
+        Returns:
+            False if it is still there after timeout seconds
+        """
+        if task_process.task_id not in self._task_processes:
+            return True
+        if task_process.ended is None:
+            task_process.ended = asyncio.get_event_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(task_process.ended), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    @staticmethod
+    def _task_ended(task_process: _TaskProcess) -> None:
+        """Wakes up :meth:`_wait_for_task_end` for a task process removed from the scheduler records"""
+        if task_process.ended is not None and not task_process.ended.done():
+            task_process.ended.set_result(None)
+
+    async def _update_schedules_enabled(self, schedule_ids: List[uuid.UUID], enabled: bool) -> None:
+        """Sets enabled for schedules, in memory and with a single update of the schedules table"""
+        for schedule_id in schedule_ids:
+            self._schedules[schedule_id] = self._schedules[schedule_id]._replace(enabled=enabled)
+        if len(schedule_ids) == 1:
+            where = ['id', '=', str(schedule_ids[0])]
+        else:
+            where = ['id', 'in', [str(schedule_id) for schedule_id in schedule_ids]]
+        update_payload = PayloadBuilder().SET(enabled='t' if enabled else 'f').WHERE(where).payload()
+        try:
+            self._logger.debug('Database command: %s', update_payload)
+            res = await self._storage_async.update_tbl("schedules", update_payload)
+        except Exception:
+            self._logger.exception('Update failed: %s', update_payload)
+            raise RuntimeError('Update failed: %s', update_payload)
+
+    async def _audit_schedule_change(self, schedule_id: uuid.UUID) -> None:
+        audit = AuditLogger(self._storage_async)
+        sch = await self.get_schedule(schedule_id)
+        await audit.information('SCHCH', {'schedule': sch.toDict()})
+
+    async def disable_schedule(self, schedule_id: uuid.UUID, bypass_check=None, record_audit_trail=True):
+        """
+        Find running Schedule, Terminate running process, Disable Schedule, Update database
+
+        Returns once the running task, if any, has ended.
+
+        Args: schedule_id:
+        Returns:
+        """
+        if self._paused or not self._ready:
+            raise NotReadyError()
+
+        # Find running task for the schedule.
+        # self._task_processes contains ALL tasks including STARTUP tasks.
+        try:
+            schedule = await self.get_schedule(schedule_id)
+        except ScheduleNotFoundError:
+            self._logger.exception("No such Schedule %s", str(schedule_id))
+            return False, "No such Schedule"
+
+        if bypass_check is None and schedule.enabled is False:
+            self._logger.info("Schedule %s already disabled", str(schedule_id))
+            return True, "Schedule {} already disabled".format(str(schedule_id))
+
+        # Disable Schedule - update the schedule in memory and database
+        await self._update_schedules_enabled([schedule_id], False)
+
+        await self._stop_schedule_task(schedule_id)
+
         self._logger.info(
             "Disabled Schedule '%s/%s' process '%s'\n",
             schedule.name,
             str(schedule_id),
             schedule.process_name)
         if record_audit_trail:
-            audit = AuditLogger(self._storage_async)
-            sch = await self.get_schedule(schedule_id)
-            await audit.information('SCHCH', {'schedule': sch.toDict()})
+            await self._audit_schedule_change(schedule_id)
         return True, "Schedule successfully disabled"
 
     async def enable_schedule(self, schedule_id: uuid.UUID, bypass_check=None, record_audit_trail=True):
@@ -1344,18 +1640,8 @@ class Scheduler(object):
             self._logger.info("Schedule %s already enabled", str(schedule_id))
             return True, "Schedule is already enabled"
 
-        # Enable Schedule
-        self._schedules[schedule_id] = self._schedules[schedule_id]._replace(enabled=True)
-
-        # Update database
-        update_payload = PayloadBuilder().SET(enabled='t').WHERE(['id', '=', str(schedule_id)]).payload()
-        try:
-            self._logger.debug('Database command: %s', update_payload)
-            res = await self._storage_async.update_tbl("schedules", update_payload)
-        except Exception:
-            self._logger.exception('Update failed: %s', update_payload)
-            raise RuntimeError('Update failed: %s', update_payload)
-        await asyncio.sleep(1)
+        # Enable Schedule - update the schedule in memory and database
+        await self._update_schedules_enabled([schedule_id], True)
 
         # Reset schedule_execution.next_start_time
         schedule_row = self._schedules[schedule_id]
@@ -1371,11 +1657,86 @@ class Scheduler(object):
             str(schedule_id),
             schedule.process_name)
         if record_audit_trail:
-            audit = AuditLogger(self._storage_async)
-            sch = await self.get_schedule(schedule_id)
-            await audit.information('SCHCH', { 'schedule': sch.toDict() })
+            await self._audit_schedule_change(schedule_id)
         return True, "Schedule successfully enabled"
 
+    async def disable_schedules(self, schedule_ids: List[uuid.UUID], record_audit_trail=True) -> dict:
+        """Disables several schedules with one update of the schedules table
+
+        The tasks running for the schedules are stopped concurrently.
+
+        Returns:
+            dict of schedule id to the (status, message) pair :meth:`disable_schedule` would return
+        """
+        if self._paused or not self._ready:
+            raise NotReadyError()
+
+        result = {}
+        to_disable = []
+        for schedule_id in schedule_ids:
+            schedule_row = self._schedules.get(schedule_id)
+            if schedule_row is None:
+                self._logger.error("No such Schedule %s", str(schedule_id))
+                result[schedule_id] = (False, "No such Schedule")
+            elif schedule_row.enabled is False:
+                result[schedule_id] = (True, "Schedule {} already disabled".format(str(schedule_id)))
+            elif schedule_id not in to_disable:
+                to_disable.append(schedule_id)
+        if not to_disable:
+            return result
+
+        await self._update_schedules_enabled(to_disable, False)
+        await asyncio.gather(*[self._stop_schedule_task(schedule_id) for schedule_id in to_disable])
+
+        for schedule_id in to_disable:
+            schedule_row = self._schedules[schedule_id]
+            self._logger.info("Disabled Schedule '%s/%s' process '%s'\n", schedule_row.name, str(schedule_id),
+                              schedule_row.process_name)
+            result[schedule_id] = (True, "Schedule successfully disabled")
+        if record_audit_trail:
+            await asyncio.gather(*[self._audit_schedule_change(schedule_id) for schedule_id in to_disable])
+        return {schedule_id: result[schedule_id] for schedule_id in schedule_ids}
+
+    async def enable_schedules(self, schedule_ids: List[uuid.UUID], record_audit_trail=True) -> dict:
+        """Enables several schedules with one update of the schedules table and one wake-up of the main loop
+
+        Returns:
+            dict of schedule id to the (status, message) pair :meth:`enable_schedule` would return
+        """
+        if self._paused or not self._ready:
+            raise NotReadyError()
+
+        result = {}
+        to_enable = []
+        for schedule_id in schedule_ids:
+            schedule_row = self._schedules.get(schedule_id)
+            if schedule_row is None:
+                self._logger.error("No such Schedule %s", str(schedule_id))
+                result[schedule_id] = (False, "No such Schedule")
+            elif schedule_row.enabled is True:
+                result[schedule_id] = (True, "Schedule is already enabled")
+            elif schedule_id not in to_enable:
+                to_enable.append(schedule_id)
+        if not to_enable:
+            return result
+
+        await self._update_schedules_enabled(to_enable, True)
+        now = self.current_time if self.current_time else time.time()
+        for schedule_id in to_enable:
+            self._schedule_first_task(self._schedules[schedule_id], now)
+            if schedule_id not in self._schedule_executions:
+                self._new_schedule_execution(schedule_id)
+        self._resume_check_schedules()
+
+        for schedule_id in to_enable:
+            schedule_row = self._schedules[schedule_id]
+            self._logger.info("Enabled Schedule '%s/%s' process '%s'\n", schedule_row.name, str(schedule_id),
+                              schedule_row.process_name)
+            result[schedule_id] = (True, "Schedule successfully enabled")
+        if record_audit_trail:
+            await asyncio.gather(*[self._audit_schedule_change(schedule_id) for schedule_id in to_enable])
+        return {schedule_id: result[schedule_id] for schedule_id in schedule_ids}
+
     async def queue_task(self, schedule_id: uuid.UUID, start_now=True) -> None:
         """Requests a task to be started for a schedule
 
@@ -1403,8 +1764,7 @@ class Scheduler(object):
         try:
             schedule_execution = self._schedule_executions[schedule_id]
         except KeyError:
-            schedule_execution = self._ScheduleExecution()
-            self._schedule_executions[schedule_row.id] = schedule_execution
+            schedule_execution = self._new_schedule_execution(schedule_row.id)
 
         if start_now:
             schedule_execution.start_now = True
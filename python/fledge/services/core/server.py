@@ -23,7 +23,7 @@ import jwt
 
 from fledge.common import logger
 from fledge.common.audit_logger import AuditLogger
-from fledge.common.configuration_manager import ConfigurationManager
+from fledge.common.configuration_manager import ConfigurationManager, ConfigurationCache
 
 from fledge.common.web import middleware
 from fledge.common.storage_client.exceptions import *
@@ -31,12 +31,14 @@ from fledge.common.storage_client.storage_client import StorageClientAsync
 from fledge.common.storage_client.storage_client import ReadingsStorageClientAsync
 
 from fledge.services.core import routes as admin_routes
+from fledge.services.core import connect
 from fledge.services.core.api import configuration as conf_api
 from fledge.services.common.microservice_management import routes as management_routes
 
 from fledge.common.service_record import ServiceRecord
 from fledge.services.core.service_registry.service_registry import ServiceRegistry
 from fledge.services.core.service_registry import exceptions as service_registry_exceptions
+from fledge.services.core.interest_registry import change_callback
 from fledge.services.core.interest_registry.interest_registry import InterestRegistry
 from fledge.services.core.interest_registry import exceptions as interest_registry_exceptions
 from fledge.services.core.scheduler.scheduler import Scheduler
@@ -349,6 +351,25 @@ class Server:
         }
     }
 
+    _CONFIGURATION_CACHE_DEFAULT_CONFIG = {
+        'maxCategories': {
+            'description': 'Maximum number of configuration categories held in the configuration cache',
+            'type': 'integer',
+            'default': str(ConfigurationCache.MAX_CACHE_SIZE),
+            'displayName': 'Maximum Categories',
+            'order': '1',
+            'minimum': '1'
+        },
+        'maxBytes': {
+            'description': 'Maximum approximate size in bytes of the categories held in the configuration cache',
+            'type': 'integer',
+            'default': str(ConfigurationCache.MAX_CACHE_BYTES),
+            'displayName': 'Maximum Size (In bytes)',
+            'order': '2',
+            'minimum': '1'
+        }
+    }
+
     service_app, service_server, service_server_handler = None, None, None
     core_app, core_server, core_server_handler = None, None, None
 
@@ -515,6 +536,27 @@ class Server:
             _logger.exception(str(ex))
             raise
 
+    @classmethod
+    async def configuration_cache_config(cls):
+        """
+        Get the configuration cache limits and apply them to the configuration manager cache
+        """
+        try:
+            config = cls._CONFIGURATION_CACHE_DEFAULT_CONFIG
+            category = 'CONFIGURATION_CACHE'
+
+            if cls._configuration_manager is None:
+                _logger.error("No configuration manager available")
+            await cls._configuration_manager.create_category(category, config, 'Configuration Cache', True,
+                                                             display_name='Configuration Cache')
+            config = await cls._configuration_manager.get_category_all_items(category)
+
+            cls._configuration_manager._cacheManager.set_limits(int(config['maxCategories']['value']),
+                                                                int(config['maxBytes']['value']))
+        except Exception as ex:
+            _logger.exception(str(ex))
+            raise
+
     @staticmethod
     def _make_app(auth_required=True, auth_method='any'):
         """Creates the REST server
@@ -762,7 +804,7 @@ class Server:
         # Create the parent category for all advanced configuration categories
         try:
             await cls._configuration_manager.create_category("Advanced", {}, 'Advanced', True)
-            await cls._configuration_manager.create_child_category("Advanced", ["SMNTR", "SCHEDULER"])
+            await cls._configuration_manager.create_child_category("Advanced", ["SMNTR", "SCHEDULER", "CONFIGURATION_CACHE"])
         except KeyError:
             _logger.error('Failed to create Advanced parent configuration category for service')
             raise
@@ -880,6 +922,9 @@ class Server:
             # Installation category
             loop.run_until_complete(cls.installation_config())
 
+            # Configuration cache category
+            loop.run_until_complete(cls.configuration_cache_config())
+
             # Create the configuration category parents
             loop.run_until_complete(cls._config_parents())
 
@@ -963,6 +1008,7 @@ class Server:
 
             # poll microservices for unregister
             await cls.poll_microservices_unregister()
+            await change_callback.close_session()
 
             # stop the REST api (exposed on service port)
             await cls.stop_rest_server()
@@ -971,6 +1017,7 @@ class Server:
             cls._audit = AuditLogger(cls._storage_client_async)
             audit_msg = {"message": "Exited from safe mode"} if cls.running_in_safe_mode else None
             await cls._audit.information('FSTOP', audit_msg)
+            await cls._close_storage_clients()
 
             # stop storage
             await cls.stop_storage()
@@ -994,6 +1041,14 @@ class Server:
         await cls.service_app.cleanup()
         _logger.info("Rest server stopped.")
 
+    @classmethod
+    async def _close_storage_clients(cls):
+        """Releases the pooled connections held by the core storage clients"""
+        for client in (cls._storage_client_async, cls._readings_client_async):
+            if client is not None:
+                await client.close_session()
+        await connect.close_storage_sessions()
+
     @classmethod
     async def stop_storage(cls):
         """Stops Storage service """
@@ -9,6 +9,7 @@
 import asyncio
 import aiohttp
 import json
+import zlib
 from fledge.common import logger
 from fledge.common.audit_logger import AuditLogger
 from fledge.common.configuration_manager import ConfigurationManager
@@ -36,6 +37,15 @@ class Monitor(object):
     _DEFAULT_RESTART_FAILED = "auto"
     """Restart failed microservice - manual/auto"""
 
+    _MAX_CONCURRENT_PINGS = 16
+    """Maximum number of services pinged at the same time"""
+
+    _PING_SPACING = 0.02
+    """Pings of a round are spread over this number of seconds per service"""
+
+    _MAX_PING_SPREAD = 0.5
+    """Fraction of the health check interval that the pings of a round are spread over at most"""
+
     _logger = None
 
     def __init__(self):
@@ -54,10 +64,88 @@ class Monitor(object):
 
         self.restarted_services = []
         self._acl_handler = None
+        self._session = None  # type: aiohttp.ClientSession
+        """Client session shared by all pings"""
+        self._ping_semaphore = None  # type: asyncio.Semaphore
+        """Bounds the number of pings in progress"""
 
     async def _sleep(self, sleep_time):
         await asyncio.sleep(sleep_time)
 
+    def _get_session(self):
+        """Returns the client session shared by all pings, so that connections to services are reused"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._MAX_CONCURRENT_PINGS))
+            self._ping_semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_PINGS)
+        return self._session
+
+    async def _close_session(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _ping_offset(self, service_record, spread):
+        """Delay of the ping of a service within a round. It is derived from the service id so that each service
+        is pinged at the same point of every round and the pings of a round are spread over spread seconds.
+        """
+        if spread <= 0:
+            return 0
+        return (zlib.crc32(service_record._id.encode()) % 1000) / 1000 * spread
+
+    async def _ping_service(self, service_record, check_count, delay):
+        """Pings a service and updates its status"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            url = "{}://{}:{}/fledge/service/ping".format(
+                service_record._protocol, service_record._address, service_record._management_port)
+            session = self._get_session()
+            async with self._ping_semaphore:
+                async with session.get(url, timeout=self._ping_timeout) as resp:
+                    text = await resp.text()
+                    res = json.loads(text)
+                    if res["uptime"] is None:
+                        raise ValueError('res.uptime is None')
+        except (asyncio.TimeoutError, aiohttp.client_exceptions.ServerTimeoutError) as ex:
+            service_record._status = ServiceRecord.Status.Unresponsive
+            check_count[service_record._id] += 1
+            self._logger.info("ServerTimeoutError: %s, %s", str(ex), service_record.__repr__())
+        except aiohttp.client_exceptions.ClientConnectorError as ex:
+            service_record._status = ServiceRecord.Status.Unresponsive
+            check_count[service_record._id] += 1
+            self._logger.info("ClientConnectorError: %s, %s", str(ex), service_record.__repr__())
+        except ValueError as ex:
+            service_record._status = ServiceRecord.Status.Unresponsive
+            check_count[service_record._id] += 1
+            self._logger.info("Invalid response: %s, %s", str(ex), service_record.__repr__())
+        except Exception as ex:
+            service_record._status = ServiceRecord.Status.Unresponsive
+            check_count[service_record._id] += 1
+            self._logger.info("Exception occurred: %s, %s", str(ex), service_record.__repr__())
+        else:
+            service_record._status = ServiceRecord.Status.Running
+
+            if not self._acl_handler:
+                self._acl_handler = ACLManager(connect.get_storage_async())
+            # Storage is only consulted for a service that missed an ACL change
+            if self._acl_handler.has_pending_notification(service_record._name):
+                self._logger.debug("Resolving pending notification for ACL change "
+                                   "for service {} ".format(service_record._name))
+                await self._acl_handler.\
+                    resolve_pending_notification_for_acl_change(service_record._name)
+
+            check_count[service_record._id] = 1
+
+        if check_count[service_record._id] > self._max_attempts:
+            ServiceRegistry.mark_as_failed(service_record._id)
+            check_count[service_record._id] = 0
+            try:
+                audit = AuditLogger(connect.get_storage_async())
+                await audit.failure('SRVFL', {'name':service_record._name})
+            except Exception as ex:
+                self._logger.info("Failed to audit service failure %s", str(ex))
+
     async def _monitor_loop(self):
         """async Monitor loop to monitor registered services"""
         # check health of all micro-services every N seconds
@@ -69,7 +157,11 @@ class Monitor(object):
             round_cnt += 1
             self._logger.debug("Starting next round#{} of service monitoring, sleep/i:{} ping/t:{} max/a:{}".format(
                 round_cnt, self._sleep_interval, self._ping_timeout, self._max_attempts))
-            for service_record in ServiceRegistry.all():
+            service_records = ServiceRegistry.all()
+            # Pings are spread over a window that grows with the number of services
+            spread = min(self._sleep_interval * self._MAX_PING_SPREAD, len(service_records) * self._PING_SPACING)
+            pings = []
+            for service_record in service_records:
                 if service_record._id not in check_count:
                     check_count.update({service_record._id: 1})
 
@@ -95,51 +187,10 @@ class Monitor(object):
                          asyncio.ensure_future(self.restart_service(service_record))
                      continue
 
-                try:
-                    url = "{}://{}:{}/fledge/service/ping".format(
-                        service_record._protocol, service_record._address, service_record._management_port)
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, timeout=self._ping_timeout) as resp:
-                            text = await resp.text()
-                            res = json.loads(text)
-                            if res["uptime"] is None:
-                                raise ValueError('res.uptime is None')
-                except (asyncio.TimeoutError, aiohttp.client_exceptions.ServerTimeoutError) as ex:
-                    service_record._status = ServiceRecord.Status.Unresponsive
-                    check_count[service_record._id] += 1
-                    self._logger.info("ServerTimeoutError: %s, %s", str(ex), service_record.__repr__())
-                except aiohttp.client_exceptions.ClientConnectorError as ex:
-                    service_record._status = ServiceRecord.Status.Unresponsive
-                    check_count[service_record._id] += 1
-                    self._logger.info("ClientConnectorError: %s, %s", str(ex), service_record.__repr__())
-                except ValueError as ex:
-                    service_record._status = ServiceRecord.Status.Unresponsive
-                    check_count[service_record._id] += 1
-                    self._logger.info("Invalid response: %s, %s", str(ex), service_record.__repr__())
-                except Exception as ex:
-                    service_record._status = ServiceRecord.Status.Unresponsive
-                    check_count[service_record._id] += 1
-                    self._logger.info("Exception occurred: %s, %s", str(ex), service_record.__repr__())
-                else:
-                    service_record._status = ServiceRecord.Status.Running
-
-                    self._logger.debug("Resolving pending notification for ACL change "
-                                       "for service {} ".format(service_record._name))
-                    if not self._acl_handler:
-                        self._acl_handler = ACLManager(connect.get_storage_async())
-                    await self._acl_handler.\
-                        resolve_pending_notification_for_acl_change(service_record._name)
-
-                    check_count[service_record._id] = 1
-
-                if check_count[service_record._id] > self._max_attempts:
-                    ServiceRegistry.mark_as_failed(service_record._id)
-                    check_count[service_record._id] = 0
-                    try:
-                        audit = AuditLogger(connect.get_storage_async())
-                        await audit.failure('SRVFL', {'name':service_record._name})
-                    except Exception as ex:
-                        self._logger.info("Failed to audit service failure %s", str(ex))
+                pings.append(self._ping_service(service_record, check_count,
+                                                self._ping_offset(service_record, spread)))
+            if pings:
+                await asyncio.gather(*pings)
             await self._sleep(self._sleep_interval)
 
     async def _read_config(self):
@@ -202,3 +253,4 @@ class Monitor(object):
             self._monitor_loop_task.cancel()
         except asyncio.CancelledError:
             pass
+        await self._close_session()
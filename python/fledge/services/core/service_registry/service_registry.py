@@ -8,6 +8,7 @@
 
 import uuid
 import asyncio
+import operator
 import string
 import random
 from fledge.common import logger
@@ -25,6 +26,20 @@ class ServiceRegistry:
 
     _registry = list()
 
+    # Indexes of _registry: attribute value to the list of services with that value, in registration order.
+    # They are rebuilt when _registry is replaced or altered without register / remove_from_registry.
+    _INDEXES = {
+        '_id': operator.attrgetter('_id'),
+        '_name': operator.attrgetter('_name'),
+        '_type': operator.attrgetter('_type'),
+        'address_port': operator.attrgetter('_address', '_port'),
+        'address_management_port': operator.attrgetter('_address', '_management_port')
+    }
+    _FILTER_INDEXES = ('_id', '_name', '_type')
+    _indexes = dict()
+    _indexed_registry = None
+    _indexed_count = 0
+
     # Startup tokens to pass to service or tasks being started
     _startupTokens = dict()
 
@@ -112,7 +127,10 @@ class ServiceRegistry:
 
         service_id = str(uuid.uuid4()) if new_service is True else current_service_id
         registered_service = ServiceRecord(service_id, name, s_type, protocol, address, port, management_port)
+        indexes = cls._get_indexes()
         cls._registry.append(registered_service)
+        cls._index_service(indexes, registered_service)
+        cls._indexed_count += 1
         cls._logger.info("Registered {}".format(str(registered_service)))
 
         # Remove startup token
@@ -184,7 +202,14 @@ class ServiceRegistry:
         :param service_id: a uuid of registered service
         """
         services = cls.get(idx=service_id)
+        indexes = cls._get_indexes()
         cls._registry.remove(services[0])
+        for index, key in cls._INDEXES.items():
+            bucket = indexes[index][key(services[0])]
+            bucket.remove(services[0])
+            if not bucket:
+                del indexes[index][key(services[0])]
+        cls._indexed_count -= 1
 
     @classmethod
     def _remove_from_scheduler_records(cls, service_name):
@@ -200,6 +225,26 @@ class ServiceRegistry:
         if server.Server.scheduler is None: return
         asyncio.ensure_future(server.Server.scheduler.remove_service_from_task_processes(service_name))
 
+    @classmethod
+    def _index_service(cls, indexes, service):
+        for index, key in cls._INDEXES.items():
+            indexes[index].setdefault(key(service), []).append(service)
+
+    @classmethod
+    def _get_indexes(cls):
+        """ returns the indexes of the registry, rebuilt if the registry has been replaced or altered directly """
+        if cls._indexed_registry is not cls._registry or cls._indexed_count != len(cls._registry):
+            cls._indexes = {index: dict() for index in cls._INDEXES}
+            for service in cls._registry:
+                cls._index_service(cls._indexes, service)
+            cls._indexed_registry = cls._registry
+            cls._indexed_count = len(cls._registry)
+        return cls._indexes
+
+    @classmethod
+    def _lookup(cls, index, value):
+        return cls._get_indexes()[index].get(value, [])
+
     @classmethod
     def all(cls):
         return cls._registry
@@ -210,7 +255,10 @@ class ServiceRegistry:
         services = cls._registry
         for k, v in kwargs.items():
             if v:
-                services = [s for s in cls._registry if getattr(s, k, None) == v]
+                if k in cls._FILTER_INDEXES:
+                    services = list(cls._lookup(k, v))
+                else:
+                    services = [s for s in cls._registry if getattr(s, k, None) == v]
         return services
 
     @classmethod
@@ -223,27 +271,23 @@ class ServiceRegistry:
     @classmethod
     def check_address_and_port(cls, address, port):
         # AND based check
-        # ugly hack! <Make filter to support AND | OR>
-        services = [s for s in cls._registry if getattr(s, "_address") == address and getattr(s, "_port") == port and getattr(s, "_status") != ServiceRecord.Status.Failed]
-        if len(services) == 0:
-            return False
-        return True
+        for s in cls._lookup('address_port', (address, port)):
+            if s._status != ServiceRecord.Status.Failed:
+                return True
+        return False
 
     @classmethod
     def check_address_and_mgt_port(cls, address, m_port):
         # AND based check
-        # ugly hack! <Make filter to support AND | OR>
-        services = [s for s in cls._registry if getattr(s, "_address") == address
-                    and getattr(s, "_management_port") == m_port and getattr(s, "_status") != ServiceRecord.Status.Failed]
-        if len(services) == 0:
-            return False
-        return True
+        for s in cls._lookup('address_management_port', (address, m_port)):
+            if s._status != ServiceRecord.Status.Failed:
+                return True
+        return False
 
     @classmethod
     def filter_by_name_and_type(cls, name, s_type):
         # AND based check
-        # ugly hack! <Make filter to support AND | OR>
-        services = [s for s in cls._registry if getattr(s, "_name") == name and getattr(s, "_type") == s_type]
+        services = [s for s in cls._lookup('_name', name) if s._type == s_type]
         if len(services) == 0:
             raise service_registry_exceptions.DoesNotExist
         return services
@@ -7,6 +7,8 @@
 """ Fledge user entity class with CRUD operations to Storage layer
 
 """
+import asyncio
+import time
 import uuid
 import hashlib
 from datetime import datetime, timedelta
@@ -31,6 +33,9 @@ JWT_ALGORITHM = 'HS256'
 JWT_EXP_DELTA_SECONDS = 30*60  # 30 minutes
 ERROR_MSG = 'Something went wrong'
 USED_PASSWORD_HISTORY_COUNT = 3
+TOKEN_CACHE_TTL_SECONDS = 60  # a verified token is checked against storage again after this time
+TOKEN_EXPIRY_FLUSH_SECONDS = 60  # token expiry refreshes of cached tokens are written together at this interval
+_TOKEN_CACHE_SWEEP_SIZE = 256
 
 _logger = logger.setup(__name__)
 
@@ -75,6 +80,104 @@ class User:
 
     class Objects:
 
+        _token_cache = dict()
+        """ token to (user, time the entry expires, user id) for tokens verified against storage """
+
+        _user_tokens = dict()
+        """ user id to the set of its cached tokens """
+
+        _role_ids_by_name = dict()
+        """ role name to the role rows, roles do not change at runtime """
+
+        _expiry_refresh_pending = set()
+        """ tokens used since their expiry was last written to storage """
+
+        _expiry_refresh_task = None
+
+        _cache_generation = 0
+        """ incremented whenever cached tokens are invalidated, a lookup started before that does not cache """
+
+        @classmethod
+        def _cache_token(cls, token, uid, user):
+            now = time.monotonic()
+            if len(cls._token_cache) >= _TOKEN_CACHE_SWEEP_SIZE:
+                for expired in [t for t, (_, expiry, _) in cls._token_cache.items() if expiry <= now]:
+                    cls._forget_token(expired)
+            cls._token_cache[token] = (user, now + TOKEN_CACHE_TTL_SECONDS, str(uid))
+            cls._user_tokens.setdefault(str(uid), set()).add(token)
+
+        @classmethod
+        def _forget_token(cls, token):
+            cls._expiry_refresh_pending.discard(token)
+            cached = cls._token_cache.pop(token, None)
+            if cached is not None:
+                tokens = cls._user_tokens.get(cached[2])
+                if tokens is not None:
+                    tokens.discard(token)
+                    if not tokens:
+                        del cls._user_tokens[cached[2]]
+
+        @classmethod
+        def invalidate_user_cache(cls, user_id):
+            """ Drops the cached tokens of a user, so that the next request with any of them reads storage again """
+            cls._cache_generation += 1
+            for token in cls._user_tokens.pop(str(user_id), set()):
+                cls._expiry_refresh_pending.discard(token)
+                cls._token_cache.pop(token, None)
+
+        @classmethod
+        def invalidate_token_cache(cls, token):
+            """ Drops a cached token, so that the next request with it reads storage again """
+            cls._cache_generation += 1
+            cls._forget_token(token)
+
+        @classmethod
+        def clear_cache(cls):
+            cls._cache_generation += 1
+            cls._token_cache.clear()
+            cls._user_tokens.clear()
+            cls._role_ids_by_name.clear()
+            cls._expiry_refresh_pending.clear()
+
+        @classmethod
+        async def get_user_for_token(cls, token):
+            """ Returns the user of a valid token and extends the token expiry
+
+            A token is verified against storage and its expiry written at once when it is not cached. For
+            TOKEN_CACHE_TTL_SECONDS after that the cached user is returned and the expiry refresh is written
+            behind, together with the other tokens in use. A token revoked while it is being verified is not cached.
+            """
+            cached = cls._token_cache.get(token)
+            if cached is not None and cached[1] > time.monotonic():
+                cls._queue_token_expiry_refresh(token)
+                return dict(cached[0])
+            generation = cls._cache_generation
+            uid = await cls.validate_token(token)
+            await cls.refresh_token_expiry(token)
+            user = await cls.get(uid=uid)
+            if generation == cls._cache_generation:
+                cls._cache_token(token, uid, dict(user))
+            return user
+
+        @classmethod
+        def _queue_token_expiry_refresh(cls, token):
+            cls._expiry_refresh_pending.add(token)
+            if cls._expiry_refresh_task is None:
+                cls._expiry_refresh_task = asyncio.ensure_future(cls._flush_token_expiry_refresh())
+
+        @classmethod
+        async def _flush_token_expiry_refresh(cls):
+            try:
+                await asyncio.sleep(TOKEN_EXPIRY_FLUSH_SECONDS)
+                tokens = sorted(cls._expiry_refresh_pending)
+                cls._expiry_refresh_pending.clear()
+                if tokens:
+                    await cls.refresh_tokens_expiry(tokens)
+            except Exception as ex:
+                _logger.error("Failed to refresh the expiry of tokens: {}".format(str(ex)))
+            finally:
+                cls._expiry_refresh_task = None
+
         @classmethod
         async def get_roles(cls):
             storage_client = connect.get_storage_async()
@@ -83,10 +186,15 @@ class User:
 
         @classmethod
         async def get_role_id_by_name(cls, name):
-            storage_client = connect.get_storage_async()
-            payload = PayloadBuilder().SELECT("id").WHERE(['name', '=', name]).payload()
-            result = await storage_client.query_tbl_with_payload('roles', payload)
-            return result["rows"]
+            try:
+                rows = cls._role_ids_by_name[name]
+            except KeyError:
+                storage_client = connect.get_storage_async()
+                payload = PayloadBuilder().SELECT("id").WHERE(['name', '=', name]).payload()
+                result = await storage_client.query_tbl_with_payload('roles', payload)
+                rows = result["rows"]
+                cls._role_ids_by_name[name] = rows
+            return [dict(row) for row in rows]
 
         @classmethod
         async def create(cls, username, password, role_id, access_method='any', real_name='', description=''):
@@ -181,6 +289,7 @@ class User:
                     ['enabled', '=', 't']).payload()
                 result = await storage_client.update_tbl("users", payload)
                 if result['rows_affected']:
+                    cls.invalidate_user_cache(user_id)
                     # FIXME: FOGL-1226 active session delete only in case of role_id and password updation
                     if 'password' in user_data or 'role_id' in user_data:
                         # delete all active sessions
@@ -264,6 +373,14 @@ class User:
                                                                             ).MODIFIER(["allowzero"]).payload()
             await storage_client.update_tbl("user_logins", payload)
 
+        @classmethod
+        async def refresh_tokens_expiry(cls, tokens):
+            storage_client = connect.get_storage_async()
+            exp = datetime.now() + timedelta(seconds=JWT_EXP_DELTA_SECONDS)
+            payload = PayloadBuilder().SET(token_expiration=str(exp)).WHERE(['token', 'in', tokens]
+                                                                            ).MODIFIER(["allowzero"]).payload()
+            await storage_client.update_tbl("user_logins", payload)
+
         @classmethod
         async def validate_token(cls, token):
             """ check existence and validity of token
@@ -403,6 +520,7 @@ class User:
 
         @classmethod
         async def delete_user_tokens(cls, user_id):
+            cls.invalidate_user_cache(user_id)
             storage_client = connect.get_storage_async()
             payload = PayloadBuilder().WHERE(['user_id', '=', user_id]).payload()
             try:
@@ -411,11 +529,15 @@ class User:
                 if not ex.error["retryable"]:
                     pass
                 raise ValueError(ERROR_MSG)
+            finally:
+                # a lookup may have verified a token against storage before it was deleted
+                cls.invalidate_user_cache(user_id)
 
             return res
 
         @classmethod
         async def delete_token(cls, token):
+            cls.invalidate_token_cache(token)
             storage_client = connect.get_storage_async()
             payload = PayloadBuilder().WHERE(['token', '=', token]).payload()
             try:
@@ -424,13 +546,28 @@ class User:
                 if not ex.error["retryable"]:
                     pass
                 raise ValueError(ERROR_MSG)
+            finally:
+                # a lookup may have verified the token against storage before it was deleted
+                cls.invalidate_token_cache(token)
 
             return res
 
         @classmethod
         async def delete_all_user_tokens(cls):
+            cls._forget_all_tokens()
             storage_client = connect.get_storage_async()
-            await storage_client.delete_from_tbl("user_logins")
+            try:
+                await storage_client.delete_from_tbl("user_logins")
+            finally:
+                # a lookup may have verified a token against storage before it was deleted
+                cls._forget_all_tokens()
+
+        @classmethod
+        def _forget_all_tokens(cls):
+            cls._cache_generation += 1
+            cls._token_cache.clear()
+            cls._user_tokens.clear()
+            cls._expiry_refresh_pending.clear()
 
         @classmethod
         def hash_password(cls, password):
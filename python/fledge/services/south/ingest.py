@@ -9,6 +9,7 @@
 import asyncio
 import datetime
 import time
+from collections import Counter
 from typing import List, Union
 import json
 
@@ -104,12 +105,27 @@ class Ingest(object):
 
     # Configuration (end)
 
-    _payload_events = []
-    """The list of unique reading payload for asset tracker"""
+    _asset_tracker_events = set()  # type: set
+    """(asset, event, service, plugin) tuples already registered, or queued for registration, with the asset tracker"""
+
+    _asset_tracker_queue = []  # type: List[tuple]
+    """Asset tracker events waiting to be registered with the core by :meth:`_register_asset_tracker_events`"""
+
+    _asset_tracker_queue_not_empty = None  # type: asyncio.Event
+    """Fired when an asset tracker event is queued"""
+
+    _asset_tracker_task = None  # type: asyncio.Task
+    """asyncio task for :meth:`_register_asset_tracker_events`"""
 
     stats = None
     """Statistics class instance"""
 
+    _statistics = None  # type: statistics.StatisticsAccumulator
+    """Accumulates the readings statistics and writes them to storage every _statistics_flush_interval_seconds"""
+
+    _statistics_flush_interval_seconds = 5
+    """Number of seconds between two writes of the readings statistics to storage"""
+
     @classmethod
     async def _read_config(cls):
         """Creates default values for the South configuration category and then reads all
@@ -158,6 +174,14 @@ class Ingest(object):
                 "type": "integer",
                 "default": str(cls._max_readings_insert_batch_reconnect_wait_seconds)
             },
+            "statistics_flush_interval_seconds": {
+                "description": "Number of seconds between two writes of the readings statistics to "
+                               "storage",
+                "displayName": "Statistics Flush Interval",
+                "type": "integer",
+                "default": str(cls._statistics_flush_interval_seconds),
+                "minimum": "1"
+            },
         }
 
         # Create configuration category and any new keys within it
@@ -191,8 +215,9 @@ class Ingest(object):
             ['value'])
         cls._max_readings_insert_batch_reconnect_wait_seconds = int(
             config['max_readings_insert_batch_reconnect_wait_seconds']['value'])
+        cls._statistics_flush_interval_seconds = int(config['statistics_flush_interval_seconds']['value'])
 
-        cls._payload_events = []
+        cls._asset_tracker_events = set()
 
     @classmethod
     async def start(cls, parent):
@@ -240,7 +265,11 @@ class Ingest(object):
         cls._insert_readings_task = asyncio.ensure_future(cls._insert_readings())
         cls._readings_lists_not_full = asyncio.Event()
 
-        cls._payload_events = cls._parent_service._core_microservice_management_client.get_asset_tracker_events()['track']
+        tracked = cls._parent_service._core_microservice_management_client.get_asset_tracker_events()['track']
+        cls._asset_tracker_events = {(t['asset'], t['event'], t['service'], t['plugin']) for t in tracked}
+        cls._asset_tracker_queue = []
+        cls._asset_tracker_queue_not_empty = asyncio.Event()
+        cls._asset_tracker_task = asyncio.ensure_future(cls._register_asset_tracker_events())
 
         cls.stats = await statistics.create_statistics(cls.storage_async)
 
@@ -249,6 +278,8 @@ class Ingest(object):
         await cls.stats.register('DISCARDED', 'Readings discarded at the input side by Fledge, i.e. '
                                               'discarded before being placed in the buffer. This may be due to some '
                                               'error in the readings themselves.')
+        cls._statistics = statistics.StatisticsAccumulator(cls.storage_async, cls._statistics_flush_interval_seconds)
+        cls._statistics.start()
 
         cls._stop = False
         cls._started = True
@@ -275,6 +306,27 @@ class Ingest(object):
         except Exception:
             _LOGGER.exception('An exception was raised by Ingest._insert_readings')
 
+        # Write the statistics still accumulated
+        if cls._statistics is not None:
+            try:
+                await cls._statistics.stop()
+            except Exception:
+                _LOGGER.exception('An error occurred while writing sensor statistics')
+            cls._statistics = None
+
+        # Let the asset tracker task register what is still queued, then exit
+        if cls._asset_tracker_task is not None:
+            cls._asset_tracker_queue_not_empty.set()
+            try:
+                await cls._asset_tracker_task
+            except Exception:
+                _LOGGER.exception('An exception was raised by Ingest._register_asset_tracker_events')
+            cls._asset_tracker_task = None
+            try:
+                await cls._parent_service._core_microservice_management_client.close_session()
+            except Exception:
+                _LOGGER.exception('Unable to close the session of the management client')
+
         cls._insert_readings_wait_tasks = None
         cls._insert_readings_tasks = None
         cls._readings_lists = None
@@ -357,7 +409,8 @@ class Ingest(object):
             while True:
                 try:
                     batch_size = len(readings_list)
-                    payload = json.dumps({"readings": readings_list[:batch_size]})
+                    # Handed over as a dict so that the storage client serializes it once, without a validating re-parse
+                    payload = {"readings": readings_list[:batch_size]}
                     # insert_start_time = time.time()
                     # _LOGGER.debug('Begin insert: Queue index: %s Batch size: %s', list_index, batch_size)
                     try:
@@ -404,35 +457,56 @@ class Ingest(object):
         _LOGGER.info('Insert readings loop stopped')
 
     @classmethod
-    async def _write_statistics(cls):
-        """Periodically commits collected readings statistics"""
+    async def _register_asset_tracker_events(cls):
+        """Registers queued asset tracker events with the core
+
+        Events queued by :meth:`add_readings` since the previous round are sent together, so that the
+        readings path never waits on the management API. Events that fail to register are forgotten
+        and hence queued again by the next reading of that asset.
+        """
+        while True:
+            await cls._asset_tracker_queue_not_empty.wait()
+            cls._asset_tracker_queue_not_empty.clear()
+
+            batch = cls._asset_tracker_queue
+            cls._asset_tracker_queue = []
+            if batch:
+                payloads = [{"asset": asset, "event": event, "service": service, "plugin": plugin}
+                            for asset, event, service, plugin in batch]
+                try:
+                    results = await cls._parent_service._core_microservice_management_client.\
+                        create_asset_tracker_events(payloads)
+                except Exception as ex:
+                    results = [ex] * len(batch)
+                failed = [event for event, result in zip(batch, results) if isinstance(result, Exception)]
+                if failed:
+                    cls._asset_tracker_events.difference_update(failed)
+                    _LOGGER.error('Unable to register %s of %s asset tracker events, first error: %s', len(failed),
+                                  len(batch), str(next(r for r in results if isinstance(r, Exception))))
+
+            if cls._stop:
+                break
 
-        updates = {}
+    @classmethod
+    async def _write_statistics(cls):
+        """Hands the collected readings statistics over to the statistics accumulator
 
+        The accumulator registers new sensor keys and writes all the statistics to storage
+        with a single bulk update every _statistics_flush_interval_seconds.
+        """
         readings = cls._readings_stats
         cls._readings_stats -= readings
-        updates.update({'READINGS': readings})
+        cls._statistics.increment('READINGS', readings)
 
         discarded_readings = cls._discarded_readings_stats
         cls._discarded_readings_stats -= discarded_readings
-        updates.update({'DISCARDED': discarded_readings})
+        cls._statistics.increment('DISCARDED', discarded_readings)
 
-        """ Register the statistics keys as this may be the first time the key has come into existence """
-        sensor_readings = cls._sensor_stats.copy()
-        for key in sensor_readings:
+        sensor_readings = cls._sensor_stats
+        cls._sensor_stats = {}
+        for key, value_increment in sensor_readings.items():
             description = 'Readings received by Fledge since startup for sensor {}'.format(key)
-            await cls.stats.register(key, description)
-            cls._sensor_stats[key] -= sensor_readings[key]
-            updates.update({key: sensor_readings[key]})
-
-        try:
-            await cls.stats.update_bulk(updates)
-        except Exception as ex:
-            cls._readings_stats += readings
-            cls._discarded_readings_stats += discarded_readings
-            for key in sensor_readings:
-                cls._sensor_stats[key] += sensor_readings[key]
-            _LOGGER.exception('An error occurred while writing sensor statistics, Error: %s', str(ex))
+            cls._statistics.increment(key, value_increment, description)
 
     @classmethod
     def is_available(cls) -> bool:
@@ -458,6 +532,108 @@ class Ingest(object):
         _LOGGER.warning('The ingest service is unavailable %s', list_index)
         return False
 
+    @classmethod
+    def _track_asset(cls, asset: str) -> None:
+        """Queues the Ingest asset tracker event of an asset, unless it is already known
+
+        Registration with the core is left to :meth:`_register_asset_tracker_events`
+        """
+        event = (asset, "Ingest", cls._parent_service._name,
+                 cls._parent_service._plugin_info['config']['plugin']['default'])
+        if event not in cls._asset_tracker_events:
+            cls._asset_tracker_events.add(event)
+            cls._asset_tracker_queue.append(event)
+            if cls._asset_tracker_queue_not_empty is not None:
+                cls._asset_tracker_queue_not_empty.set()
+
+    @classmethod
+    async def add_readings_bulk(cls, readings: List[dict]) -> int:
+        """Adds a list of asset readings records to Fledge in one step
+
+        Args:
+            readings: A list of readings records as returned by plugin_poll, each a dict with
+                'asset', 'timestamp' and 'readings' keys
+
+        Returns:
+            The number of readings placed in the buffers
+
+        Invalid readings records, and records that do not fit in the buffers, are discarded and
+        counted as such; unlike :meth:`add_readings` they do not cause an exception.
+
+        Raises:
+            RuntimeError:
+                The server was not started
+        """
+        if cls._stop:
+            _LOGGER.warning('The South Service is stopping')
+            return 0
+
+        if not cls._started:
+            raise RuntimeError('The South Service was not started')
+
+        batch = []
+        invalid = 0
+        for reading in readings:
+            try:
+                asset = reading['asset']
+                timestamp = reading['timestamp']
+                values = reading['readings']
+            except (KeyError, TypeError):
+                invalid += 1
+                continue
+            if values is None:
+                values = dict()
+            if not isinstance(asset, str) or timestamp is None or not isinstance(values, dict):
+                invalid += 1
+                continue
+            batch.append({'asset_code': asset, 'reading': values, 'user_ts': timestamp})
+        if invalid:
+            cls._discarded_readings_stats += invalid
+            _LOGGER.warning('Discarded %s invalid readings out of %s', invalid, len(readings))
+
+        added = 0
+        while added < len(batch):
+            # If an empty slot is not available, discard the remaining readings
+            if not cls.is_available():
+                cls._discarded_readings_stats += len(batch) - added
+                break
+
+            list_index = cls._current_readings_list_index
+            readings_list = cls._readings_lists[list_index]
+            list_size = len(readings_list)
+
+            # Fill the list up to the batch size first, so that the batch spreads over the lists as add_readings does
+            if cls._max_concurrent_readings_inserts > 1 and list_size < cls._readings_insert_batch_size:
+                room = cls._readings_insert_batch_size - list_size
+            else:
+                room = cls._readings_list_size - list_size
+            chunk = batch[added:added + room]
+            readings_list.extend(chunk)
+            added += len(chunk)
+
+            if list_size == 0:
+                cls._readings_list_not_empty[list_index].set()
+
+            list_size = len(readings_list)
+            if list_size >= cls._readings_insert_batch_size:
+                cls._readings_list_batch_size_reached[list_index].set()
+
+                # When the current list is full, move on to the next list
+                if cls._max_concurrent_readings_inserts > 1:
+                    for list_index in range(cls._max_concurrent_readings_inserts):
+                        if len(cls._readings_lists[list_index]) < cls._readings_insert_batch_size:
+                            cls._current_readings_list_index = list_index
+                            break
+
+        # Per asset statistics and asset tracking, once per asset in the batch
+        asset_counts = Counter(read['asset_code'] for read in batch[:added])
+        for asset, count in asset_counts.items():
+            key = asset.upper()
+            cls._sensor_stats[key] = cls._sensor_stats.get(key, 0) + count
+            cls._track_asset(asset)
+
+        return added
+
     @classmethod
     async def add_readings(cls, asset: str, timestamp: Union[str, datetime.datetime],
                            readings: dict = None) -> None:
@@ -532,12 +708,7 @@ class Ingest(object):
         else:
             cls._sensor_stats[asset.upper()] = 1
 
-        # asset tracker checking
-        payload = {"asset": asset, "event": "Ingest", "service": cls._parent_service._name,
-                   "plugin": cls._parent_service._plugin_info['config']['plugin']['default']}
-        if payload not in cls._payload_events:
-            cls._parent_service._core_microservice_management_client.create_asset_tracker_event(payload)
-            cls._payload_events.append(payload)
+        cls._track_asset(asset)
 
         # _LOGGER.debug('Add readings list index: %s size: %s', cls._current_readings_list_index, list_size)
 
@@ -9,6 +9,7 @@
 import json
 import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from fledge.services.south import exceptions
 from fledge.common import logger
 from fledge.services.south.ingest import Ingest
@@ -21,9 +22,9 @@ __license__ = "Apache 2.0"
 __version__ = "${VERSION}"
 
 _LOGGER = logger.setup(__name__)
-_MAX_RETRY_POLL = 3
 _TIME_TO_WAIT_BEFORE_RETRY = 1
 _CLEAR_PENDING_TASKS_TIMEOUT = 3
+_POLL_OVERRUN_WARNING_INTERVAL = 100
 
 
 class Server(FledgeMicroservice):
@@ -63,7 +64,15 @@ class Server(FledgeMicroservice):
 
     _event_loop = None
 
+    _poll_executor = None
+    """Single worker ThreadPoolExecutor running plugin_poll when polling in a worker thread is configured"""
+
+    _poll_future = None
+    """concurrent.futures.Future of the plugin_poll running in the worker thread"""
+
     def __init__(self):
+        self._poll_statistics = {'polls': 0, 'failures': 0, 'overruns': 0, 'skipped': 0, 'lastLatency': 0,
+                                 'maxLatency': 0, 'totalLatency': 0}
         super().__init__()
 
     async def _start(self, loop) -> None:
@@ -151,6 +160,7 @@ class Server(FledgeMicroservice):
             if self._plugin_info['mode'] == 'async':
                 self._task_main = asyncio.ensure_future(self._exec_plugin_async())
             elif self._plugin_info['mode'] == 'poll':
+                self._read_poll_config()
                 self._task_main = asyncio.ensure_future(self._exec_plugin_poll())
         except asyncio.CancelledError:
             pass
@@ -164,15 +174,23 @@ class Server(FledgeMicroservice):
 
     async def _exec_plugin_async(self) -> None:
         """Executes async type plugin
+
+        The plugin pushes its readings itself; it should hand over each batch it receives through
+        Ingest.add_readings_bulk rather than one Ingest.add_readings call per reading.
         """
         _LOGGER.info('Started South Plugin: {}'.format(self._name))
         self._plugin.plugin_start(self._plugin_handle)
 
     async def _exec_plugin_poll(self) -> None:
         """Executes poll type plugin
+
+        Polls are scheduled against fixed ticks of the poll interval, so that the time spent polling does not make
+        the schedule drift. Plugins are not re-entrant, so there is never more than one poll in flight: a poll still
+        running when its next tick is due is an overrun and the ticks it missed are skipped. A poll that fails is
+        retried one poll interval after the failure. With polling in a worker thread configured, plugin_poll runs in
+        that thread, keeping the event loop free for ingest, statistics and the management API meanwhile.
         """
         _LOGGER.info('Started South Plugin: {}'.format(self._name))
-        try_count = 1
 
         # pollInterval is expressed in milliseconds
         if int(self._plugin_handle['pollInterval']['value']) <= 0:
@@ -180,42 +198,114 @@ class Server(FledgeMicroservice):
             _LOGGER.warning('Plugin {} pollInterval must be greater than 0, defaulting to {} ms'.format(
                 self._name, self._plugin_handle['pollInterval']['value']))
         sleep_seconds = int(self._plugin_handle['pollInterval']['value']) / 1000.0
-        _TIME_TO_WAIT_BEFORE_RETRY = sleep_seconds
+        time_to_wait_before_retry = sleep_seconds
 
-        while self._plugin and try_count <= _MAX_RETRY_POLL:
+        next_poll = self._event_loop.time()
+        while self._plugin:
             try:
-                t1 = self._event_loop.time()
-                data = self._plugin.plugin_poll(self._plugin_handle)
-                if len(data) > 0:
-                    if isinstance(data, list):
-                        for reading in data:
-                            asyncio.ensure_future(Ingest.add_readings(asset=reading['asset'],
-                                                                        timestamp=reading['timestamp'],
-                                                                        readings=reading['readings']))
-                    elif isinstance(data, dict):
-                        asyncio.ensure_future(Ingest.add_readings(asset=data['asset'],
-                                                                  timestamp=data['timestamp'],
-                                                                  readings=data['readings']))
-                delta = self._event_loop.time() - t1
-                # If delta somehow becomes > sleep_seconds, then ignore delta
-                sleep_for = sleep_seconds - delta if delta < sleep_seconds else sleep_seconds
-                await asyncio.sleep(sleep_for)
+                polled = await self._poll_once()
+                now = self._event_loop.time()
+                if not polled:
+                    next_poll = now + time_to_wait_before_retry
+                else:
+                    next_poll += sleep_seconds
+                    if now > next_poll:
+                        missed = int((now - next_poll) / sleep_seconds) + 1
+                        next_poll += missed * sleep_seconds
+                        self._record_poll_overrun(missed)
+                await asyncio.sleep(next_poll - now)
             except asyncio.CancelledError:
-                pass
-            except KeyError as ex:
-                try_count = 2
-                _LOGGER.exception('Key error plugin {} : {}'.format(self._name, str(ex)))
-            except exceptions.QuietError:
-                try_count = 2
-                await asyncio.sleep(_TIME_TO_WAIT_BEFORE_RETRY)
-            except (Exception, RuntimeError, exceptions.DataRetrievalError) as ex:
-                try_count = 2
-                _LOGGER.error('Failed to poll for plugin {}'.format(self._name))
-                _LOGGER.debug('Exception poll plugin {}'.format(str(ex)))
-                await asyncio.sleep(_TIME_TO_WAIT_BEFORE_RETRY)
+                break
 
         _LOGGER.warning('Stopped all polling tasks for plugin: {}'.format(self._name))
 
+    async def _poll_once(self) -> bool:
+        """Runs one plugin_poll, on the event loop or in the poll thread, and hands its readings over to Ingest
+
+        Returns False if the poll failed
+        """
+        plugin = self._plugin
+        if plugin is None:
+            return False
+        t1 = self._event_loop.time()
+        try:
+            if self._poll_executor is None:
+                data = plugin.plugin_poll(self._plugin_handle)
+            else:
+                self._poll_future = self._poll_executor.submit(plugin.plugin_poll, self._plugin_handle)
+                data = await asyncio.wrap_future(self._poll_future)
+            self._record_poll_latency(self._event_loop.time() - t1)
+            if len(data) > 0:
+                if isinstance(data, list):
+                    await Ingest.add_readings_bulk(data)
+                elif isinstance(data, dict):
+                    await Ingest.add_readings_bulk([data])
+            return True
+        except asyncio.CancelledError:
+            raise
+        except KeyError as ex:
+            _LOGGER.exception('Key error plugin {} : {}'.format(self._name, str(ex)))
+        except exceptions.QuietError:
+            pass
+        except (Exception, RuntimeError, exceptions.DataRetrievalError) as ex:
+            _LOGGER.error('Failed to poll for plugin {}'.format(self._name))
+            _LOGGER.debug('Exception poll plugin {}'.format(str(ex)))
+        self._poll_statistics['failures'] += 1
+        return False
+
+    def _record_poll_latency(self, latency) -> None:
+        stats = self._poll_statistics
+        stats['polls'] += 1
+        stats['lastLatency'] = latency
+        stats['maxLatency'] = max(stats['maxLatency'], latency)
+        stats['totalLatency'] += latency
+
+    def _record_poll_overrun(self, missed) -> None:
+        stats = self._poll_statistics
+        # Warn on the first overrun and then once every _POLL_OVERRUN_WARNING_INTERVAL overruns
+        if stats['overruns'] % _POLL_OVERRUN_WARNING_INTERVAL == 0:
+            _LOGGER.warning('Plugin {} poll overrun, {} poll(s) skipped; last poll took {:.3f}s, {} overrun(s) '
+                            'so far'.format(self._name, missed, stats['lastLatency'], stats['overruns'] + 1))
+        stats['overruns'] += 1
+        stats['skipped'] += missed
+
+    def _read_poll_config(self) -> None:
+        """Creates and reads the poll in worker thread item of the advanced configuration category of the service"""
+        category = "{}Advanced".format(self._name)
+        default_config = {
+            "poll_in_thread": {
+                "description": "Run plugin_poll in a worker thread rather than on the service event loop",
+                "displayName": "Poll In Worker Thread",
+                "type": "boolean",
+                "default": "false"
+            }
+        }
+        config_payload = json.dumps({
+            "key": category,
+            "description": '{} South Service Ingest configuration'.format(self._name),
+            "value": default_config,
+            "keep_original_items": True
+        })
+        self._core_microservice_management_client.create_configuration_category(config_payload)
+        config = self._core_microservice_management_client.get_configuration_category(category_name=category)
+        if config['poll_in_thread']['value'] == 'true' and self._poll_executor is None:
+            self._poll_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='{}-poll'.format(self._name))
+
+    def _get_poll_statistics(self) -> dict:
+        stats = dict(self._poll_statistics)
+        total_latency = stats.pop('totalLatency')
+        stats['averageLatency'] = total_latency / stats['polls'] if stats['polls'] else 0
+        return stats
+
+    async def ping(self, request):
+        """ health check, with the poll statistics of poll type plugins """
+        response = await super().ping(request)
+        if self._plugin_info is not None and self._plugin_info.get('mode') == 'poll':
+            body = json.loads(response.text)
+            body['poll'] = self._get_poll_statistics()
+            response = web.json_response(body)
+        return response
+
     def run(self):
         """Starts the South Microservice
         """
@@ -225,6 +315,16 @@ class Server(FledgeMicroservice):
         loop.run_forever()
 
     async def _stop(self, loop):
+        if self._task_main is not None:
+            self._task_main.cancel()
+        # Let a poll running in the worker thread complete before the plugin is shut down
+        if self._poll_future is not None and not self._poll_future.done():
+            await asyncio.wait([asyncio.wrap_future(self._poll_future)], timeout=_CLEAR_PENDING_TASKS_TIMEOUT)
+        self._poll_future = None
+        if self._poll_executor is not None:
+            self._poll_executor.shutdown(wait=False)
+            self._poll_executor = None
+
         if self._plugin is not None:
             try:
                 self._plugin.plugin_shutdown(self._plugin_handle)
@@ -239,6 +339,7 @@ class Server(FledgeMicroservice):
         try:
             await Ingest.stop()
             _LOGGER.info('Stopped the Ingest server.')
+            await self.close_storage_sessions()
         except asyncio.CancelledError:
             pass
         except Exception as ex:
@@ -114,6 +114,26 @@ class InvalidCommandLineParameters(RuntimeError):
     pass
 
 
+_NON_UTC_WARNING_INTERVAL = 60
+""" Minimum time in seconds between two warnings about the same non-UTC timezone """
+_non_utc_warnings = {}
+""" For every non-UTC timezone found, the time of the last warning and the number of warnings suppressed since """
+
+
+def _warn_non_utc(zone):
+    """ Logs the non-UTC timezone warning, at most once every _NON_UTC_WARNING_INTERVAL seconds for each zone"""
+    now = time.monotonic()
+    last_warning = _non_utc_warnings.get(zone)
+    if last_warning is not None and now - last_warning[0] < _NON_UTC_WARNING_INTERVAL:
+        last_warning[1] += 1
+        return
+    suppressed = last_warning[1] if last_warning is not None else 0
+    _non_utc_warnings[zone] = [now, 0]
+    _LOGGER.warning("Non-UTC {} timezone is found. Hence no date conversion is done at the time being "
+                    "this routine expects UTC date time values{}".format(
+                        zone, "" if suppressed == 0 else " - {} similar warnings suppressed".format(suppressed)))
+
+
 def apply_date_format(in_data):
     """ This routine adds the UTC Zulu time to the input date time string
     a) Space in datetime string is replaced with "T"
@@ -134,6 +154,15 @@ def apply_date_format(in_data):
     Returns:
         the newly formatted datetime string
     """
+    # Fast path for the UTC timezones returned by the storage layer, when there is no '-' after the date
+    # the trailing +00 or +00:00 is the timezone found by the generic handling below
+    if in_data.endswith("+00:00"):
+        if in_data.find("-", 10) == -1:
+            return in_data[:-6].replace(" ", "T") + "Z"
+    elif in_data.endswith("+00"):
+        if in_data.find("-", 10) == -1:
+            return in_data[:-3].replace(" ", "T") + "Z"
+
     # Look for timezone start with '-' a the end of the date (-XY:WZ)
     zone_index = in_data.rfind("-")
     # If index is less than 10 we don't have the trailing zone with -
@@ -155,8 +184,7 @@ def apply_date_format(in_data):
         # Replace space with T (i.e b/w date & time) and UTC Zulu time
         timestamp = in_data[:zone_index].replace(" ", "T") + "Z"
         if in_data[zone_index:] not in ('+00', '+00:00'):
-            _LOGGER.warning("Non-UTC {} timezone is found. Hence no date conversion is done at the time being "
-                            "this routine expects UTC date time values".format(in_data[zone_index:]))
+            _warn_non_utc(in_data[zone_index:])
     return timestamp
 
 
@@ -211,6 +239,8 @@ class SendingProcess(FledgeProcess):
     """ Maximum number of increments for the sleep handling, the amount of time is doubled at every sleep """
     TASK_SEND_UPDATE_POSITION_MAX = 10
     """ the position is updated after the specified numbers of interactions of the sending task """
+    _PIPELINE_STAGES = ('fetch', 'transform', 'send')
+    """ Stages of the pipeline the data flows through """
     _PLUGIN_TYPE = "north"
     """Define the type of the plugin managed by the Sending Process"""
 
@@ -253,6 +283,14 @@ class SendingProcess(FledgeProcess):
             "default": "10",
             "order": "12",
             "displayName": "Memory Buffer Size"
+        },
+        "statisticsFlushInterval": {
+            "description": "Time in seconds between two writes of the sent readings statistics to storage",
+            "type": "integer",
+            "default": str(statistics.StatisticsAccumulator.DEFAULT_FLUSH_INTERVAL),
+            "minimum": "1",
+            "order": "13",
+            "displayName": "Statistics Flush Interval"
         }
     }
 
@@ -267,6 +305,7 @@ class SendingProcess(FledgeProcess):
             'blockSize': int(self._CONFIG_DEFAULT['blockSize']['default']),
             'sleepInterval': float(self._CONFIG_DEFAULT['sleepInterval']['default']),
             'memory_buffer_size': int(self._CONFIG_DEFAULT['memory_buffer_size']['default']),
+            'statisticsFlushInterval': int(self._CONFIG_DEFAULT['statisticsFlushInterval']['default']),
         }
         self._config_from_manager = ""
         self._module_template = "fledge.plugins.north." + "empty." + "empty"
@@ -279,6 +318,9 @@ class SendingProcess(FledgeProcess):
             'config': ""
         }
         self._plugin_handle = None
+        self._jqfilter = JQFilter()
+        self._filter_rule = None
+        """ JQ filter applied to the data, the compiled program is cached by JQFilter """
         self.statistics_key = None
         self._readings = None
         """" Interfaces to the Fledge Storage Layer """
@@ -288,20 +330,20 @@ class SendingProcess(FledgeProcess):
         """ Enable/Disable performance logging, enabled using a command line parameter"""
         self._debug_level = None
         """ Defines what and the level of details for logging """
-        self._task_fetch_data_run = True
-        self._task_send_data_run = True
-        """" The specific task will run until the value is True """
         self._task_fetch_data_task_id = None
+        self._task_transform_data_task_id = None
         self._task_send_data_task_id = None
-        """" Used to to managed the fetch/send operations """
-        self._task_fetch_data_sem = None
-        self._task_send_data_sem = None
-        """" Semaphores used for the synchronization of the fetch/send operations """
-        self._memory_buffer = [None]
-        """" In memory buffer where the data is loaded from the storage layer before to send it to the plugin """
-        self._memory_buffer_fetch_idx = 0
-        self._memory_buffer_send_idx = 0
-        """" Used to to managed the in memory buffer for the fetch/send operations """
+        """" Used to to managed the fetch/transform/send operations """
+        self._fetch_queue = None
+        """" Blocks of raw data prefetched from the storage layer, bounded by memory_buffer_size """
+        self._send_queue = None
+        """" Blocks of data transformed and ready to be sent by the plugin """
+        self._pipeline_stop = None
+        """" Set to terminate the fetch/transform/send operations """
+        self._stage_timings = {stage: {'blocks': 0, 'rows': 0, 'seconds': 0.0} for stage in self._PIPELINE_STAGES}
+        """" Time spent by each stage of the pipeline """
+        self._statistics = None
+        """" Accumulates the statistics of the data sent """
         self._event_loop = asyncio.get_event_loop() if loop is None else loop
 
     @staticmethod
@@ -319,16 +361,9 @@ class SendingProcess(FledgeProcess):
             process_memory = usage.ru_maxrss / 1000
 
     async def _update_statistics(self, num_sent):
-        """ Updates Fledge statistics"""
-        try:
-            key = self.statistics_key
-            _stats = await statistics.create_statistics(self._storage_async)
-            await _stats.update(key, num_sent)
-            await _stats.update(self.master_statistics_key, num_sent)
-        except Exception:
-            _message = _MESSAGES_LIST["e000010"]
-            SendingProcess._logger.error(_message)
-            raise
+        """ Updates Fledge statistics, the increments are written to storage by the statistics accumulator"""
+        self._statistics.increment(self.statistics_key, num_sent)
+        self._statistics.increment(self.master_statistics_key, num_sent)
 
     async def _last_object_id_update(self, new_last_object_id):
         """ Updates reached position"""
@@ -348,88 +383,132 @@ class SendingProcess(FledgeProcess):
         await self._update_statistics(tot_num_sent)
         await self._audit.information(self._AUDIT_CODE, {"sentRows": tot_num_sent})
 
+    def _record_stage_time(self, stage, started, rows):
+        """ Accumulates the time spent by a pipeline stage on a block of rows"""
+        timing = self._stage_timings[stage]
+        timing['blocks'] += 1
+        timing['rows'] += rows
+        timing['seconds'] += time.perf_counter() - started
+
+    def stage_timings(self):
+        """ Returns the per stage timings of the fetch/transform/send pipeline
+
+        Returns:
+            a dict keyed by stage name, each value holding the number of blocks and rows handled,
+            the total seconds spent and the average milliseconds per block
+        """
+        timings = {}
+        for stage, timing in self._stage_timings.items():
+            average = timing['seconds'] * 1000 / timing['blocks'] if timing['blocks'] else 0
+            timings[stage] = dict(timing, average_ms=round(average, 3))
+        return timings
+
+    async def _pipeline_wait(self, timeout):
+        """ Sleeps for up to timeout seconds, returning early as soon as the pipeline is stopped"""
+        try:
+            await asyncio.wait_for(self._pipeline_stop.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _next_block(self, queue):
+        """ Waits for the next block of data in the queue
+
+        Returns:
+            the block of data, or None if the pipeline has been stopped while waiting
+        """
+        if self._pipeline_stop.is_set():
+            return None
+        if not queue.empty():
+            return queue.get_nowait()
+        get_task = asyncio.ensure_future(queue.get())
+        stop_task = asyncio.ensure_future(self._pipeline_stop.wait())
+        try:
+            await asyncio.wait([get_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            pending = [task for task in (get_task, stop_task) if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return None if get_task.cancelled() else get_task.result()
+
     async def _task_send_data(self):
-        """ Sends the data from the in memory structure to the destination using the loaded plugin"""
-        data_sent = False
+        """ Pipeline stage 3: sends the transformed blocks to the destination using the loaded plugin"""
         db_update = False
         update_last_object_id = 0
         tot_num_sent = 0
         update_position_idx = 0
 
         try:
-            self._memory_buffer_send_idx = 0
             sleep_time = self.TASK_SEND_SLEEP
             sleep_num_increments = 1
 
-            while self._task_send_data_run:
-                slept = False
-                if self._memory_buffer_send_idx < self._config['memory_buffer_size']:
-                    new_last_object_id = None
-                    num_sent = 0
-                    if self._memory_buffer[self._memory_buffer_send_idx] is not None:  # if there are data to send
-                        try:
-                            data_sent, new_last_object_id, num_sent = \
-                                await self._plugin.plugin_send(self._plugin_handle,
-                                                               self._memory_buffer[self._memory_buffer_send_idx], self._stream_id)
-                        except Exception as ex:
-                            _message = _MESSAGES_LIST["e000021"].format(ex)
-                            SendingProcess._logger.error(_message)
-                            await self._audit.failure(self._AUDIT_CODE, {"error - on _task_send_data": _message})
-                            data_sent = False
-                            slept = True
-                            await asyncio.sleep(sleep_time)
-
-                        if data_sent:
-                            # asset tracker checking
-                            for _reads in self._memory_buffer[self._memory_buffer_send_idx]:
-                                payload = {"asset": _reads['asset_code'], "event": "Egress", "service": self._name,
-                                           "plugin": self._config['plugin']}
-                                if payload not in self._tracked_assets:
-                                    self._core_microservice_management_client.create_asset_tracker_event(
-                                        payload)
-                                    self._tracked_assets.append(payload)
-
-                            db_update = True
-                            update_last_object_id = new_last_object_id
-                            tot_num_sent = tot_num_sent + num_sent
-                            self._memory_buffer[self._memory_buffer_send_idx] = None
-                            self._memory_buffer_send_idx += 1
-                            self._task_send_data_sem.release()
-                            self.performance_track("task _task_send_data")
-                    else:
-                        # Updates the position before going to wait for the semaphore
-                        if db_update:
-                            await self._update_position_reached(update_last_object_id, tot_num_sent)
-                            update_position_idx = 0
-                            tot_num_sent = 0
-                            db_update = False
-                        await self._task_fetch_data_sem.acquire()
-
-                    # Updates the Storage layer every 'self.UPDATE_POSITION_MAX' interactions
-                    if db_update:
-                        if update_position_idx >= self.TASK_SEND_UPDATE_POSITION_MAX:
-                            await self._update_position_reached(update_last_object_id, tot_num_sent)
-                            update_position_idx = 0
-                            tot_num_sent = 0
-                            db_update = False
-                        else:
-                            update_position_idx += 1
-                else:
-                    self._memory_buffer_send_idx = 0
+            while True:
+                # Updates the position before going to wait for new data
+                if db_update and self._send_queue.empty():
+                    await self._update_position_reached(update_last_object_id, tot_num_sent)
+                    update_position_idx = 0
+                    tot_num_sent = 0
+                    db_update = False
+
+                data_to_send = await self._next_block(self._send_queue)
+                if data_to_send is None:
+                    break
 
-                # Handles the sleep time, it is doubled every time up to a limit
-                if slept:
+                # The block is retried until it is sent or the execution is terminated
+                data_sent = False
+                while not self._pipeline_stop.is_set():
+                    started = time.perf_counter()
+                    try:
+                        data_sent, new_last_object_id, num_sent = \
+                            await self._plugin.plugin_send(self._plugin_handle, data_to_send, self._stream_id)
+                    except Exception as ex:
+                        _message = _MESSAGES_LIST["e000021"].format(ex)
+                        SendingProcess._logger.error(_message)
+                        await self._audit.failure(self._AUDIT_CODE, {"error - on _task_send_data": _message})
+                        data_sent = False
+                    if data_sent:
+                        self._record_stage_time('send', started, num_sent)
+                        break
+
+                    # Handles the sleep time, it is doubled every time up to a limit
+                    await self._pipeline_wait(sleep_time)
                     sleep_num_increments += 1
                     sleep_time *= 2
                     if sleep_num_increments > self.TASK_SLEEP_MAX_INCREMENTS:
                         sleep_time = self.TASK_SEND_SLEEP
                         sleep_num_increments = 1
 
+                if not data_sent:
+                    break
+
+                # asset tracker checking
+                for _reads in data_to_send:
+                    payload = {"asset": _reads['asset_code'], "event": "Egress", "service": self._name,
+                               "plugin": self._config['plugin']}
+                    if payload not in self._tracked_assets:
+                        self._core_microservice_management_client.create_asset_tracker_event(payload)
+                        self._tracked_assets.append(payload)
+
+                db_update = True
+                update_last_object_id = new_last_object_id
+                tot_num_sent = tot_num_sent + num_sent
+                self.performance_track("task _task_send_data")
+
+                # Updates the Storage layer every 'self.UPDATE_POSITION_MAX' interactions
+                if update_position_idx >= self.TASK_SEND_UPDATE_POSITION_MAX:
+                    await self._update_position_reached(update_last_object_id, tot_num_sent)
+                    update_position_idx = 0
+                    tot_num_sent = 0
+                    db_update = False
+                else:
+                    update_position_idx += 1
+
             # Checks if the information on the Storage layer needs to be updates
             if db_update:
                 await self._update_position_reached(update_last_object_id, tot_num_sent)
         except Exception as ex:
-            SendingProcess._logger.error(_MESSAGES_LIST["e000021"].format(ex))
+            _message = _MESSAGES_LIST["e000021"].format(ex)
+            SendingProcess._logger.error(_message)
             if db_update:
                 await self._update_position_reached(update_last_object_id, tot_num_sent)
             await self._audit.failure(self._AUDIT_CODE, {"error - on _task_send_data": _message})
@@ -438,9 +517,14 @@ class SendingProcess(FledgeProcess):
     @staticmethod
     def _transform_in_memory_data_statistics(raw_data):
         converted_data = []
+        # The rows of a statistics history snapshot share the same timestamp, it is formatted once
+        timestamps = {}
         for row in raw_data:
             try:
-                timestamp = apply_date_format(row['history_ts'])  # Adds timezone UTC
+                history_ts = row['history_ts']
+                timestamp = timestamps.get(history_ts)
+                if timestamp is None:
+                    timestamp = timestamps[history_ts] = apply_date_format(history_ts)  # Adds timezone UTC
                 asset_code = row['key'].strip()
 
                 # Skips row having undefined asset_code
@@ -461,8 +545,7 @@ class SendingProcess(FledgeProcess):
         return converted_data
 
     async def _load_data_into_memory_statistics(self, last_object_id):
-        """ Extracts statistics data from the DB Layer, converts it into the proper format"""
-        raw_data = None
+        """ Extracts statistics data from the DB Layer"""
         try:
             payload = payload_builder.PayloadBuilder() \
                 .SELECT("id", "key", '{"column": "ts", "timezone": "UTC"}', "value", "history_ts") \
@@ -472,11 +555,10 @@ class SendingProcess(FledgeProcess):
                 .payload()
             statistics_history = await self._storage_async.query_tbl_with_payload('statistics_history', payload)
             raw_data = statistics_history['rows']
-            converted_data = self._transform_in_memory_data_statistics(raw_data)
         except Exception:
             SendingProcess._logger.error(_MESSAGES_LIST["e000009"])
             raise
-        return converted_data
+        return raw_data
 
     @staticmethod
     def _transform_in_memory_data_readings(raw_data):
@@ -488,18 +570,10 @@ class SendingProcess(FledgeProcess):
             so these rows will generate an exception and will be skipped.
         """
 
-        def recurse(reading_payload):
-            for k, v in reading_payload.items():
-                if isinstance(v, dict):
-                    for k1, v1 in v.items():
-                        if isinstance(v1, dict):
-                            reading_payload[k][k1] = plugin_common.convert_to_type(v1)
-                            recurse(v1)
-                else:
-                    reading_payload[k] = plugin_common.convert_to_type(v)
-            return reading_payload
-
+        convert_reading_types = plugin_common.convert_reading_types
         converted_data = []
+        # Readings of different assets often share the same timestamp, it is formatted once for each block
+        timestamps = {}
         for row in raw_data:
 
             try:
@@ -509,8 +583,11 @@ class SendingProcess(FledgeProcess):
                 # Skips row having undefined asset_code
                 if asset_code != "":
                     # Converts values to the proper types, for example "180.2" to float 180.2
-                    payload = recurse(row['reading'])
-                    timestamp = apply_date_format(row['user_ts'])  # Adds timezone UTC
+                    payload = convert_reading_types(row['reading'])
+                    user_ts = row['user_ts']
+                    timestamp = timestamps.get(user_ts)
+                    if timestamp is None:
+                        timestamp = timestamps[user_ts] = apply_date_format(user_ts)  # Adds timezone UTC
                     new_row = {
                         'id': row['id'],
                         'asset_code': asset_code,
@@ -527,34 +604,48 @@ class SendingProcess(FledgeProcess):
         return converted_data
 
     async def _load_data_into_memory_readings(self, last_object_id):
-        """ Extracts from the DB Layer data related to the readings loading into a memory structure"""
-        raw_data = None
-        converted_data = []
+        """ Extracts from the DB Layer data related to the readings"""
+        raw_data = []
         try:
             # Loads data, +1 as > is needed
             readings = await self._readings.fetch(last_object_id + 1, self._config['blockSize'])
             raw_data = readings['rows']
-            converted_data = self._transform_in_memory_data_readings(raw_data)
         except aiohttp.client_exceptions.ClientPayloadError as _ex:
             SendingProcess._logger.warning(_MESSAGES_LIST["e000009"].format(str(_ex)))
         except Exception as _ex:
             SendingProcess._logger.error(_MESSAGES_LIST["e000009"].format(str(_ex)))
             raise
-        return converted_data
+        return raw_data
 
     async def _load_data_into_memory(self, last_object_id):
-        """ Identifies the data source requested and call the appropriate handler"""
+        """ Identifies the data source requested and call the appropriate handler to load a block of raw data"""
         try:
             if self._config['source'] == 'readings':
-                data_to_send = await self._load_data_into_memory_readings(last_object_id)
+                raw_data = await self._load_data_into_memory_readings(last_object_id)
             elif self._config['source'] == 'statistics':
-                data_to_send = await self._load_data_into_memory_statistics(last_object_id)
+                raw_data = await self._load_data_into_memory_statistics(last_object_id)
             else:
                 SendingProcess._logger.error(_MESSAGES_LIST["e000008"])
                 raise UnknownDataSource
         except Exception:
             SendingProcess._logger.error(_MESSAGES_LIST["e000009"])
             raise
+        return raw_data
+
+    def _transform_data(self, raw_data):
+        """ Converts a block of raw data into the format expected by the plugin, applying the JQ filter if enabled"""
+        if self._config['source'] == 'readings':
+            data_to_send = self._transform_in_memory_data_readings(raw_data)
+        elif self._config['source'] == 'statistics':
+            data_to_send = self._transform_in_memory_data_statistics(raw_data)
+        else:
+            SendingProcess._logger.error(_MESSAGES_LIST["e000008"])
+            raise UnknownDataSource
+
+        if data_to_send and self._filter_rule is not None:
+            # Handles the JQFilter functionality, the first result of the filter is the block of data to send
+            filtered = self._jqfilter.transform(data_to_send, self._filter_rule)
+            data_to_send = filtered[0] if filtered else []
         return data_to_send
 
     async def _last_object_id_read(self):
@@ -575,85 +666,87 @@ class SendingProcess(FledgeProcess):
         return last_object_id
 
     async def _task_fetch_data(self):
-        """ Read data from the Storage Layer into a memory structure"""
+        """ Pipeline stage 1: reads blocks of raw data from the Storage Layer into the prefetch queue"""
         try:
             last_object_id = await self._last_object_id_read()
-            self._memory_buffer_fetch_idx = 0
             sleep_time = self.TASK_FETCH_SLEEP
             sleep_num_increments = 1
-            while self._task_fetch_data_run:
-                slept = False
-                if self._memory_buffer_fetch_idx < self._config['memory_buffer_size']:
-                    # Checks if there is enough space to load a new block of data
-                    if self._memory_buffer[self._memory_buffer_fetch_idx] is None:
-                        try:
-                            data_to_send = await self._load_data_into_memory(last_object_id)
-                        except Exception as ex:
-                            _message = _MESSAGES_LIST["e000028"].format(ex)
-                            SendingProcess._logger.error(_message)
-                            await self._audit.failure(self._AUDIT_CODE, {"error - on _task_fetch_data": _message})
-                            data_to_send = False
-                            slept = True
-                            await asyncio.sleep(sleep_time)
-                        if data_to_send:
-                            if 'applyFilter' in self._config_from_manager:
-                                # Handles the JQFilter functionality
-                                if self._config_from_manager['applyFilter']["value"].upper() == "TRUE":
-                                    jqfilter = JQFilter()
-                                    # Steps needed to proper format the data generated by the JQFilter
-                                    # to the one expected by the SP
-                                    if 'filterRule' in self._config_from_manager:
-                                        data_to_send_2 = jqfilter.transform(data_to_send,
-                                                                            self._config_from_manager['filterRule']["value"])
-                                        data_to_send_3 = json.dumps(data_to_send_2)
-                                        del data_to_send_2
-                                        data_to_send_4 = eval(data_to_send_3)
-                                        del data_to_send_3
-                                        data_to_send = data_to_send_4[0]
-                                        del data_to_send_4
-                                    else:
-                                        _LOGGER.warning("filterRule config item is missing to apply filter expression.")
-
-                            # Loads the block of data into the in memory buffer
-                            self._memory_buffer[self._memory_buffer_fetch_idx] = data_to_send
-                            last_position = len(data_to_send) - 1
-                            last_object_id = data_to_send[last_position]['id']
-                            self._memory_buffer_fetch_idx += 1
-                            self._task_fetch_data_sem.release()
-                            self.performance_track("task _task_fetch_data")
-                        else:
-                            # There is no more data to load
-                            slept = True
-                            await asyncio.sleep(sleep_time)
-                    else:
-                        # There is no more space in the in memory buffer
-                        await self._task_send_data_sem.acquire()
+            while not self._pipeline_stop.is_set():
+                started = time.perf_counter()
+                try:
+                    raw_data = await self._load_data_into_memory(last_object_id)
+                except Exception as ex:
+                    _message = _MESSAGES_LIST["e000028"].format(ex)
+                    SendingProcess._logger.error(_message)
+                    await self._audit.failure(self._AUDIT_CODE, {"error - on _task_fetch_data": _message})
+                    raw_data = None
+
+                if raw_data:
+                    self._record_stage_time('fetch', started, len(raw_data))
+                    # The position is advanced on the raw rows, the transformation could discard some of them
+                    last_object_id = raw_data[-1]['id']
+                    # Waits only if the prefetch queue is full, the transform stage wakes up on the new block
+                    await self._fetch_queue.put(raw_data)
+                    self.performance_track("task _task_fetch_data")
+                    sleep_time = self.TASK_FETCH_SLEEP
+                    sleep_num_increments = 1
                 else:
-                    self._memory_buffer_fetch_idx = 0
-                # Handles the sleep time, it is doubled every time up to a limit
-                if slept:
+                    # There is no more data to load or an error occurred,
+                    # handles the sleep time, it is doubled every time up to a limit
+                    await self._pipeline_wait(sleep_time)
                     sleep_num_increments += 1
                     sleep_time *= 2
                     if sleep_num_increments > self.TASK_SLEEP_MAX_INCREMENTS:
                         sleep_time = self.TASK_FETCH_SLEEP
                         sleep_num_increments = 1
+        except asyncio.CancelledError:
+            raise
         except Exception as ex:
             _message = _MESSAGES_LIST["e000028"].format(ex)
             SendingProcess._logger.error(_message)
             await self._audit.failure(self._AUDIT_CODE, {"error - on _task_fetch_data": _message})
             raise
 
+    async def _task_transform_data(self):
+        """ Pipeline stage 2: converts the fetched blocks in the format expected by the plugin"""
+        while True:
+            raw_data = await self._next_block(self._fetch_queue)
+            if raw_data is None:
+                break
+            started = time.perf_counter()
+            try:
+                data_to_send = self._transform_data(raw_data)
+            except Exception as ex:
+                _message = _MESSAGES_LIST["e000009"].format(ex)
+                SendingProcess._logger.error(_message)
+                await self._audit.failure(self._AUDIT_CODE, {"error - on _task_transform_data": _message})
+                # The fetch stage has already moved past the block: the pipeline is stopped, so that no later
+                # block is sent and the position stored stays before the failed block, which the next execution
+                # loads again
+                self._pipeline_stop.set()
+                break
+            self._record_stage_time('transform', started, len(raw_data))
+            if data_to_send:
+                await self._send_queue.put(data_to_send)
+
     async def send_data(self):
-        """ Handles the sending of the data to the destination using the configured plugin for a defined amount of time"""
+        """ Handles the sending of the data to the destination using the configured plugin for a defined amount of time
 
-        # Prepares the in memory buffer for the fetch/send operations
-        self._memory_buffer = [None for _ in range(self._config['memory_buffer_size'])]
-        self._task_fetch_data_sem = asyncio.Semaphore(0)
-        self._task_send_data_sem = asyncio.Semaphore(0)
+        The data flows through a three stages pipeline, fetch -> transform -> send, connected by bounded queues:
+        up to 'memory_buffer_size' blocks are prefetched from the Storage Layer while the plugin is sending.
+        """
+
+        # Prepares the queues for the fetch/transform/send stages
+        self._fetch_queue = asyncio.Queue(maxsize=max(1, self._config['memory_buffer_size']))
+        self._send_queue = asyncio.Queue(maxsize=1)
+        self._pipeline_stop = asyncio.Event()
+        self._stage_timings = {stage: {'blocks': 0, 'rows': 0, 'seconds': 0.0} for stage in self._PIPELINE_STAGES}
+        self._statistics = statistics.StatisticsAccumulator(self._storage_async,
+                                                            self._config['statisticsFlushInterval'])
+        self._statistics.start()
         self._task_fetch_data_task_id = asyncio.ensure_future(self._task_fetch_data())
+        self._task_transform_data_task_id = asyncio.ensure_future(self._task_transform_data())
         self._task_send_data_task_id = asyncio.ensure_future(self._task_send_data())
-        self._task_fetch_data_run = True
-        self._task_send_data_run = True
 
         try:
             start_time = time.time()
@@ -664,7 +757,9 @@ class SendingProcess(FledgeProcess):
                     SendingProcess._logger.info("{func} - signal received, stops the execution".format(
                         func="send_data"))
                     break
-                # Context switch to either the fetch or the send operation
+                # Terminates the execution in case a stage has stopped the pipeline
+                if self._pipeline_stop.is_set():
+                    break
                 await asyncio.sleep(self._config['sleepInterval'])
                 elapsed_seconds = time.time() - start_time
                 SendingProcess._logger.debug("{0} - elapsed_seconds {1}".format("send_data", elapsed_seconds))
@@ -674,17 +769,26 @@ class SendingProcess(FledgeProcess):
             await self._audit.failure(self._AUDIT_CODE, {"error - on send_data": _message})
 
         try:
-            # Graceful termination of the tasks
-            self._task_fetch_data_run = False
-            self._task_send_data_run = False
-            # Unblocks the task if it is waiting
-            self._task_fetch_data_sem.release()
-            self._task_send_data_sem.release()
-            await self._task_fetch_data_task_id
-            await self._task_send_data_task_id
+            # Graceful termination of the stages, the send stage completes the block in progress
+            # and updates the position reached, prefetched blocks are loaded again by the next execution
+            self._pipeline_stop.set()
+            self._task_fetch_data_task_id.cancel()
+            self._task_transform_data_task_id.cancel()
+            results = await asyncio.gather(self._task_fetch_data_task_id, self._task_transform_data_task_id,
+                                           self._task_send_data_task_id, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                    SendingProcess._logger.error(_MESSAGES_LIST["e000029"].format(result))
         except Exception as ex:
             SendingProcess._logger.error(_MESSAGES_LIST["e000029"].format(ex))
 
+        try:
+            await self._statistics.stop()
+        except Exception:
+            SendingProcess._logger.error(_MESSAGES_LIST["e000010"])
+
+        SendingProcess._logger.info("Pipeline timings |{}|".format(self.stage_timings()))
+
     async def _get_stream_id(self, config_stream_id):
         async def get_rows_from_stream_id(stream_id):
             payload = payload_builder.PayloadBuilder() \
@@ -875,6 +979,7 @@ class SendingProcess(FledgeProcess):
                 self._config['plugin'] = _config_from_manager['plugin']['value']
 
             self._config['memory_buffer_size'] = int(_config_from_manager['memory_buffer_size']['value'])
+            self._config['statisticsFlushInterval'] = int(_config_from_manager['statisticsFlushInterval']['value'])
             _config_from_manager['_CONFIG_CATEGORY_NAME'] = cat_name
 
             if 'stream_id' in _config_from_manager:
@@ -884,10 +989,21 @@ class SendingProcess(FledgeProcess):
                 self._config["stream_id"] = 0
 
             self._config_from_manager = _config_from_manager
+            self._set_filter_rule(_config_from_manager)
         except Exception:
             SendingProcess._logger.error(_MESSAGES_LIST["e000003"])
             raise
 
+    def _set_filter_rule(self, config):
+        """ Sets the JQ filter rule to apply to the data, None if the filter is not enabled"""
+        filter_rule = None
+        if 'applyFilter' in config and config['applyFilter']["value"].upper() == "TRUE":
+            if 'filterRule' in config:
+                filter_rule = config['filterRule']["value"]
+            else:
+                _LOGGER.warning("filterRule config item is missing to apply filter expression.")
+        self._filter_rule = filter_rule
+
     async def _start(self):
         """ Setup the correct state for the Sending Process"""
         exec_sending_process = False
@@ -1007,6 +1123,8 @@ class SendingProcess(FledgeProcess):
                 if is_started:
                     await self.send_data()
                 self.stop()
+                await self._storage_async.close_session()
+                await self._readings.close_session()
                 SendingProcess._logger.info("Execution completed.")
                 sys.exit(0)
             except (ValueError, Exception) as ex:
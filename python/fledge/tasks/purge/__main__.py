@@ -21,3 +21,4 @@ if __name__ == '__main__':
     loop = asyncio.get_event_loop()
     purge_process = Purge()
     loop.run_until_complete(purge_process.run())
+    loop.run_until_complete(purge_process.close_storage_sessions())
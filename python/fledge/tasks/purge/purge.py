@@ -98,9 +98,10 @@ class Purge(FledgeProcess):
         self._audit = AuditLogger(self._storage_async)
 
     async def write_statistics(self, total_purged, unsent_purged):
-        stats = await statistics.create_statistics(self._storage_async)
-        await stats.update('PURGED', total_purged)
-        await stats.update('UNSNPURGED', unsent_purged)
+        stats = statistics.StatisticsAccumulator(self._storage_async)
+        stats.increment('PURGED', total_purged)
+        stats.increment('UNSNPURGED', unsent_purged)
+        await stats.flush()
 
     async def set_configuration(self):
         """" set the default configuration for purge
@@ -12,7 +12,7 @@ stores the delta value (statistics.value - statistics.previous_value) in the sta
 """
 import json
 
-from fledge.common.storage_client.payload_builder import PayloadBuilder
+from fledge.common.storage_client.exceptions import StorageServerError
 from fledge.common import logger
 from fledge.common.process import FledgeProcess
 from fledge.common import utils as common_utils
@@ -32,25 +32,21 @@ class StatisticsHistory(FledgeProcess):
         self._logger = logger.setup("StatisticsHistory")
 
     async def _bulk_update_previous_value(self, payload):
-        """ UPDATE previous_value of column to have the same value as snapshot
-    
-        Query: 
-            UPDATE statistics_history SET previous_value = value WHERE key = key
+        """ UPDATE previous_value of statistics by the delta stored in the snapshot
+
+        Query:
+            UPDATE statistics SET previous_value = previous_value + delta WHERE key = key
         Args:
            payload: dict containing statistics keys and previous values
         """
         await self._storage_async.update_tbl("statistics", json.dumps(payload, sort_keys=False))
 
-    async def run(self):
-        """ SELECT against the statistics table, to get a snapshot of the data at that moment.
-    
-        Based on the snapshot:
-            1. INSERT the delta between `value` and `previous_value` into  statistics_history
-            2. UPDATE the previous_value in statistics table to be equal to statistics.value at snapshot 
+    async def _client_side_snapshot(self, current_time):
+        """ Snapshot done by the task for storage plugins without statistics snapshot support
+
+        previous_value is rolled forward by the delta recorded in statistics_history rather than set to the value
+        read, so increments made between the SELECT and the UPDATE are kept for the next run.
         """
-        if self.is_dry_run():
-            return
-        current_time = common_utils.local_timestamp()
         results = await self._storage_async.query_tbl("statistics")
         # Bulk updates payload
         payload = {"updates": []}
@@ -58,15 +54,32 @@ class StatisticsHistory(FledgeProcess):
         insert_payload = {"inserts": []}
         for r in results['rows']:
             key = r['key']
-            value = int(r["value"])
-            previous_value = int(r["previous_value"])
-            delta = value - previous_value
-            payload_item = PayloadBuilder().SET(previous_value=value).WHERE(["key", "=", key]).payload()
-            # Add element to bulk updates
-            payload['updates'].append(json.loads(payload_item))
-            # Add element to bulk inserts
+            delta = int(r["value"]) - int(r["previous_value"])
+            if delta:
+                payload['updates'].append({"expressions": [{"column": "previous_value", "operator": "+",
+                                                            "value": delta}],
+                                           "where": {"column": "key", "condition": "=", "value": key}})
             insert_payload['inserts'].append({'key': key, 'value': delta, 'history_ts': current_time})
         # Bulk inserts
         await self._storage_async.insert_into_tbl("statistics_history", json.dumps(insert_payload))
         # Bulk updates
-        await self._bulk_update_previous_value(payload)
+        if payload['updates']:
+            await self._bulk_update_previous_value(payload)
+
+    async def run(self):
+        """ Snapshot the statistics table into statistics_history
+
+        The storage service, in a single transaction:
+            1. INSERTs the delta between `value` and `previous_value` into statistics_history
+            2. UPDATEs the previous_value in statistics table to be equal to statistics.value
+        """
+        if self.is_dry_run():
+            return
+        current_time = common_utils.local_timestamp()
+        try:
+            await self._storage_async.statistics_snapshot(current_time)
+        except StorageServerError as ex:
+            if ex.code != 404:
+                raise
+            self._logger.debug("Storage plugin does not support statistics snapshots, snapshot done by the task")
+            await self._client_side_snapshot(current_time)
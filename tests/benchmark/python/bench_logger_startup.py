@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Benchmark the import time of each Python entry point with the process name lookup of logger.setup
+
+The *before* figures reproduce the previous logger.setup, which ran a ps | grep | awk | tr shell pipeline on every call
+to find the process name. Each measurement is a fresh interpreter started with a --name argument, as the scheduler
+starts tasks and services, that imports the module of the entry point and reports the import time and the number of
+loggers set up.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+ENTRY_POINTS = (
+    ("core", "fledge.services.core.server"),
+    ("south", "fledge.services.south.server"),
+    ("purge", "fledge.tasks.purge.purge"),
+    ("statistics", "fledge.tasks.statistics.statistics_history"),
+    ("north", "fledge.tasks.north.sending_process"),
+)
+
+CHILD = """
+import importlib, os, subprocess, sys, time
+start = time.perf_counter()
+from fledge.common import logger
+if sys.argv[2] == 'before':
+    def _get_process_name():
+        pid = os.getpid()
+        cmd = "ps -eaf | grep {} | grep -v grep | awk -F '--name=' '{{print $2}}'| tr -d '\\\\n'".format(pid)
+        read_process_name = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE).stdout.readlines()
+        binary_to_string = [b.decode() for b in read_process_name]
+        return 'Fledge ' + binary_to_string[0] if binary_to_string else 'Fledge'
+    logger._get_process_name = _get_process_name
+calls = []
+setup = logger.setup
+logger.setup = lambda *args, **kwargs: calls.append(args) or setup(*args, **kwargs)
+importlib.import_module(sys.argv[1])
+print(time.perf_counter() - start, len(calls))
+"""
+
+
+def measure(module, mode, runs):
+    env = dict(os.environ)
+    # Console logging, so that the benchmark does not depend on a syslog daemon
+    env['FLEDGE_LOGS_DESTINATION'] = '1'
+    timings = []
+    loggers = 0
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', CHILD, module, mode, '--name=bench'], env=env, check=True,
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout.decode().split()
+        timings.append(float(out[0]))
+        loggers = int(out[1])
+    return min(timings), loggers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="interpreters to start per entry point, the best is kept")
+    args = parser.parse_args()
+    print("{:<12}{:>10}{:>20}{:>20}".format("entry point", "loggers", "ps per logger", "resolved once"))
+    for label, module in ENTRY_POINTS:
+        before, loggers = measure(module, 'before', args.runs)
+        after, _ = measure(module, 'after', args.runs)
+        print("{:<12}{:>10}{:>18.0f} ms{:>18.0f} ms".format(label, loggers, before * 1000, after * 1000))
+
+
+if __name__ == '__main__':
+    main()
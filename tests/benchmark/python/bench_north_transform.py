@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Micro-benchmark of the reading type conversion of the north sending process
+
+The *before* figures reproduce the previous SendingProcess._transform_in_memory_data_readings conversion, which
+called convert_to_type on every datapoint, against convert_reading_types. Every suite converts a fresh copy of a
+block of readings, the whole block transform (timestamps included) is measured as well.
+"""
+
+import argparse
+import copy
+import time
+
+import fledge.plugins.north.common.common as plugin_common
+from fledge.tasks.north.sending_process import SendingProcess
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+
+def legacy_convert(reading_payload):
+    """ The previous conversion of SendingProcess._transform_in_memory_data_readings """
+    for k, v in reading_payload.items():
+        if isinstance(v, dict):
+            for k1, v1 in v.items():
+                if isinstance(v1, dict):
+                    reading_payload[k][k1] = plugin_common.convert_to_type(v1)
+                    legacy_convert(v1)
+        else:
+            reading_payload[k] = plugin_common.convert_to_type(v)
+    return reading_payload
+
+
+SUITES = {
+    "numeric": lambda i: {"x": i, "y": i * 0.5, "z": -i, "temperature": 21.5 + i % 10},
+    "numeric strings": lambda i: {"x": str(i), "y": str(i * 0.5), "z": str(-i), "temperature": "21.5"},
+    "strings": lambda i: {"status": "up", "tick": "tock", "label": "sensor {}".format(i % 10)},
+    "mixed": lambda i: {"x": i, "y": str(i * 0.5), "status": "up", "on": True, "nested": {"a": {"b": "1"}}},
+}
+
+
+def block(reading, size):
+    return [{'id': i, 'asset_code': 'bench', 'reading': reading(i), 'user_ts': '2026-01-01 00:00:00.123456+00'}
+            for i in range(size)]
+
+
+def measure(func, rows, repeat):
+    best = None
+    for _ in range(repeat):
+        rows_copy = copy.deepcopy(rows)
+        start = time.perf_counter()
+        func(rows_copy)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def convert_before(rows):
+    for row in rows:
+        legacy_convert(row['reading'])
+
+
+def convert_after(rows):
+    for row in rows:
+        plugin_common.convert_reading_types(row['reading'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--block-size", type=int, default=5000, help="readings in a block")
+    parser.add_argument("--repeat", type=int, default=7, help="runs of every suite, the best one is reported")
+    args = parser.parse_args()
+    print("{:<18}{:>16}{:>16}{:>10}{:>18}".format("suite", "before ms", "after ms", "speedup", "transform ms"))
+    for name, reading in SUITES.items():
+        rows = block(reading, args.block_size)
+        before = measure(convert_before, rows, args.repeat)
+        after = measure(convert_after, rows, args.repeat)
+        transform = measure(SendingProcess._transform_in_memory_data_readings, rows, args.repeat)
+        print("{:<18}{:>16.2f}{:>16.2f}{:>9.1f}x{:>18.2f}".format(name, before * 1000, after * 1000, before / after,
+                                                                 transform * 1000))
+
+
+if __name__ == '__main__':
+    main()
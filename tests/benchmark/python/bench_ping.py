@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Benchmark the statistics and host details gathered by GET /fledge/ping
+
+The *before* figures reproduce the previous behaviour, which ran hostname -I in a subprocess and read the statistics
+from storage on every ping. Storage is an in-process stub that answers after a configurable round trip time and counts
+the calls. Pings are issued in bursts, as several GUI sessions and a load balancer would.
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import time
+
+from aiohttp.test_utils import make_mocked_request
+
+from fledge.services.core import connect
+from fledge.services.core.api import common
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+
+class StubStorage(object):
+    """ Answers the statistics query """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+
+    async def query_tbl_with_payload(self, tbl_name, payload):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return {'rows': [{'key': 'READINGS', 'description': '', 'value': 100},
+                         {'key': 'Readings Sent', 'description': '', 'value': 90},
+                         {'key': 'PURGED', 'description': '', 'value': 10}]}
+
+
+async def ping_before(request):
+    """ The previous statistics and host details of ping """
+    data = await common.get_stats(request.clone(rel_url='fledge/statistics'))
+    host_name = socket.gethostname()
+    all_ip_addresses_cmd_res = subprocess.run(['hostname', '-I'], stdout=subprocess.PIPE)
+    ip_addresses = all_ip_addresses_cmd_res.stdout.decode('utf-8').replace("\n", "").strip().split(" ")
+    return data, host_name, ip_addresses
+
+
+async def ping_after(request):
+    return await common._get_stats_snapshot(request), await common._get_host_details()
+
+
+async def run(bursts, burst_size, latency):
+    storage = StubStorage(latency)
+    connect.get_storage_async = lambda: storage
+    request = make_mocked_request('GET', '/fledge/ping')
+    results = []
+    for label, ping in (("subprocess and storage (before)", ping_before), ("cached (after)", ping_after)):
+        storage.calls = 0
+        start = time.perf_counter()
+        for _ in range(bursts):
+            await asyncio.gather(*[ping(request) for _ in range(burst_size)])
+        elapsed = time.perf_counter() - start
+        pings = bursts * burst_size
+        results.append((label, elapsed / pings, storage.calls / pings))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bursts", type=int, default=50, help="bursts of concurrent pings")
+    parser.add_argument("--burst-size", type=int, default=10, help="concurrent pings in a burst")
+    parser.add_argument("--storage-latency", type=float, default=0.5, help="storage round trip in milliseconds")
+    args = parser.parse_args()
+    results = asyncio.get_event_loop().run_until_complete(
+        run(args.bursts, args.burst_size, args.storage_latency / 1000))
+    print("{:<36}{:>16}{:>24}".format("mode", "us per ping", "storage calls/ping"))
+    for label, per_ping, calls in results:
+        print("{:<36}{:>16.1f}{:>24.3f}".format(label, per_ping * 1000000, calls))
+
+
+if __name__ == '__main__':
+    main()
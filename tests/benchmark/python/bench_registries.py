@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Benchmark ServiceRegistry and InterestRegistry lookups: list scans against dict indexes
+
+The *before* figures reproduce the previous lookups, which were list comprehensions over every registered service or
+interest. Both registries are filled directly, without notifying the configuration manager.
+"""
+
+import argparse
+import random
+import time
+import uuid
+from unittest.mock import MagicMock
+
+from fledge.common.configuration_manager import ConfigurationManager
+from fledge.common.service_record import ServiceRecord
+from fledge.services.core.interest_registry.interest_record import InterestRecord
+from fledge.services.core.interest_registry.interest_registry import InterestRegistry, InterestRegistrySingleton
+from fledge.services.core.service_registry.service_registry import ServiceRegistry
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+SERVICE_TYPES = ("Southbound", "Northbound", "Notification", "Dispatcher")
+
+
+def scan_filter(**kwargs):
+    """ The previous ServiceRegistry.filter """
+    services = ServiceRegistry._registry
+    for k, v in kwargs.items():
+        if v:
+            services = [s for s in ServiceRegistry._registry if getattr(s, k, None) == v]
+    return services
+
+
+def scan_check_address_and_port(address, port):
+    """ The previous ServiceRegistry.check_address_and_port """
+    services = [s for s in ServiceRegistry._registry if getattr(s, "_address") == address and
+                getattr(s, "_port") == port and getattr(s, "_status") != ServiceRecord.Status.Failed]
+    return len(services) != 0
+
+
+def scan_filter_by_name_and_type(name, s_type):
+    """ The previous ServiceRegistry.filter_by_name_and_type """
+    return [s for s in ServiceRegistry._registry if getattr(s, "_name") == name and getattr(s, "_type") == s_type]
+
+
+def scan_and_filter(i_reg, **kwargs):
+    """ The previous InterestRegistry.and_filter """
+    return [s for s in i_reg._registered_interests
+            if all(getattr(s, k, None) == v for k, v in kwargs.items() if v is not None)]
+
+
+def setup(services, interests):
+    ServiceRegistry._registry = [ServiceRecord(str(uuid.uuid4()), "service{}".format(i), SERVICE_TYPES[i % 4], "http",
+                                               "127.0.0.1", 10000 + i, 20000 + i) for i in range(services)]
+    InterestRegistrySingleton._shared_state = {}
+    i_reg = InterestRegistry(MagicMock(spec=ConfigurationManager))
+    i_reg._registered_interests.extend(
+        InterestRecord(str(uuid.uuid4()), ServiceRegistry._registry[i % services]._id, "category{}".format(i))
+        for i in range(interests))
+    return i_reg
+
+
+def measure(lookup, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        lookup()
+    return (time.perf_counter() - start) / calls
+
+
+def run(services, interests, calls):
+    random.seed(services)
+    i_reg = setup(services, interests)
+    service = random.choice(ServiceRegistry._registry)
+    interest = random.choice(i_reg._registered_interests)
+    cases = (
+        ("ServiceRegistry.get(idx)",
+         lambda: scan_filter(_id=service._id), lambda: ServiceRegistry.get(idx=service._id)),
+        ("ServiceRegistry.get(name)",
+         lambda: scan_filter(_name=service._name), lambda: ServiceRegistry.get(name=service._name)),
+        ("check_address_and_port",
+         lambda: scan_check_address_and_port(service._address, service._port),
+         lambda: ServiceRegistry.check_address_and_port(service._address, service._port)),
+        ("filter_by_name_and_type",
+         lambda: scan_filter_by_name_and_type(service._name, service._type),
+         lambda: ServiceRegistry.filter_by_name_and_type(service._name, service._type)),
+        ("InterestRegistry.get(category)",
+         lambda: scan_and_filter(i_reg, _category_name=interest._category_name),
+         lambda: i_reg.get(category_name=interest._category_name)),
+        ("InterestRegistry.get(uuid)",
+         lambda: scan_and_filter(i_reg, _microservice_uuid=interest._microservice_uuid),
+         lambda: i_reg.get(microservice_uuid=interest._microservice_uuid)),
+    )
+    results = []
+    for label, before, after in cases:
+        assert before() == after()
+        results.append((label, measure(before, calls), measure(after, calls)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--services", type=int, default=1000, help="number of registered services")
+    parser.add_argument("--interests", type=int, default=10000, help="number of registered interests")
+    parser.add_argument("--calls", type=int, default=200, help="calls to average each lookup over")
+    args = parser.parse_args()
+    results = run(args.services, args.interests, args.calls)
+    print("{:<32}{:>20}{:>20}".format("lookup", "list scan (before)", "indexed (after)"))
+    for label, before, after in results:
+        print("{:<32}{:>17.1f} us{:>17.1f} us".format(label, before * 1000000, after * 1000000))
+
+
+if __name__ == '__main__':
+    main()
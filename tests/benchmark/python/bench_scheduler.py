@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Benchmark Scheduler wake-ups with many schedules: full scan of the schedule executions against the timer queue
+
+The *before* figures reproduce the previous Scheduler._check_schedules, which visited every schedule execution on each
+wake-up to find the due ones and the earliest next start time. Task processes are not started: _start_task is replaced
+by a coroutine that returns at once, so only the cost of deciding what to start is measured.
+"""
+
+import argparse
+import asyncio
+import datetime
+import logging
+import random
+import time
+import uuid
+
+from fledge.services.core.scheduler.entities import Schedule
+from fledge.services.core.scheduler.scheduler import Scheduler
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+
+async def _no_start(schedule, dryrun=False):
+    pass
+
+
+async def check_schedules_scan(scheduler):
+    """ The previous Scheduler._check_schedules """
+    earliest_start_time = None
+    for schedule_id in list(scheduler._schedule_executions.keys()):
+        if scheduler._paused or len(scheduler._task_processes) >= scheduler._max_running_tasks:
+            return None
+        schedule_execution = scheduler._schedule_executions[schedule_id]
+        try:
+            schedule = scheduler._schedules[schedule_id]
+        except KeyError:
+            if not schedule_execution.task_processes:
+                del scheduler._schedule_executions[schedule_id]
+            continue
+        if schedule.enabled is False:
+            continue
+        if schedule.exclusive and schedule_execution.task_processes:
+            continue
+        next_start_time = schedule_execution.next_start_time
+        if not next_start_time and not schedule_execution.start_now:
+            if not schedule_execution.task_processes:
+                del scheduler._schedule_executions[schedule_id]
+            continue
+        if next_start_time and not schedule_execution.start_now:
+            now = scheduler.current_time if scheduler.current_time else time.time()
+            right_time = now >= next_start_time
+        else:
+            right_time = False
+        if right_time or schedule_execution.start_now:
+            if right_time and schedule.exclusive:
+                next_start_time = None
+            elif right_time:
+                scheduler._schedule_next_task(schedule)
+                next_start_time = schedule_execution.next_start_time
+            await scheduler._start_task(schedule)
+            schedule_execution.start_now = False
+        if next_start_time and (earliest_start_time is None or earliest_start_time > next_start_time):
+            earliest_start_time = next_start_time
+    return earliest_start_time
+
+
+def make_scheduler(schedules, start, with_timer_queue):
+    scheduler = Scheduler()
+    scheduler._logger.setLevel(logging.WARNING)
+    scheduler._max_running_tasks = len(schedules) + 1
+    scheduler._start_task = _no_start
+    scheduler.current_time = start
+    for schedule_id, repeat_seconds, offset in schedules:
+        scheduler._schedules[schedule_id] = scheduler._ScheduleRow(
+            id=schedule_id, name=str(schedule_id), type=Schedule.Type.INTERVAL, time=None, day=None,
+            repeat=datetime.timedelta(seconds=repeat_seconds), repeat_seconds=repeat_seconds, exclusive=False,
+            enabled=True, process_name="bench")
+        if with_timer_queue:
+            schedule_execution = scheduler._new_schedule_execution(schedule_id)
+        else:
+            schedule_execution = scheduler._ScheduleExecution(schedule_id)
+            scheduler._schedule_executions[schedule_id] = schedule_execution
+        schedule_execution.next_start_time = start + offset
+    return scheduler
+
+
+async def run(count, wake_ups):
+    random.seed(count)
+    schedules = [(uuid.uuid4(), random.randint(60, 3600), random.uniform(0, 3600)) for _ in range(count)]
+    # Schedules are due in the future so that _schedule_next_task always advances them by one interval
+    start = time.time() + 7200
+    results = []
+    for label, with_timer_queue in (("full scan (before)", False), ("timer queue (after)", True)):
+        scheduler = make_scheduler(schedules, start, with_timer_queue)
+        check = scheduler._check_schedules if with_timer_queue else (lambda: check_schedules_scan(scheduler))
+        next_start_time = await check()
+        elapsed = 0.0
+        for _ in range(wake_ups):
+            scheduler.current_time = next_start_time
+            begin = time.perf_counter()
+            next_start_time = await check()
+            elapsed += time.perf_counter() - begin
+        results.append((label, elapsed / wake_ups, next_start_time))
+    assert results[0][2] == results[1][2]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--schedules", type=int, default=10000, help="number of interval schedules")
+    parser.add_argument("--wake-ups", type=int, default=2000, help="scheduler wake-ups to average over")
+    args = parser.parse_args()
+    results = asyncio.get_event_loop().run_until_complete(run(args.schedules, args.wake_ups))
+    print("{:<24}{:>20}".format("mode", "us per wake-up"))
+    for label, per_wake_up, _ in results:
+        print("{:<24}{:>20.1f}".format(label, per_wake_up * 1000000))
+
+
+if __name__ == '__main__':
+    main()
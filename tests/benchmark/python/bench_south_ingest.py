@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Benchmark handing a plugin_poll result over to Ingest: one task per reading against Ingest.add_readings_bulk
+
+The *before* figures reproduce the previous SouthServer._exec_plugin_poll, which scheduled one
+Ingest.add_readings task per reading; the buffers are emptied between polls so that no reading is discarded.
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from fledge.services.south.ingest import Ingest
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+
+def setup_ingest(poll_size, assets):
+    Ingest._parent_service = MagicMock(_name="bench", _plugin_info={'config': {'plugin': {'default': 'bench'}}})
+    Ingest._max_concurrent_readings_inserts = 4
+    Ingest._readings_insert_batch_size = 1024
+    Ingest._readings_list_size = poll_size
+    Ingest._readings_lists = [[] for _ in range(Ingest._max_concurrent_readings_inserts)]
+    Ingest._readings_list_not_empty = [asyncio.Event() for _ in range(Ingest._max_concurrent_readings_inserts)]
+    Ingest._readings_list_batch_size_reached = [asyncio.Event()
+                                                for _ in range(Ingest._max_concurrent_readings_inserts)]
+    Ingest._current_readings_list_index = 0
+    Ingest._asset_tracker_events = {("asset{}".format(i), "Ingest", "bench", "bench") for i in range(assets)}
+    Ingest._asset_tracker_queue = []
+    Ingest._sensor_stats = {}
+    Ingest._stop = False
+    Ingest._started = True
+
+
+def reset_buffers():
+    for readings_list in Ingest._readings_lists:
+        readings_list.clear()
+    Ingest._current_readings_list_index = 0
+
+
+async def poll_per_reading(data):
+    tasks = [asyncio.ensure_future(Ingest.add_readings(asset=reading['asset'], timestamp=reading['timestamp'],
+                                                       readings=reading['readings'])) for reading in data]
+    await asyncio.gather(*tasks)
+
+
+async def poll_bulk(data):
+    await Ingest.add_readings_bulk(data)
+
+
+async def run(poll_size, polls, assets):
+    data = [{"asset": "asset{}".format(i % assets), "timestamp": "2026-01-01 00:00:00.000000+00:00",
+             "readings": {"x": i, "y": i * 0.5}} for i in range(poll_size)]
+    setup_ingest(poll_size, assets)
+    results = []
+    for label, poll in (("task per reading (before)", poll_per_reading), ("add_readings_bulk (after)", poll_bulk)):
+        elapsed = 0.0
+        for _ in range(polls):
+            reset_buffers()
+            start = time.perf_counter()
+            await poll(data)
+            elapsed += time.perf_counter() - start
+            assert poll_size == sum(len(readings_list) for readings_list in Ingest._readings_lists)
+        results.append((label, elapsed / polls))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--poll-size", type=int, default=10000, help="readings returned by one plugin_poll")
+    parser.add_argument("--polls", type=int, default=20, help="number of polls to average over")
+    parser.add_argument("--assets", type=int, default=10, help="distinct assets in a poll")
+    args = parser.parse_args()
+    results = asyncio.get_event_loop().run_until_complete(run(args.poll_size, args.polls, args.assets))
+    print("{:<30}{:>16}{:>16}".format("mode", "ms per poll", "readings/s"))
+    for label, per_poll in results:
+        print("{:<30}{:>16.2f}{:>16.0f}".format(label, per_poll * 1000, args.poll_size / per_poll))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Benchmark StorageClientAsync pooled session against a session per request
+
+The *before* figures reproduce the previous behaviour by closing the client session after every request, which costs
+a TCP connect/teardown per call exactly like the former ``async with aiohttp.ClientSession()`` blocks did.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+from aiohttp import web
+from aiohttp.test_utils import unused_port
+
+from fledge.common.service_record import ServiceRecord
+from fledge.common.storage_client.storage_client import StorageClientAsync, ReadingsStorageClientAsync
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+HOST = '127.0.0.1'
+
+
+async def _table_handler(request):
+    payload = await request.json()
+    return web.json_response({"count": len(payload) if isinstance(payload, list) else 1})
+
+
+async def _reading_handler(request):
+    payload = await request.json()
+    return web.json_response({"response": "appended", "readings_added": len(payload["readings"])})
+
+
+async def start_stub_storage(port):
+    app = web.Application()
+    app.router.add_routes([web.put('/storage/table/{tbl_name}/query', _table_handler),
+                           web.post('/storage/table/{tbl_name}', _table_handler),
+                           web.post('/storage/reading', _reading_handler)])
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, HOST, port)
+    await site.start()
+    return runner
+
+
+def _service_record(port):
+    svc = MagicMock(ServiceRecord)
+    svc._address = HOST
+    svc._type = "Storage"
+    svc._port = port
+    svc._management_port = port
+    return svc
+
+
+async def run(requests, concurrency):
+    port = unused_port()
+    runner = await start_stub_storage(port)
+    readings = json.dumps({"readings": [{"asset_code": "bench", "reading": {"x": i}, "user_ts": "2026-01-01 00:00:00"}
+                                        for i in range(10)]})
+    query = json.dumps({"where": {"column": "key", "condition": "=", "value": "bench"}})
+    results = []
+    try:
+        for label, per_request_session in (("session per request (before)", True), ("pooled session (after)", False)):
+            storage = StorageClientAsync(None, None, svc=_service_record(port))
+            readings_storage = ReadingsStorageClientAsync(None, None, svc=_service_record(port))
+
+            async def worker(n):
+                for _ in range(n):
+                    await storage.query_tbl_with_payload("statistics", query)
+                    if per_request_session:
+                        await storage.close_session()
+                    await readings_storage.append(readings)
+                    if per_request_session:
+                        await readings_storage.close_session()
+
+            start = time.perf_counter()
+            await asyncio.gather(*[worker(requests // concurrency) for _ in range(concurrency)])
+            elapsed = time.perf_counter() - start
+            await storage.close_session()
+            await readings_storage.close_session()
+            total = 2 * (requests // concurrency) * concurrency
+            results.append((label, total, elapsed))
+    finally:
+        await runner.cleanup()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="query + append pairs to issue")
+    parser.add_argument("--concurrency", type=int, default=1, help="concurrent callers sharing one client")
+    args = parser.parse_args()
+    results = asyncio.get_event_loop().run_until_complete(run(args.requests, args.concurrency))
+    print("{:<32}{:>10}{:>12}{:>14}".format("mode", "requests", "seconds", "requests/s"))
+    for label, total, elapsed in results:
+        print("{:<32}{:>10}{:>12.3f}{:>14.0f}".format(label, total, elapsed, total / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from unittest.mock import MagicMock
 from unittest.mock import patch
 from http.client import HTTPConnection, HTTPResponse
 import json
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from fledge.common.microservice_management_client import exceptions as client_exceptions
 from fledge.common.microservice_management_client.microservice_management_client import MicroserviceManagementClient, _logger
@@ -783,3 +786,87 @@ class TestMicroserviceManagementClient:
         assert 'POST' == kwargs['method']
         assert '/fledge/track' == kwargs['url']
         assert test_dict == json.loads(kwargs['body'])
+
+    @pytest.mark.asyncio
+    async def test_create_asset_tracker_events(self):
+        received = []
+
+        async def add_track(request):
+            data = await request.json()
+            if data['asset'] == 'bad':
+                raise web.HTTPBadRequest(reason='bad asset')
+            received.append(data)
+            return web.json_response(data)
+
+        app = web.Application()
+        app.router.add_route('POST', '/fledge/track', add_track)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            ms_mgt_client = MicroserviceManagementClient(server.host, server.port)
+            events = [{'asset': 'AirIntake', 'event': 'Ingest', 'service': 'PT100_In1', 'plugin': 'PT100'},
+                      {'asset': 'bad', 'event': 'Ingest', 'service': 'PT100_In1', 'plugin': 'PT100'}]
+            with patch.object(_logger, "error") as log_error:
+                results = await ms_mgt_client.create_asset_tracker_events(events)
+            log_error.assert_called_once_with("Error code: %d, Reason: %s", 400, 'bad asset')
+            assert events[0] == results[0]
+            assert isinstance(results[1], client_exceptions.MicroserviceManagementClientError)
+            assert [events[0]] == received
+
+            # The session is kept for the next round
+            session = ms_mgt_client._session
+            await ms_mgt_client.create_asset_tracker_events(events[:1])
+            assert session is ms_mgt_client._session
+            await ms_mgt_client.close_session()
+            assert session.closed
+            assert ms_mgt_client._session is None
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_create_asset_tracker_events_bounded(self):
+        in_flight = []
+        most_in_flight = []
+
+        async def add_track(request):
+            data = await request.json()
+            in_flight.append(data)
+            most_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(data)
+            return web.json_response(data)
+
+        app = web.Application()
+        app.router.add_route('POST', '/fledge/track', add_track)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            ms_mgt_client = MicroserviceManagementClient(server.host, server.port)
+            events = [{'asset': 'asset{}'.format(i), 'event': 'Ingest', 'service': 'PT100_In1', 'plugin': 'PT100'}
+                      for i in range(50)]
+            results = await ms_mgt_client.create_asset_tracker_events(events)
+            assert events == results
+            assert MicroserviceManagementClient.MAX_CONCURRENT_REQUESTS == max(most_in_flight)
+            await ms_mgt_client.close_session()
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_create_asset_tracker_events_timeout(self):
+        async def add_track(request):
+            await asyncio.sleep(1)
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_route('POST', '/fledge/track', add_track)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            ms_mgt_client = MicroserviceManagementClient(server.host, server.port)
+            ms_mgt_client.REQUEST_TIMEOUT = 0.1
+            events = [{'asset': 'AirIntake', 'event': 'Ingest', 'service': 'PT100_In1', 'plugin': 'PT100'}]
+            results = await ms_mgt_client.create_asset_tracker_events(events)
+            assert isinstance(results[0], asyncio.TimeoutError)
+            await ms_mgt_client.close_session()
+        finally:
+            await server.close()
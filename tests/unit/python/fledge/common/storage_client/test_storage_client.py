@@ -44,8 +44,15 @@ class FakeFledgeStorageSrvr:
             web.post('/storage/reading', self.readings_append),
             web.get('/storage/reading', self.readings_fetch),
             web.put('/storage/reading/query', self.readings_query),
-            web.put('/storage/reading/purge', self.readings_purge)
+            web.put('/storage/reading/purge', self.readings_purge),
+
+            # statistics history snapshot
+            web.post('/storage/statistics/snapshot', self.statistics_snapshot)
         ])
+        # Local stand-in of the statistics tables: key -> [value, previous_value]
+        self.statistics = {}
+        self.statistics_history = []
+        self.statistics_snapshot_supported = True
         self.handler = None
         self.server = None
 
@@ -146,6 +153,21 @@ class FakeFledgeStorageSrvr:
            "called": payload
         })
 
+    async def statistics_snapshot(self, request):
+        if not self.statistics_snapshot_supported:
+            return web.HTTPNotFound(reason="not supported", text='{"key": "value"}')
+
+        payload = await request.json()
+        if "history_ts" not in payload:
+            return web.HTTPBadRequest(reason="bad data", text='{"key": "value"}')
+
+        # No await from here on: the snapshot is atomic as the storage transaction is
+        for key, row in self.statistics.items():
+            self.statistics_history.append({"key": key, "value": row[0] - row[1],
+                                            "history_ts": payload["history_ts"]})
+            row[1] = row[0]
+        return web.json_response({"snapshot": {"history_ts": payload["history_ts"]}})
+
     async def readings_purge(self, request):
 
         if request.query.get('age', None) == "-1":
@@ -239,11 +261,16 @@ class TestStorageClientAsync:
         assert "Data to insert is missing" in str(excinfo.value)
 
         with pytest.raises(Exception) as excinfo:
-            args = "aTable", {"k": "v"}
+            args = "aTable", {"k", "v"}
             await sc.insert_into_tbl(*args)
         assert excinfo.type is TypeError
         assert "Provided data to insert must be a valid JSON" in str(excinfo.value)
 
+        # dict payload is serialized by the client, bytes are sent as pre-encoded JSON
+        for payload in ({"k": "v"}, json.dumps({"k": "v"}).encode()):
+            response = await sc.insert_into_tbl("aTable", payload)
+            assert {"k": "v"} == response["called"]
+
         args = "aTable", json.dumps({"k": "v"})
         response = await sc.insert_into_tbl(*args)
         assert {"k": "v"} == response["called"]
@@ -266,6 +293,7 @@ class TestStorageClientAsync:
             log_e.assert_called_once_with('Error code: %d, reason: %s, details: %s', 500, 'something wrong', {'key': 'value'})
         assert excinfo.type is aiohttp.client_exceptions.ContentTypeError
 
+        await sc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -297,11 +325,16 @@ class TestStorageClientAsync:
         assert "Data to update is missing" in str(excinfo.value)
 
         with pytest.raises(Exception) as excinfo:
-            args = "aTable", {"k": "v"}
+            args = "aTable", {"k", "v"}
             await sc.update_tbl(*args)
         assert excinfo.type is TypeError
         assert "Provided data to update must be a valid JSON" in str(excinfo.value)
 
+        # dict payload is serialized by the client, bytes are sent as pre-encoded JSON
+        for payload in ({"k": "v"}, json.dumps({"k": "v"}).encode()):
+            response = await sc.update_tbl("aTable", payload)
+            assert {"k": "v"} == response["called"]
+
         args = "aTable", json.dumps({"k": "v"})
         response = await sc.update_tbl(*args)
         assert {"k": "v"} == response["called"]
@@ -325,6 +358,7 @@ class TestStorageClientAsync:
             log_e.assert_called_once_with("Error code: %d, reason: %s, details: %s", 500, 'something wrong', {'key': 'value'})
         assert excinfo.type is aiohttp.client_exceptions.ContentTypeError
 
+        await sc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -353,11 +387,16 @@ class TestStorageClientAsync:
         assert 1 == response["called"]
 
         with pytest.raises(Exception) as excinfo:
-            args = "aTable", {"condition": "v"}
+            args = "aTable", {"condition", "v"}
             await sc.delete_from_tbl(*args)
         assert excinfo.type is TypeError
         assert "condition payload must be a valid JSON" in str(excinfo.value)
 
+        # dict payload is serialized by the client, bytes are sent as pre-encoded JSON
+        for payload in ({"condition": "v"}, json.dumps({"condition": "v"}).encode()):
+            response = await sc.delete_from_tbl("aTable", payload)
+            assert {"condition": "v"} == response["called"]
+
         args = "aTable", json.dumps({"condition": "v"})
         response = await sc.delete_from_tbl(*args)
         assert {"condition": "v"} == response["called"]
@@ -381,6 +420,7 @@ class TestStorageClientAsync:
             log_e.assert_called_once_with("Error code: %d, reason: %s, details: %s", 500, 'something wrong', {'key': 'value'})
         assert excinfo.type is aiohttp.client_exceptions.ContentTypeError
 
+        await sc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -430,6 +470,7 @@ class TestStorageClientAsync:
             log_e.assert_called_once_with("Error code: %d, reason: %s, details: %s", 500, 'something wrong', {'key': 'value'})
         assert excinfo.type is aiohttp.client_exceptions.ContentTypeError
 
+        await sc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -461,11 +502,16 @@ class TestStorageClientAsync:
         assert "Query payload is missing" in str(excinfo.value)
 
         with pytest.raises(Exception) as excinfo:
-            args = "aTable", {"k": "v"}
+            args = "aTable", {"k", "v"}
             await sc.query_tbl_with_payload(*args)
         assert excinfo.type is TypeError
         assert "Query payload must be a valid JSON" in str(excinfo.value)
 
+        # dict payload is serialized by the client, bytes are sent as pre-encoded JSON
+        for payload in ({"k": "v"}, json.dumps({"k": "v"}).encode()):
+            response = await sc.query_tbl_with_payload("aTable", payload)
+            assert {"k": "v"} == response["called"]
+
         args = "aTable", json.dumps({"k": "v"})
         response = await sc.query_tbl_with_payload(*args)
         assert {"k": "v"} == response["called"]
@@ -490,6 +536,110 @@ class TestStorageClientAsync:
             log_e.assert_called_once_with("Error code: %d, reason: %s, details: %s", 500, 'something wrong', {'key': 'value'})
         assert excinfo.type is aiohttp.client_exceptions.ContentTypeError
 
+        await sc.close_session()
+        await fake_storage_srvr.stop()
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self, event_loop):
+        fake_storage_srvr = FakeFledgeStorageSrvr(loop=event_loop)
+        await fake_storage_srvr.start()
+
+        mockServiceRecord = MagicMock(ServiceRecord)
+        mockServiceRecord._address = HOST
+        mockServiceRecord._type = "Storage"
+        mockServiceRecord._port = PORT
+        mockServiceRecord._management_port = 2000
+
+        sc = StorageClientAsync(1, 2, mockServiceRecord)
+        assert sc._session is None
+
+        await sc.query_tbl("aTable")
+        session = sc._session
+        assert session is not None
+        assert StorageClientAsync.CONNECTION_LIMIT == session.connector.limit
+
+        await sc.query_tbl("aTable")
+        await sc.query_tbl_with_payload("aTable", json.dumps({"k": "v"}))
+        assert session is sc._session
+
+        await sc.close_session()
+        assert session.closed
+        assert sc._session is None
+
+        # a closed session is transparently re-created on next use
+        response = await sc.query_tbl("aTable")
+        assert 1 == response["called"]
+        assert sc._session is not None and sc._session is not session
+
+        await sc.close_session()
+        await fake_storage_srvr.stop()
+
+    @pytest.mark.asyncio
+    async def test_session_released_on_loop_change(self):
+        mockServiceRecord = MagicMock(ServiceRecord)
+        mockServiceRecord._address = HOST
+        mockServiceRecord._type = "Storage"
+        mockServiceRecord._port = PORT
+        mockServiceRecord._management_port = 2000
+
+        sc = StorageClientAsync(1, 2, mockServiceRecord)
+        session = sc._get_session()
+        # The client is now used from another event loop
+        sc._session_loop = MagicMock()
+        with patch("fledge.common.storage_client.storage_client.release_session") as patch_release:
+            new_session = sc._get_session()
+        patch_release.assert_called_once_with(session)
+        assert new_session is not session
+        await session.close()
+        await sc.close_session()
+
+    @pytest.mark.asyncio
+    async def test_close_session_without_session(self):
+        mockServiceRecord = MagicMock(ServiceRecord)
+        mockServiceRecord._address = HOST
+        mockServiceRecord._type = "Storage"
+        mockServiceRecord._port = PORT
+        mockServiceRecord._management_port = 2000
+
+        sc = StorageClientAsync(1, 2, mockServiceRecord)
+        await sc.close_session()
+        assert sc._session is None
+
+
+    @pytest.mark.asyncio
+    async def test_statistics_snapshot(self, event_loop):
+        fake_storage_srvr = FakeFledgeStorageSrvr(loop=event_loop)
+        await fake_storage_srvr.start()
+        fake_storage_srvr.statistics = {"READINGS": [10, 4], "PURGED": [3, 3]}
+
+        mockServiceRecord = MagicMock(ServiceRecord)
+        mockServiceRecord._address = HOST
+        mockServiceRecord._type = "Storage"
+        mockServiceRecord._port = PORT
+        mockServiceRecord._management_port = 2000
+
+        sc = StorageClientAsync(1, 2, mockServiceRecord)
+        response = await sc.statistics_snapshot("2026-01-01 00:00:00.000000+00:00")
+        assert {"snapshot": {"history_ts": "2026-01-01 00:00:00.000000+00:00"}} == response
+        assert [{"key": "READINGS", "value": 6, "history_ts": "2026-01-01 00:00:00.000000+00:00"},
+                {"key": "PURGED", "value": 0, "history_ts": "2026-01-01 00:00:00.000000+00:00"}
+                ] == fake_storage_srvr.statistics_history
+        assert {"READINGS": [10, 10], "PURGED": [3, 3]} == fake_storage_srvr.statistics
+
+        # only the increments made since the previous snapshot are recorded
+        fake_storage_srvr.statistics["READINGS"][0] += 5
+        await sc.statistics_snapshot("2026-01-01 00:00:15.000000+00:00")
+        assert 5 == fake_storage_srvr.statistics_history[2]["value"]
+        assert 11 == sum(row["value"] for row in fake_storage_srvr.statistics_history if row["key"] == "READINGS")
+
+        fake_storage_srvr.statistics_snapshot_supported = False
+        with pytest.raises(StorageServerError) as excinfo:
+            with patch.object(_LOGGER, "error") as log_e:
+                await sc.statistics_snapshot("2026-01-01 00:00:30.000000+00:00")
+        assert 404 == excinfo.value.code
+        assert not log_e.called
+
+        await sc.close_session()
         await fake_storage_srvr.stop()
 
 
@@ -554,6 +704,14 @@ class TestReadingsStorageAsyncClient:
         response = await rsc.append(readings)
         assert {'readings': []} == response['appended']
 
+        readings = {"readings": [{"asset_code": "a", "reading": {"x": 1}, "user_ts": "2017-09-21 15:00:09.025655"}]}
+        response = await rsc.append(readings)
+        assert readings == response['appended']
+
+        response = await rsc.append(json.dumps(readings).encode())
+        assert readings == response['appended']
+
+        await rsc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -609,6 +767,7 @@ class TestReadingsStorageAsyncClient:
         response = await rsc.fetch(*args)
         assert {'readings': [], 'start': '2', 'count': '3'} == response
 
+        await rsc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -654,6 +813,7 @@ class TestReadingsStorageAsyncClient:
                                           '/storage/reading/query', '{"internal_server_err": "v"}', 500, 'something wrong', {"key": "value"})
         assert excinfo.type is aiohttp.client_exceptions.ContentTypeError
 
+        await rsc.close_session()
         await fake_storage_srvr.stop()
 
     @pytest.mark.asyncio
@@ -749,4 +909,5 @@ class TestReadingsStorageAsyncClient:
         response = await rsc.purge(**kwargs)
         assert 1 == response["called"]
 
+        await rsc.close_session()
         await fake_storage_srvr.stop()
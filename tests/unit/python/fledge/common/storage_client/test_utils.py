@@ -6,6 +6,7 @@
 
 """ Test common/storage_client/utils.py """
 
+import json
 import pytest
 from fledge.common.storage_client.utils import Utils
 
@@ -45,3 +46,31 @@ class TestUtils:
     def test_is_json_return_false_with_invalid_json(self, test_input):
         ret_val = Utils.is_json(test_input)
         assert ret_val is False
+
+    @pytest.mark.parametrize("test_input, expected", [({"k": "v"}, '{"k": "v"}'),
+                                                      ([{"k": 1}], '[{"k": 1}]'),
+                                                      ('{"k": "v"}', '{"k": "v"}'),
+                                                      (b'{"k": "v"}', b'{"k": "v"}'),
+                                                      (b'any', b'any'),
+                                                      ('{ k": "v"}', None),
+                                                      (1, None),
+                                                      ({"k", "v"}, None)
+                                                      ])
+    def test_encode_payload(self, test_input, expected):
+        assert expected == Utils.encode_payload(test_input)
+
+    def test_set_json_encoder(self):
+        encoder_calls = []
+
+        def encoder(payload):
+            encoder_calls.append(payload)
+            return json.dumps(payload, separators=(',', ':')).encode()
+        try:
+            Utils.set_json_encoder(encoder)
+            assert b'{"k":[1,2]}' == Utils.encode_payload({"k": [1, 2]})
+            # str payloads are not re-encoded
+            assert '{"k": 1}' == Utils.encode_payload('{"k": 1}')
+            assert [{"k": [1, 2]}] == encoder_calls
+        finally:
+            Utils.set_json_encoder()
+        assert '{"k": [1, 2]}' == Utils.encode_payload({"k": [1, 2]})
@@ -7,6 +7,7 @@
 """ Unit tests for common utils """
 
 import pytest
+from unittest.mock import MagicMock
 from fledge.common import utils as common_utils
 from collections import Counter
 
@@ -32,3 +33,23 @@ class TestCommonUtils:
     def test_check_reserved(self, test_string, expected):
         actual = common_utils.check_reserved(test_string)
         assert expected == actual
+
+    def test_release_session(self):
+        connector = MagicMock()
+        session = MagicMock(closed=False, connector=connector)
+        common_utils.release_session(session)
+        session.detach.assert_called_once_with()
+        connector.close.assert_called_once_with()
+
+    def test_release_session_closed_loop(self):
+        connector = MagicMock()
+        connector.close.side_effect = RuntimeError("Event loop is closed")
+        session = MagicMock(closed=False, connector=connector)
+        common_utils.release_session(session)
+        session.detach.assert_called_once_with()
+
+    @pytest.mark.parametrize("session", [None, MagicMock(closed=True)])
+    def test_release_session_nothing_to_release(self, session):
+        common_utils.release_session(session)
+        if session is not None:
+            session.detach.assert_not_called()
@@ -16,9 +16,16 @@ class TestConfigurationCache:
     def test_init(self):
         cached_manager = ConfigurationCache()
         assert {} == cached_manager.cache
-        assert 10 == cached_manager.max_cache_size
+        assert ConfigurationCache.MAX_CACHE_SIZE == cached_manager.max_cache_size
+        assert ConfigurationCache.MAX_CACHE_BYTES == cached_manager.max_cache_bytes
         assert 0 == cached_manager.hit
         assert 0 == cached_manager.miss
+        assert 0 == cached_manager.evictions
+
+    def test_init_with_limits(self):
+        cached_manager = ConfigurationCache(max_cache_size=10, max_cache_bytes=1024)
+        assert 10 == cached_manager.max_cache_size
+        assert 1024 == cached_manager.max_cache_bytes
 
     def test_size(self):
         cached_manager = ConfigurationCache()
@@ -42,19 +49,17 @@ class TestConfigurationCache:
         cat_display_name = "AJ"
         cached_manager.cache = {cat_name: {'value': {}}}
         cached_manager.update(cat_name, cat_desc, cat_val)
-        assert 'date_accessed' in cached_manager.cache[cat_name]
         assert cat_desc == cached_manager.cache[cat_name]['description']
         assert cat_val == cached_manager.cache[cat_name]['value']
         assert cat_name == cached_manager.cache[cat_name]['displayName']
 
         cached_manager.update(cat_name, cat_desc, cat_val, cat_display_name)
-        assert 'date_accessed' in cached_manager.cache[cat_name]
         assert cat_desc == cached_manager.cache[cat_name]['description']
         assert cat_val == cached_manager.cache[cat_name]['value']
         assert cat_display_name == cached_manager.cache[cat_name]['displayName']
 
     def test_remove_oldest(self):
-        cached_manager = ConfigurationCache()
+        cached_manager = ConfigurationCache(max_cache_size=10)
         cached_manager.update("cat1", "desc1", {'value': {}})
         cached_manager.update("cat2", "desc2", {'value': {}})
         cached_manager.update("cat3", "desc3", {'value': {}})
@@ -79,6 +84,75 @@ class TestConfigurationCache:
         assert 'cat10' in cached_manager.cache
         assert 'cat11' in cached_manager.cache
         assert 10 == cached_manager.size
+        assert 1 == cached_manager.evictions
+
+    def test_least_recently_used_is_evicted(self):
+        cached_manager = ConfigurationCache(max_cache_size=3)
+        cached_manager.update("cat1", "desc1", {'value': {}})
+        cached_manager.update("cat2", "desc2", {'value': {}})
+        cached_manager.update("cat3", "desc3", {'value': {}})
+        # a read and an update both make a category the most recently used one
+        assert "cat1" in cached_manager
+        cached_manager.update("cat2", "desc2", {'value': {}})
+        cached_manager.update("cat4", "desc4", {'value': {}})
+        assert ['cat1', 'cat2', 'cat4'] == list(cached_manager.cache)
+        assert 1 == cached_manager.hit
+        assert 1 == cached_manager.evictions
+
+    def test_byte_limit(self):
+        cat_val = {'config_item': {'default': 'x' * 100, 'description': 'foo', 'type': 'string'}}
+        cached_manager = ConfigurationCache(max_cache_bytes=350)
+        cached_manager.update("cat1", "desc1", cat_val)
+        cached_manager.update("cat2", "desc2", cat_val)
+        assert 2 == cached_manager.size
+        cached_manager.update("cat3", "desc3", cat_val)
+        assert ['cat2', 'cat3'] == list(cached_manager.cache)
+        assert cached_manager.bytes <= 350
+        cached_manager.remove("cat2")
+        cached_manager.remove("cat3")
+        assert 0 == cached_manager.bytes
+        # a category larger than the limit is still cached, alone
+        cached_manager.update("big", "desc", {'config_item': {'default': 'x' * 1000}})
+        assert ['big'] == list(cached_manager.cache)
+
+    def test_refresh_after_in_place_change(self):
+        cat_val = {'config_item': {'value': 'x' * 100, 'type': 'string'}}
+        cached_manager = ConfigurationCache(max_cache_bytes=350)
+        cached_manager.update("cat1", "desc1", {'config_item': {'value': 'x', 'type': 'string'}})
+        cached_manager.update("cat2", "desc2", cat_val)
+        size = cached_manager.bytes
+        cached_manager.cache["cat1"]['value']['config_item']['value'] = 'x' * 100
+        cached_manager.refresh("cat1")
+        assert size + 99 == cached_manager.bytes
+        assert ['cat2', 'cat1'] == list(cached_manager.cache)
+        cached_manager.cache["cat1"]['value']['config_item']['value'] = 'x' * 300
+        cached_manager.refresh("cat1")
+        assert ['cat1'] == list(cached_manager.cache)
+        assert cached_manager._approximate_bytes(cached_manager.cache["cat1"]) == cached_manager.bytes
+        assert 1 == cached_manager.evictions
+        # an uncached category is ignored
+        cached_manager.refresh("cat2")
+        assert ['cat1'] == list(cached_manager.cache)
+
+    def test_set_limits(self):
+        cached_manager = ConfigurationCache()
+        cached_manager.update("cat1", "desc1", {'value': {}})
+        cached_manager.update("cat2", "desc2", {'value': {}})
+        cached_manager.update("cat3", "desc3", {'value': {}})
+        cached_manager.set_limits(2, 1024)
+        assert 2 == cached_manager.max_cache_size
+        assert 1024 == cached_manager.max_cache_bytes
+        assert ['cat2', 'cat3'] == list(cached_manager.cache)
+        assert 1 == cached_manager.evictions
+
+    def test_stats(self):
+        cached_manager = ConfigurationCache(max_cache_size=1, max_cache_bytes=1024)
+        cached_manager.update("cat1", "desc1", {})
+        assert "cat1" in cached_manager
+        assert "cat2" not in cached_manager
+        cached_manager.update("cat2", "desc2", {})
+        assert {'size': 1, 'maxSize': 1, 'bytes': 2, 'maxBytes': 1024, 'hit': 1, 'miss': 1,
+                'evictions': 1} == cached_manager.stats()
 
     def test_remove(self):
         cached_manager = ConfigurationCache()
@@ -105,9 +105,10 @@ class TestConfigurationManager:
     def test_register_interest(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
-        c_mgr.register_interest('name', 'callback')
-        assert 'callback' in c_mgr._registered_interests['name']
+        c_mgr.register_interest('name', 'configuration_manager_callback')
+        assert 'configuration_manager_callback' in c_mgr._registered_interests['name']
         assert 1 == len(c_mgr._registered_interests)
+        assert ('configuration_manager_callback', 'run') in c_mgr._callback_methods
 
     def test_unregister_interest_no_category_name(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
@@ -128,24 +129,50 @@ class TestConfigurationManager:
     def test_unregister_interest(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
-        c_mgr.register_interest('name', 'callback')
+        c_mgr.register_interest('name', 'configuration_manager_callback')
         assert 1 == len(c_mgr._registered_interests)
-        c_mgr.unregister_interest('name', 'callback')
+        c_mgr.unregister_interest('name', 'configuration_manager_callback')
         assert len(c_mgr._registered_interests) is 0
 
     async def test__run_callbacks(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
         c_mgr.register_interest('name', 'configuration_manager_callback')
-        await c_mgr._run_callbacks('name')
+        with patch('fledge.common.configuration_manager.import_module') as import_patch:
+            await c_mgr._run_callbacks('name')
+            await c_mgr._run_callbacks('name')
+        import_patch.assert_not_called()
+
+    async def test__run_callbacks_concurrent(self, reset_singleton):
+        started = []
+        release = asyncio.Event()
+
+        async def run_one(category_name):
+            started.append('one')
+            await release.wait()
+
+        async def run_two(category_name):
+            started.append('two')
+            release.set()
+            raise ValueError('two failed')
+
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        c_mgr = ConfigurationManager(storage_client_mock)
+        c_mgr._callback_methods[('one', 'run')] = run_one
+        c_mgr._callback_methods[('two', 'run')] = run_two
+        c_mgr.register_interest('name', 'one')
+        c_mgr.register_interest('name', 'two')
+        with pytest.raises(ValueError) as excinfo:
+            await c_mgr._run_callbacks('name')
+        assert 'two failed' == str(excinfo.value)
+        assert ['one', 'two'] == sorted(started)
 
-    async def test__run_callbacks_invalid_module(self, reset_singleton):
+    def test_register_interest_invalid_module(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
-        c_mgr.register_interest('name', 'invalid')
         with patch.object(_logger, "error") as log_error:
             with pytest.raises(Exception) as excinfo:
-                await c_mgr._run_callbacks('name')
+                c_mgr.register_interest('name', 'invalid')
             import sys
             if sys.version_info[1] >= 6:
                 assert excinfo.type is ModuleNotFoundError
@@ -155,35 +182,44 @@ class TestConfigurationManager:
         assert 1 == log_error.call_count
         log_error.assert_called_once_with('Unable to import callback module %s for category_name %s', 'invalid',
                                           'name', exc_info=True)
+        assert 'name' not in c_mgr._registered_interests
 
-    async def test__run_callbacks_norun(self, reset_singleton):
+    def test_register_interest_norun(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
-        c_mgr.register_interest('name', 'configuration_manager_callback_norun')
         with patch.object(_logger, "error") as log_error:
             with pytest.raises(Exception) as excinfo:
-                await c_mgr._run_callbacks('name')
+                c_mgr.register_interest('name', 'configuration_manager_callback_norun')
             assert excinfo.type is AttributeError
             assert 'Callback module configuration_manager_callback_norun does not have method run' in str(
                 excinfo.value)
         assert 1 == log_error.call_count
-        log_error.assert_called_once_with('Callback module %s does not have method run',
-                                          'configuration_manager_callback_norun', exc_info=True)
+        log_error.assert_called_once_with('Callback module %s does not have method %s',
+                                          'configuration_manager_callback_norun', 'run', exc_info=True)
+        assert 'name' not in c_mgr._registered_interests
 
-    async def test__run_callbacks_nonasync(self, reset_singleton):
+    def test_register_interest_nonasync(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
-        c_mgr.register_interest(
-            'name', 'configuration_manager_callback_nonasync')
         with patch.object(_logger, "error") as log_error:
             with pytest.raises(Exception) as excinfo:
-                await c_mgr._run_callbacks('name')
+                c_mgr.register_interest('name', 'configuration_manager_callback_nonasync')
             assert excinfo.type is AttributeError
             assert 'Callback module configuration_manager_callback_nonasync run method must be a coroutine function' in\
                    str(excinfo.value)
         assert 1 == log_error.call_count
-        log_error.assert_called_once_with('Callback module %s run method must be a coroutine function',
-                                          'configuration_manager_callback_nonasync', exc_info=True)
+        log_error.assert_called_once_with('Callback module %s %s method must be a coroutine function',
+                                          'configuration_manager_callback_nonasync', 'run', exc_info=True)
+        assert 'name' not in c_mgr._registered_interests
+
+    def test_register_interest_child_norun_child(self, reset_singleton):
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        c_mgr = ConfigurationManager(storage_client_mock)
+        with patch.object(_logger, "error"):
+            with pytest.raises(AttributeError) as excinfo:
+                c_mgr.register_interest_child('name', 'configuration_manager_callback')
+        assert 'Callback module configuration_manager_callback does not have method run_child' == str(excinfo.value)
+        assert 'name' not in c_mgr._registered_interests_child
 
     async def test__validate_category_val_valid_config_use_default_val(self, reset_singleton):
         storage_client_mock = MagicMock(spec=StorageClientAsync)
@@ -1432,7 +1468,7 @@ class TestConfigurationManager:
         item_name = 'itemname'
         new_value_entry = 'newvalentry'
         storage_value_entry = {'value': 'test', 'description': 'Test desc', 'type': 'string', 'default': 'test'}
-        c_mgr._cacheManager.update(category_name, "desc", {item_name: storage_value_entry})
+        c_mgr._cacheManager.update(category_name, "desc", {item_name: dict(storage_value_entry, value='t')})
 
         # Changed in version 3.8: patch() now returns an AsyncMock if the target is an async function.
         if sys.version_info.major == 3 and sys.version_info.minor >= 8:
@@ -1449,6 +1485,10 @@ class TestConfigurationManager:
                 callbackpatch.assert_called_once_with(category_name)
             updatepatch.assert_called_once_with(category_name, item_name, new_value_entry)
         readpatch.assert_called_once_with(category_name, item_name)
+        # the cache size follows the in-place change of the cached item value
+        cached = c_mgr._cacheManager.cache[category_name]
+        assert 'test' == cached['value'][item_name]['value']
+        assert c_mgr._cacheManager._approximate_bytes(cached) == c_mgr._cacheManager.bytes
 
     @pytest.mark.parametrize("new_value_entry, storage_result, exc_name, exc_msg", [
         ('', {'value': 'test', 'description': 'Test desc', 'type': 'string', 'default': 'test',
@@ -2041,8 +2081,9 @@ class TestConfigurationManager:
                 return {"rows": [{"key": "General", "description": "General", "display_name": "GEN"}, {"key": "Advanced", "description": "Advanced", "display_name": "ADV"}, {"key": "service", "description": "Fledge service", "display_name": "SERV"}, {"key": "rest_api", "description": "User REST API", "display_name": "API"}], "count": 4}
 
             if table == "category_children":
-                assert {"return": ["child"], "modifier": "distinct"} == payload
-                return {"rows": [{"child": "SMNTR"}, {"child": "service"}, {"child": "rest_api"}], "count": 3}
+                assert {"return": ["parent", "child"], "sort": {"column": "id", "direction": "asc"}} == payload
+                return {"rows": [{"parent": "General", "child": "SMNTR"}, {"parent": "General", "child": "service"},
+                                 {"parent": "Advanced", "child": "rest_api"}], "count": 3}
 
         storage_client_mock = MagicMock(spec=StorageClientAsync)
         c_mgr = ConfigurationManager(storage_client_mock)
@@ -2051,6 +2092,64 @@ class TestConfigurationManager:
             assert expected_result == ret_val
         assert 2 == query_tbl_patch.call_count
 
+    async def test__read_all_groups_with_children(self, reset_singleton):
+        @asyncio.coroutine
+        def q_result(*args):
+            if args[0] == "configuration":
+                return {"rows": [{"key": "General", "description": "General", "display_name": "GEN"},
+                                 {"key": "Advanced", "description": "Advanced", "display_name": "ADV"},
+                                 {"key": "service", "description": "Fledge service", "display_name": "SERV"},
+                                 {"key": "rest_api", "description": "User REST API", "display_name": "API"},
+                                 {"key": "password", "description": "Password", "display_name": "PWD"}], "count": 5}
+            return {"rows": [{"parent": "General", "child": "service"}, {"parent": "General", "child": "SMNTR"},
+                             {"parent": "service", "child": "rest_api"}, {"parent": "General", "child": "Advanced"},
+                             {"parent": "rest_api", "child": "password"}, {"parent": "password", "child": "service"}],
+                    "count": 6}
+
+        def node(key, description, display_name, children):
+            return {"key": key, "description": description, "displayName": display_name, "children": children}
+
+        password = node("password", "Password", "PWD", [])
+        rest_api = node("rest_api", "User REST API", "API", [password])
+        service = node("service", "Fledge service", "SERV", [rest_api])
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        c_mgr = ConfigurationManager(storage_client_mock)
+        with patch.object(storage_client_mock, 'query_tbl_with_payload', side_effect=q_result) as query_tbl_patch:
+            ret_val = await c_mgr._read_all_groups(root=True, children=True)
+            # SMNTR has no configuration row and the password -> service cycle is cut at the repeated category
+            assert [node("General", "General", "GEN", [service, node("Advanced", "Advanced", "ADV", [])])] == ret_val
+            ret_val = await c_mgr._read_all_groups(root=False, children=True)
+            assert ["Advanced", "service", "rest_api", "password"] == [n["key"] for n in ret_val]
+            assert ["password"] == [n["key"] for n in ret_val[2]["children"]]
+        assert 2 == query_tbl_patch.call_count
+
+    async def test__read_all_groups_cache_invalidated(self, reset_singleton):
+        rows = {"configuration": [{"key": "General", "description": "General", "display_name": "GEN"},
+                                  {"key": "service", "description": "Fledge service", "display_name": "SERV"}],
+                "category_children": []}
+
+        @asyncio.coroutine
+        def q_result(*args):
+            return {"rows": rows[args[0]], "count": len(rows[args[0]])}
+
+        @asyncio.coroutine
+        def i_result(*args):
+            rows["category_children"].append({"parent": "General", "child": "service"})
+            return {"response": "inserted", "rows_affected": 1}
+
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        c_mgr = ConfigurationManager(storage_client_mock)
+        with patch.object(storage_client_mock, 'query_tbl_with_payload', side_effect=q_result) as query_tbl_patch:
+            assert [("General", "General", "GEN"), ("service", "Fledge service", "SERV")] == \
+                   await c_mgr._read_all_groups(root=True, children=False)
+            assert [("General", "General", "GEN"), ("service", "Fledge service", "SERV")] == \
+                   await c_mgr._read_all_groups(root=True, children=False)
+            assert 2 == query_tbl_patch.call_count
+            with patch.object(storage_client_mock, 'insert_into_tbl', side_effect=i_result):
+                await c_mgr._create_child("General", "service")
+            assert [("General", "General", "GEN")] == await c_mgr._read_all_groups(root=True, children=False)
+            assert 4 == query_tbl_patch.call_count
+
     async def test__read_category_val_1_row(self, reset_singleton):
         async def mock_coro():
             return {'rows': [{'value': 'value1'}]}
@@ -7,10 +7,11 @@
 """ Test common/jqfilter.py
 
 """
-from unittest.mock import patch
+from unittest.mock import patch, call, MagicMock
 import pytest
 import pyjq
 from fledge.common import logger
+from fledge.common import jqfilter
 from fledge.common.jqfilter import JQFilter
 
 __author__ = "Vaibhav Singhal"
@@ -22,6 +23,12 @@ __version__ = "${VERSION}"
 @pytest.allure.feature("unit")
 @pytest.allure.story("common", "jqfilter")
 class TestJQFilter:
+    @pytest.fixture(autouse=True)
+    def clear_compiled_filters(self):
+        jqfilter._compile.cache_clear()
+        yield
+        jqfilter._compile.cache_clear()
+
     def test_init(self):
         with patch.object(logger, "setup") as log:
             jqfilter_instance = JQFilter()
@@ -33,10 +40,24 @@ class TestJQFilter:
     ])
     def test_transform(self, input_filter_string, input_reading_block, expected_return):
         jqfilter_instance = JQFilter()
-        with patch.object(pyjq, "all", return_value=expected_return) as mock_pyjq:
+        program = MagicMock(**{"all.return_value": expected_return})
+        with patch.object(pyjq, "compile", return_value=program) as mock_pyjq:
             ret = jqfilter_instance.transform(input_filter_string, input_reading_block)
             assert ret == expected_return
-        mock_pyjq.assert_called_once_with(input_reading_block, input_filter_string)
+        mock_pyjq.assert_called_once_with(input_reading_block)
+        program.all.assert_called_once_with(input_filter_string)
+
+    def test_transform_compiles_once(self):
+        reading_block = [{"asset_code": "x", "reading": {"a": 1, "b": True}}, {"asset_code": "y", "reading": {}}]
+        with patch.object(pyjq, "compile", wraps=pyjq.compile) as mock_pyjq:
+            for _ in range(3):
+                assert [["x", "y"]] == JQFilter().transform(reading_block, "[.[].asset_code]")
+            assert [reading_block] == JQFilter().transform(reading_block, ".")
+        assert [call("[.[].asset_code]"), call(".")] == mock_pyjq.call_args_list
+
+    def test_transform_returns_native_objects(self):
+        reading_block = [{"id": 1, "reading": {"on": True, "off": False, "none": None, "temp": 21.5}}]
+        assert [reading_block] == JQFilter().transform(reading_block, ".")
 
     @pytest.mark.parametrize("input_filter_string, input_reading_block, expected_error, expected_log", [
         (".", '{"a" 1}', TypeError, 'Invalid JSON passed, exception %s'),
@@ -44,9 +65,18 @@ class TestJQFilter:
     ])
     def test_transform_exceptions(self, input_filter_string, input_reading_block, expected_error, expected_log):
         jqfilter_instance = JQFilter()
-        with patch.object(pyjq, "all", side_effect=expected_error) as mock_pyjq:
+        program = MagicMock(**{"all.side_effect": expected_error})
+        with patch.object(pyjq, "compile", return_value=program) as mock_pyjq:
             with patch.object(jqfilter_instance._logger, "error") as log:
                 with pytest.raises(expected_error):
                     jqfilter_instance.transform(input_filter_string, input_reading_block)
-        mock_pyjq.assert_called_once_with(input_reading_block, input_filter_string)
+        mock_pyjq.assert_called_once_with(input_reading_block)
         log.assert_called_once_with(expected_log, '')
+
+    def test_compile_exception(self):
+        jqfilter_instance = JQFilter()
+        with patch.object(jqfilter_instance._logger, "error") as log:
+            with pytest.raises(ValueError):
+                jqfilter_instance.transform([{"a": 1}], ".[")
+        assert 1 == log.call_count
+        assert 'Failed to transform, please check the transformation rule, exception %s' == log.call_args[0][0]
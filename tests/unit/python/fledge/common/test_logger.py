@@ -6,6 +6,8 @@
 
 import pytest
 import logging
+import sys
+from unittest.mock import patch, mock_open
 
 from fledge.common import logger
 
@@ -95,3 +97,33 @@ class TestLogger:
                     log.setLevel(level) 
                     log.propagate = propagate
                     assert log is logger.setup(name, propagate=propagate, level=level)
+
+    @pytest.fixture
+    def process_name(self):
+        """ Resolve the process name afresh and restore the one of the test run afterwards """
+        resolved = logger._process_name
+        logger._process_name = None
+        yield
+        logger._process_name = resolved
+
+    @pytest.mark.parametrize("argv, cmdline, env, expected", [
+        (['purge', '--port=1', '--address=localhost', '--name=purge'], b'', {}, 'Fledge purge'),
+        # Python embedded in a C service: sys.argv is empty
+        ([], b'fledge.services.south\0--port=1\0--name=Sine\0', {}, 'Fledge Sine'),
+        (['python3'], b'python3\0', {logger.FLEDGE_PROCESS_NAME: 'Core'}, 'Fledge Core'),
+        (['python3', '--name=stats'], b'', {logger.FLEDGE_PROCESS_NAME: 'Core'}, 'Fledge stats'),
+        (['python3'], b'python3\0', {}, 'Fledge'),
+    ])
+    def test_process_name(self, process_name, argv, cmdline, env, expected):
+        with patch.object(sys, 'argv', argv):
+            with patch('builtins.open', mock_open(read_data=cmdline)):
+                with patch.dict('os.environ', env, clear=True):
+                    assert expected == logger._get_process_name()
+
+    def test_process_name_resolved_once(self, process_name):
+        with patch.object(sys, 'argv', ['purge', '--name=purge']):
+            with patch.object(logger, '_name_argument', wraps=logger._name_argument) as patch_name_argument:
+                for name in ('first', 'second'):
+                    instance = logger.setup(name, destination=logger.CONSOLE)
+                    assert instance.handlers[-1].formatter._fmt.startswith('Fledge purge[%(process)d]')
+        patch_name_argument.assert_called_once_with(['purge', '--name=purge'])
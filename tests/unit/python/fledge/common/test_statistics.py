@@ -274,3 +274,104 @@ class TestStatistics:
                 with patch.object(statistics._logger, 'exception') as logger_exception:
                     await s.add_update(stat_dict)
                 logger_exception.assert_called_once_with(*msg)
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("common", "statistics")
+class TestStatisticsAccumulator:
+
+    @pytest.fixture
+    def storage(self):
+        """ Storage mock recording the statistics inserts and updates """
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        storage_client_mock.inserts = []
+        storage_client_mock.updates = []
+
+        async def insert_into_tbl(tbl_name, payload):
+            storage_client_mock.inserts.append(payload)
+            return {"response": "inserted", "rows_affected": len(payload["inserts"])}
+
+        async def update_tbl(tbl_name, payload):
+            storage_client_mock.updates.append(payload)
+            return {"response": "updated", "rows_affected": len(payload["updates"])}
+
+        async def query_tbl_with_payload(tbl_name, payload):
+            return {"rows": [{"key": "READINGS"}]}
+
+        storage_client_mock.insert_into_tbl.side_effect = insert_into_tbl
+        storage_client_mock.update_tbl.side_effect = update_tbl
+        storage_client_mock.query_tbl_with_payload.side_effect = query_tbl_with_payload
+        statistics.Statistics._shared_state.clear()
+        yield storage_client_mock
+        statistics.Statistics._shared_state.clear()
+
+    @staticmethod
+    def _updated_values(update_payload):
+        return {item["where"]["value"]: item["expressions"][0]["value"] for item in update_payload["updates"]}
+
+    @pytest.mark.asyncio
+    async def test_increments_flushed_with_a_single_update(self, storage):
+        accumulator = statistics.StatisticsAccumulator(storage)
+        for _ in range(100):
+            accumulator.increment('READINGS', 10)
+            accumulator.increment('SENSOR1', 1, 'Readings of sensor 1')
+            accumulator.increment('SENSOR2', 2, 'Readings of sensor 2')
+        accumulator.increment('DISCARDED', 0)
+        await accumulator.flush()
+
+        assert 1 == len(storage.updates)
+        assert {'READINGS': 1000, 'SENSOR1': 100, 'SENSOR2': 200} == self._updated_values(storage.updates[0])
+        # The new keys are registered with a single insert, the key already in the table is not
+        assert 1 == len(storage.inserts)
+        assert [{"key": "SENSOR1", "description": "Readings of sensor 1", "value": 0, "previous_value": 0},
+                {"key": "SENSOR2", "description": "Readings of sensor 2", "value": 0, "previous_value": 0}] == \
+            storage.inserts[0]["inserts"]
+
+        # Nothing is written when there are no increments, registered keys are not inserted again
+        await accumulator.flush()
+        accumulator.increment('SENSOR1', 1, 'Readings of sensor 1')
+        await accumulator.flush()
+        assert 2 == len(storage.updates)
+        assert {'SENSOR1': 1} == self._updated_values(storage.updates[1])
+        assert 1 == len(storage.inserts)
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_increments(self, storage):
+        accumulator = statistics.StatisticsAccumulator(storage)
+        accumulator.increment('READINGS', 5)
+        with patch.object(statistics._logger, 'exception'):
+            with patch.object(storage, 'update_tbl', side_effect=Exception("storage not available")):
+                with pytest.raises(Exception):
+                    await accumulator.flush()
+        accumulator.increment('READINGS', 2)
+        await accumulator.flush()
+        assert [{'READINGS': 7}] == [self._updated_values(update) for update in storage.updates]
+
+    @pytest.mark.asyncio
+    async def test_register_bulk_fallback(self, storage):
+        """ When the bulk insert fails, keys created by another process are reloaded and the others inserted """
+        s = statistics.Statistics(storage)
+        calls = []
+
+        async def insert_into_tbl(tbl_name, payload):
+            calls.append(payload)
+            if len(calls) == 1:
+                raise Exception("duplicate key")
+            return {"response": "inserted", "rows_affected": 1}
+
+        with patch.object(storage, 'insert_into_tbl', side_effect=insert_into_tbl):
+            await s.register_bulk({'READINGS': 'Readings', 'K1': 'Key 1', 'K2': 'Key 2'})
+        assert 2 == len(calls[0]["inserts"])
+        assert ['K1', 'K2'] == [json.loads(payload)["key"] for payload in calls[1:]]
+        assert {'READINGS', 'K1', 'K2'} == set(s._registered_keys)
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush_and_stop(self, storage):
+        accumulator = statistics.StatisticsAccumulator(storage, flush_interval=0.05)
+        accumulator.start()
+        accumulator.increment('READINGS', 1)
+        await asyncio.sleep(0.12)
+        assert 1 == len(storage.updates)
+        accumulator.increment('READINGS', 3)
+        await accumulator.stop()
+        assert [{'READINGS': 1}, {'READINGS': 3}] == [self._updated_values(update) for update in storage.updates]
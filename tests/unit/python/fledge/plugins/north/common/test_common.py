@@ -151,3 +151,32 @@ class TestPluginsNorthCommon(object):
         """ """
 
         assert plugin_common.identify_unique_asset_codes(value) == expected
+
+    @pytest.mark.parametrize("value", [
+        "String 1", "up", "", " ", "x1", "nan", "NaN", "inf", "-inf", "Infinity", "nothing", "information",
+        "0", "1", "-1", "10", "-0", "+5", "007", " 12 ", "1_000", "1e3", "1E-3", "1.", ".5", "-1.0", "180.2",
+        "9007199254740993", "12345678901234567890", "٣", "0x10", "1,5", "26/04/2018 11:14",
+        0, 1, -1, 41, -159, 2 ** 53, -2 ** 53, 2 ** 53 + 1, -2 ** 53 - 1, 2 ** 64, 10 ** 400,
+        0.0, -0.0, 1.0, 1.2, -999.0, 90774.998, 1e16, 1e308, 5e-324, float("nan"),
+        True, False, [], [1, "2"], None, float("inf"), float("-inf"), "1e400",
+    ])
+    def test_convert_reading_types_matches_convert_to_type(self, value):
+        """ convert_reading_types gives the same result, or raises the same exception, as convert_to_type """
+        try:
+            expected = plugin_common.convert_to_type(value)
+        except Exception as ex:
+            with pytest.raises(type(ex)):
+                plugin_common.convert_reading_types({"value": value})
+        else:
+            actual = plugin_common.convert_reading_types({"value": value})["value"]
+            assert type(expected) is type(actual)
+            if expected == expected:
+                assert expected == actual
+            else:
+                assert actual != actual
+
+    def test_convert_reading_types_nested(self):
+        """ Only the top level datapoints and the ones of dictionaries nested at the second level are converted """
+        reading = {"a": "1", "b": {"c": "2", "d": {"e": "3.5", "f": {"g": "4"}}}, "h": ["5"]}
+        assert {"a": 1, "b": {"c": "2", "d": {"e": 3.5, "f": {"g": "4"}}}, "h": ["5"]} == \
+            plugin_common.convert_reading_types(reading)
@@ -33,6 +33,14 @@ async def mock_coro(*args, **kwargs):
     return None if len(args) == 0 else args[0]
 
 
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    # Verified tokens and roles are cached by User.Objects
+    User.Objects.clear_cache()
+    yield
+    User.Objects.clear_cache()
+
+
 @pytest.allure.feature("unit")
 @pytest.allure.story("api", "auth-mandatory")
 class TestAuthMandatory:
@@ -43,6 +43,14 @@ ADMIN_USER_HEADER = {'content-type': 'application/json', 'Authorization': 'admin
 REST_API_CAT_INFO = {'certificateName': {'value': 'fledge'}, 'authCertificateName': {'value': 'ca'}}
 
 
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    # Verified tokens and roles are cached by User.Objects
+    User.Objects.clear_cache()
+    yield
+    User.Objects.clear_cache()
+
+
 @pytest.allure.feature("unit")
 @pytest.allure.story("api", "certificate-store")
 class TestCertificateStore:
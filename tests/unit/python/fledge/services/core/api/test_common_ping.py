@@ -29,6 +29,7 @@ from aiohttp import web
 
 from fledge.services.core import routes
 from fledge.services.core import connect
+from fledge.services.core.api import common
 from fledge.services.core.api.common import _logger
 from fledge.common.web import middleware
 from fledge.common.storage_client.storage_client import StorageClientAsync
@@ -60,6 +61,16 @@ def get_machine_detail():
     return host_name, ip_addresses
 
 
+@pytest.fixture(autouse=True)
+def clear_ping_cache():
+    """ Each test reads the statistics and host details afresh """
+    common._host_details.update(expires=0, name=None, addresses=[], pending=None)
+    common._stats_snapshot.update(expires=0, values=None, pending=None)
+    yield
+    common._host_details.update(expires=0, name=None, addresses=[], pending=None)
+    common._stats_snapshot.update(expires=0, values=None, pending=None)
+
+
 @pytest.allure.feature("unit")
 @pytest.allure.story("api", "common")
 async def test_ping_http_allow_ping_true(aiohttp_server, aiohttp_client, loop, get_machine_detail):
@@ -608,3 +619,93 @@ async def test_restart_http(aiohttp_server, aiohttp_client, loop):
         content_dict = json.loads(content)
         assert "Fledge restart has been scheduled." == content_dict["message"]
     logger_info.assert_called_once_with('Executing controlled shutdown and start')
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("api", "common")
+async def test_ping_reuses_stats_snapshot(aiohttp_server, aiohttp_client, loop, get_machine_detail):
+    result = {"rows": [
+        {"value": 1, "key": "PURGED", "description": "blah6"},
+        {"value": 2, "key": "READINGS", "description": "blah1"},
+        {"value": 100, "key": "Readings Sent", "description": "Readings Sent North"},
+    ]}
+
+    async def mock_coro(*args, **kwargs):
+        # Long enough for the concurrent pings to find the read in progress
+        await asyncio.sleep(0.1)
+        return result
+
+    host_name, ip_addresses = get_machine_detail
+    mock_storage_client_async = MagicMock(spec=StorageClientAsync)
+    with patch.object(connect, 'get_storage_async', return_value=mock_storage_client_async):
+        with patch.object(mock_storage_client_async, 'query_tbl_with_payload', side_effect=mock_coro) as query_patch:
+            with patch.object(socket, 'gethostname', return_value=host_name) as hostname_patch:
+                app = web.Application(loop=loop, middlewares=[middleware.optional_auth_middleware])
+                routes.setup(app)
+                server = await aiohttp_server(app)
+                await server.start_server(loop=loop)
+                client = await aiohttp_client(server)
+                responses = await asyncio.gather(*[client.get('/fledge/ping') for _ in range(5)])
+                responses.append(await client.get('/fledge/ping'))
+                for resp in responses:
+                    assert 200 == resp.status
+                    content_dict = json.loads(await resp.text())
+                    assert 2 == content_dict["dataRead"]
+                    assert 100 == content_dict["dataSent"]
+                    assert 1 == content_dict["dataPurged"]
+                    assert content_dict['ipAddresses'] == ip_addresses
+                assert 1 == query_patch.call_count
+                assert 1 == hostname_patch.call_count
+
+                # Out of date snapshot and host details are read again
+                common._stats_snapshot['expires'] = 0
+                common._host_details['expires'] = 0
+                resp = await client.get('/fledge/ping')
+                assert 200 == resp.status
+                assert 2 == query_patch.call_count
+                assert 2 == hostname_patch.call_count
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("api", "common")
+async def test_ping_stats_read_failure_not_cached(aiohttp_server, aiohttp_client, loop):
+    result = {"rows": [{"value": 2, "key": "READINGS", "description": "blah1"}]}
+    calls = []
+
+    async def mock_coro(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise ConnectionError("storage unavailable")
+        return result
+
+    mock_storage_client_async = MagicMock(spec=StorageClientAsync)
+    with patch.object(connect, 'get_storage_async', return_value=mock_storage_client_async):
+        with patch.object(mock_storage_client_async, 'query_tbl_with_payload', side_effect=mock_coro):
+            app = web.Application(loop=loop, middlewares=[middleware.optional_auth_middleware])
+            routes.setup(app)
+            server = await aiohttp_server(app)
+            await server.start_server(loop=loop)
+            client = await aiohttp_client(server)
+            resp = await client.get('/fledge/ping')
+            assert 500 == resp.status
+            resp = await client.get('/fledge/ping')
+            assert 200 == resp.status
+            assert 2 == json.loads(await resp.text())["dataRead"]
+    assert 2 == len(calls)
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("api", "common")
+async def test_ping_host_details_failure_not_cached(loop, get_machine_detail):
+    calls = []
+
+    async def create_subprocess_exec(*args, **kwargs):
+        calls.append(args)
+        raise FileNotFoundError("hostname")
+
+    with patch.object(asyncio, 'create_subprocess_exec', side_effect=create_subprocess_exec):
+        with pytest.raises(FileNotFoundError):
+            await common._get_host_details()
+    assert [('hostname', '-I')] == calls
+    assert common._host_details['pending'] is None
+    assert get_machine_detail == await common._get_host_details()
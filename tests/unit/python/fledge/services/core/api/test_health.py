@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Test fledge/services/core/api/health.py """
+
+import json
+from unittest.mock import MagicMock, patch
+
+from aiohttp import web
+import pytest
+
+from fledge.common.configuration_manager import ConfigurationManager, ConfigurationManagerSingleton, \
+    ConfigurationCache
+from fledge.common.storage_client.storage_client import StorageClientAsync
+from fledge.services.core import connect
+from fledge.services.core import routes
+
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("api", "health")
+class TestHealth:
+
+    @pytest.fixture
+    def client(self, loop, test_client):
+        app = web.Application(loop=loop)
+        # fill the routes table
+        routes.setup(app)
+        return loop.run_until_complete(test_client(app))
+
+    @pytest.fixture
+    def reset_singleton(self):
+        ConfigurationManagerSingleton._shared_state = {}
+        yield
+        ConfigurationManagerSingleton._shared_state = {}
+
+    async def test_get_cache_health(self, client, reset_singleton):
+        storage_client_mock = MagicMock(StorageClientAsync)
+        c_mgr = ConfigurationManager(storage_client_mock)
+        c_mgr._cacheManager = ConfigurationCache(max_cache_size=2, max_cache_bytes=4096)
+        c_mgr._cacheManager.update("cat1", "desc1", {"item": {"value": "1"}})
+        assert "cat1" in c_mgr._cacheManager
+        assert "cat2" not in c_mgr._cacheManager
+        with patch.object(connect, 'get_storage_async', return_value=storage_client_mock):
+            resp = await client.get('/fledge/health/cache')
+        assert 200 == resp.status
+        result = json.loads(await resp.text())
+        assert {"configuration": {"size": 1, "maxSize": 2, "bytes": 24, "maxBytes": 4096, "hit": 1, "miss": 1,
+                                  "evictions": 0}} == result
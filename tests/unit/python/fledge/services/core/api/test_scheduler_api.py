@@ -292,6 +292,50 @@ class TestSchedules:
             assert {'status': True, 'message': 'Schedule successfully enabled',
                     'scheduleId': '{}'.format(self._random_uuid)} == json_response
 
+    @pytest.mark.parametrize("action, method, message", [
+        ("enable", "enable_schedules", "Schedule successfully enabled"),
+        ("disable", "disable_schedules", "Schedule successfully disabled")
+    ])
+    async def test_bulk_schedules(self, client, action, method, message):
+        sch_id_by_name = str(uuid.uuid4())
+        missing_id = uuid.uuid4()
+
+        @asyncio.coroutine
+        def q_result(*args):
+            assert 'schedules' == args[0]
+            assert {"return": ["id", "schedule_name"],
+                    "where": {"column": "schedule_name", "condition": "in", "value": ["sine"]}} == json.loads(args[1])
+            return {"count": 1, "rows": [{"id": sch_id_by_name, "schedule_name": "sine"}]}
+
+        async def bulk(schedule_ids):
+            assert [self._random_uuid, missing_id, uuid.UUID(sch_id_by_name)] == schedule_ids
+            return {self._random_uuid: (True, message), missing_id: (False, "No such Schedule"),
+                    uuid.UUID(sch_id_by_name): (True, message)}
+
+        storage_client_mock = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=storage_client_mock):
+            with patch.object(storage_client_mock, 'query_tbl_with_payload', side_effect=q_result):
+                with patch.object(server.Server.scheduler, method, side_effect=bulk) as patch_bulk:
+                    resp = await client.put('/fledge/schedule/{}'.format(action), data=json.dumps(
+                        {"schedule_ids": [str(self._random_uuid), str(missing_id)], "schedule_names": ["sine"]}))
+                    assert 200 == resp.status
+                    json_response = json.loads(await resp.text())
+                    assert {"schedules": [
+                        {'scheduleId': str(self._random_uuid), 'status': True, 'message': message},
+                        {'scheduleId': str(missing_id), 'status': False, 'message': "No such Schedule"},
+                        {'scheduleId': sch_id_by_name, 'status': True, 'message': message}]} == json_response
+                assert 1 == patch_bulk.call_count
+
+    @pytest.mark.parametrize("action, payload, response_code, response_message", [
+        ("enable", {"schedule_ids": "abc"}, 400, 'schedule_ids and schedule_names must be lists'),
+        ("disable", {"schedule_names": []}, 400, 'Schedule names or IDs are required'),
+        ("enable", {"schedule_ids": ["bla"]}, 404, 'No Schedule with ID bla'),
+    ])
+    async def test_bulk_schedules_bad_data(self, client, action, payload, response_code, response_message):
+        resp = await client.put('/fledge/schedule/{}'.format(action), data=json.dumps(payload))
+        assert response_code == resp.status
+        assert response_message == resp.reason
+
     async def test_enable_schedule_bad_data(self, client):
             resp = await client.put('/fledge/schedule/{}/enable'.format("bla"))
             assert 404 == resp.status
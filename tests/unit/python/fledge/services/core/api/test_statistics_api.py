@@ -7,6 +7,7 @@
 """ Test fledge/services/core/api/statistics.py """
 
 import asyncio
+import datetime
 import json
 import sys
 
@@ -16,12 +17,23 @@ import pytest
 
 from fledge.services.core import routes
 from fledge.services.core import connect
+from fledge.services.core import server
+from fledge.services.core.api import statistics
 from fledge.common.storage_client.storage_client import StorageClientAsync
 
 __copyright__ = "Copyright (c) 2017 OSIsoft, LLC"
 __license__ = "Apache 2.0"
 __version__ = "${VERSION}"
 
+_RECENT_HISTORY_RETURN = ["id", "key", "value", {"column": "history_ts", "alias": "history_ts",
+                                                  "format": "YYYY-MM-DD HH24:MI:SS.MS"}]
+
+
+def _history_ts(seconds_ago):
+    """ history_ts, in local time, of a row written seconds_ago """
+    ts = datetime.datetime.now() - datetime.timedelta(seconds=seconds_ago)
+    return ts.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
 
 @pytest.allure.feature("unit")
 @pytest.allure.story("api", "statistics")
@@ -34,6 +46,12 @@ class TestStatistics:
         routes.setup(app)
         return loop.run_until_complete(test_client(app))
 
+    @pytest.fixture(autouse=True)
+    def reset_recent_history(self):
+        statistics._recent_history.reset()
+        yield
+        statistics._recent_history.reset()
+
     async def test_get_stats(self, client):
         payload = {"return": ["key", "description", "value"], "sort": {"column": "key", "direction": "asc"}}
         result = {"rows": [{"value": 0, "key": "BUFFERED", "description": "blah1"},
@@ -472,6 +490,85 @@ class TestStatistics:
         assert query_patch.called
         assert 2 == query_patch.call_count
 
+    @pytest.mark.parametrize("param, bucket_size, aggregate", [
+        ("?days=30&maxPoints=500", 5184, "sum"),
+        ("?minutes=10&maxPoints=500", 15, "sum"),
+        ("?hours=12&resolution=600&aggregate=max", 600, "max"),
+        ("?resolution=3600&aggregate=avg", 3600, "avg")
+    ])
+    async def test_get_statistics_history_downsampled(self, client, param, bucket_size, aggregate):
+        output = {"interval": bucket_size,
+                  'statistics': [{"READINGS": 120, "BUFFERED": 10, "history_ts": "2018-02-20 13:00:00"},
+                                 {"READINGS": 90, "history_ts": "2018-02-20 12:00:00"}]}
+
+        @asyncio.coroutine
+        def q_result(*args):
+            table = args[0]
+            payload = json.loads(args[1])
+
+            if table == 'schedules':
+                return {"rows": [{"schedule_interval": "00:00:15"}]}
+
+            if table == 'statistics_history':
+                assert {"operation": aggregate, "column": "value", "alias": "value"} == payload["aggregate"]
+                assert "key" == payload["group"]
+                assert {"timestamp": "history_ts", "size": str(bucket_size), "format": "YYYY-MM-DD HH24:MI:SS",
+                        "alias": "history_ts"} == payload["timebucket"]
+                assert "sort" not in payload
+                return {"rows": [{"key": "READINGS", "value": 120, "history_ts": "2018-02-20 13:00:00"},
+                                 {"key": "BUFFERED", "value": 10, "history_ts": "2018-02-20 13:00:00"},
+                                 {"key": "READINGS", "value": 90, "history_ts": "2018-02-20 12:00:00"}]}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+            with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result) as query_patch:
+                resp = await client.get("/fledge/statistics/history{}".format(param))
+            assert 200 == resp.status
+            assert output == json.loads(await resp.text())
+        assert 2 == query_patch.call_count
+
+    @pytest.mark.parametrize("param, msg", [
+        ("?days=1&maxPoints=0", "maxPoints must be a positive integer"),
+        ("?days=1&maxPoints=many", "maxPoints must be a positive integer"),
+        ("?maxPoints=100", "maxPoints requires the minutes, hours or days of history to return"),
+        ("?resolution=-60", "resolution must be a positive integer"),
+        ("?resolution=60&aggregate=min", "aggregate must be one of sum, avg, max")
+    ])
+    async def test_get_statistics_history_bad_downsampling(self, client, param, msg):
+        @asyncio.coroutine
+        def q_result(*args):
+            assert 'schedules' == args[0]
+            return {"rows": [{"schedule_interval": "00:00:15"}]}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+            with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result):
+                resp = await client.get("/fledge/statistics/history{}".format(param))
+            assert 400 == resp.status
+            assert msg == resp.reason
+
+    async def test_get_statistics_history_chunked(self, client):
+        rows = [{"key": key, "value": i, "history_ts": "2018-02-20 13:{:02d}:{:02d}.000".format(i // 60, i % 60)}
+                for i in range(2500) for key in ("READINGS", "PURGED")]
+
+        @asyncio.coroutine
+        def q_result(*args):
+            if args[0] == 'schedules':
+                return {"rows": [{"schedule_interval": "00:00:15"}]}
+            return {"rows": rows}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+            with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result):
+                resp = await client.get("/fledge/statistics/history")
+            assert 200 == resp.status
+            assert 'chunked' == resp.headers['Transfer-Encoding']
+            assert 'application/json; charset=utf-8' == resp.headers['Content-Type']
+            result = json.loads(await resp.text())
+        assert 15 == result["interval"]
+        assert 2500 == len(result["statistics"])
+        assert {"history_ts": "2018-02-20 13:00:01.000", "READINGS": 1, "PURGED": 1} == result["statistics"][1]
+
     @pytest.mark.parametrize("params, msg", [
         ("", "periods request parameter is required"),
         ("?period", "periods request parameter is required"),
@@ -492,18 +589,14 @@ class TestStatistics:
         assert 400 == resp.status
         assert msg == resp.reason
 
-    async def test_get_statistics_rate(self, client, params='?periods=1,5&statistics=readings'):
-        output = {'rates': {'readings': {'1': 120.52585669781932, '5': 120.52585669781932}}}
+    async def test_get_statistics_rate(self, client, params='?periods=1,5&statistics=readings,PURGED'):
+        # 1 minute is the last 4 rows of a key, written 15 seconds apart, 5 minutes all of them
+        output = {'rates': {'readings': {'1': 58.0, '5': 34.0}, 'PURGED': {'1': 0, '5': 0}}}
         p1 = {'where': {'value': 'stats collector', 'condition': '=', 'column': 'process_name'},
               'return': ['schedule_interval']}
-        p2 = {"return": ["key"], "aggregate": [{"operation": "sum", "column": "value"},
-                                               {"operation": "count", "column": "value"}],
-              "where": {"column": "history_ts", "condition": ">=", "value": "1590126369.123255",
-                        "and": {"column": "key", "condition": "=", "value": "READINGS"}}, "group": "key"}
-        p3 = {"return": ["key"], "aggregate": [{"operation": "sum", "column": "value"},
-                                               {"operation": "count", "column": "value"}],
-              "where": {"column": "history_ts", "condition": ">=", "value": "1590126369.123255",
-                        "and": {"column": "key", "condition": "=", "value": "READINGS"}}, "group": "key"}
+        p2 = {"return": _RECENT_HISTORY_RETURN,
+              "where": {"column": "history_ts", "condition": "newer", "value": 3600},
+              "sort": {"column": "id", "direction": "asc"}}
 
         @asyncio.coroutine
         def q_result(*args):
@@ -515,9 +608,9 @@ class TestStatistics:
                 return {"rows": [{"schedule_interval": "00:00:15"}]}
 
             if table == 'statistics_history':
-                # TODO: datetime patch required which is a bit tricky
-                # assert p2 == json.loads(payload)
-                return {"rows": [{'sum_value': 96722, 'count_value': 3210, "key": "READINGS"}], "count": 1}
+                assert p2 == json.loads(payload)
+                return {"rows": [{"id": i, "key": "readings", "value": i, "history_ts": _history_ts((16 - i) * 15 + 5)}
+                                 for i in range(1, 17)], "count": 16}
 
         mock_async_storage_client = MagicMock(StorageClientAsync)
         with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
@@ -526,5 +619,114 @@ class TestStatistics:
                 assert 200 == resp.status
                 r = await resp.text()
                 assert output == json.loads(r)
-            assert query_patch.called
+            assert 2 == query_patch.call_count
+
+    async def test_get_statistics_rate_catch_up(self, client, params='?periods=1&statistics=READINGS'):
+        history = [{"id": 1, "key": "READINGS", "value": 10, "history_ts": _history_ts(20)},
+                   {"id": 2, "key": "PURGED", "value": 1, "history_ts": _history_ts(20)}]
+
+        @asyncio.coroutine
+        def q_result(*args):
+            table = args[0]
+            payload = json.loads(args[1])
+
+            if table == 'schedules':
+                return {"rows": [{"schedule_interval": "00:00:15"}]}
+
+            if table == 'statistics_history':
+                if payload["where"]["column"] == "id":
+                    return {"rows": [row for row in history if row["id"] > payload["where"]["value"]]}
+                return {"rows": history[:]}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+            with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result) as query_patch:
+                resp = await client.get("/fledge/statistics/rate{}".format(params))
+                assert {'rates': {'READINGS': {'1': 40.0}}} == json.loads(await resp.text())
+                history.append({"id": 3, "key": "READINGS", "value": 20, "history_ts": _history_ts(5)})
+                resp = await client.get("/fledge/statistics/rate{}".format(params))
+                assert {'rates': {'READINGS': {'1': 60.0}}} == json.loads(await resp.text())
+            # only the rows written since the previous call are read
+            args, kwargs = query_patch.call_args
+            assert {"return": _RECENT_HISTORY_RETURN, "where": {"column": "id", "condition": ">", "value": 2},
+                    "sort": {"column": "id", "direction": "asc"}} == json.loads(args[1])
+
+    async def test_get_statistics_rate_longer_than_ring(self, client,
+                                                        params='?periods=1,1440&statistics=READINGS,PURGED'):
+        output = {'rates': {'READINGS': {'1': 40.0, '1440': 120.52585669781932}, 'PURGED': {'1': 0, '1440': 0}}}
+        p3 = {"return": ["key"], "aggregate": [{"operation": "sum", "column": "value"},
+                                               {"operation": "count", "column": "value"}],
+              "where": {"column": "history_ts", "condition": "newer", "value": 86400,
+                        "and": {"column": "key", "condition": "in", "value": ["READINGS", "PURGED"]}},
+              "group": "key"}
+
+        @asyncio.coroutine
+        def q_result(*args):
+            table = args[0]
+            payload = json.loads(args[1])
+
+            if table == 'schedules':
+                return {"rows": [{"schedule_interval": "00:00:15"}]}
+
+            if table == 'statistics_history':
+                if "group" in payload:
+                    assert p3 == payload
+                    return {"rows": [{'sum_value': 96722, 'count_value': 3210, "key": "READINGS"}], "count": 1}
+                return {"rows": [{"id": 1, "key": "READINGS", "value": 10, "history_ts": _history_ts(10)}]}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+            with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result) as query_patch:
+                resp = await client.get("/fledge/statistics/rate{}".format(params))
+                assert 200 == resp.status
+                assert output == json.loads(await resp.text())
             assert 3 == query_patch.call_count
+
+    async def test_get_statistics_rate_stalled_collector(self, client, params='?periods=1,5&statistics=READINGS'):
+        """ Rows older than a period are not part of its rate, whatever the schedule interval """
+
+        @asyncio.coroutine
+        def q_result(*args):
+            if args[0] == 'schedules':
+                return {"rows": [{"schedule_interval": "00:00:15"}]}
+            # The stats collector last ran 2 minutes ago
+            return {"rows": [{"id": 1, "key": "READINGS", "value": 10, "history_ts": _history_ts(150)},
+                             {"id": 2, "key": "READINGS", "value": 30, "history_ts": _history_ts(120)}]}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+            with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result):
+                resp = await client.get("/fledge/statistics/rate{}".format(params))
+                assert 200 == resp.status
+                assert {'rates': {'READINGS': {'1': 0, '5': 80.0}}} == json.loads(await resp.text())
+
+    async def test_recent_history_lock_per_loop(self):
+        recent_history = statistics._RecentHistory()
+        assert recent_history._lock is None
+        lock = recent_history._get_lock()
+        assert lock is recent_history._get_lock()
+        with patch.object(asyncio, 'get_event_loop', return_value=MagicMock()):
+            assert lock is not recent_history._get_lock()
+
+    async def test_get_statistics_rate_interval_from_scheduler(self, client, params='?periods=1&statistics=READINGS'):
+        schedule = MagicMock(process_name='stats collector', repeat=datetime.timedelta(seconds=30))
+
+        @asyncio.coroutine
+        def get_schedules():
+            return [MagicMock(process_name='purge', repeat=datetime.timedelta(hours=1)), schedule]
+
+        @asyncio.coroutine
+        def q_result(*args):
+            assert 'statistics_history' == args[0]
+            return {"rows": [{"id": 1, "key": "READINGS", "value": 10, "history_ts": _history_ts(65)},
+                             {"id": 2, "key": "READINGS", "value": 20, "history_ts": _history_ts(35)},
+                             {"id": 3, "key": "READINGS", "value": 30, "history_ts": _history_ts(5)}]}
+
+        mock_async_storage_client = MagicMock(StorageClientAsync)
+        with patch.object(server.Server, 'scheduler', MagicMock(get_schedules=get_schedules)):
+            with patch.object(connect, 'get_storage_async', return_value=mock_async_storage_client):
+                with patch.object(mock_async_storage_client, 'query_tbl_with_payload', side_effect=q_result):
+                    resp = await client.get("/fledge/statistics/rate{}".format(params))
+                    assert 200 == resp.status
+                    # 1 minute is the last 2 rows at a 30 seconds interval
+                    assert {'rates': {'READINGS': {'1': 50.0}}} == json.loads(await resp.text())
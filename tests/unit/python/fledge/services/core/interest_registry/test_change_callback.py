@@ -263,3 +263,100 @@ class TestChangeCallback:
                     'Unable to notify microservice with uuid %s due to exception: %s', s_id_1, '')
             post_patch.assert_has_calls([call('http://saddress1:1/fledge/change', data='{"category": "catname1", "items": null}', headers={'content-type': 'application/json'})])
         cm_get_patch.assert_called_once_with('catname1')
+
+    @pytest.mark.asyncio
+    async def test_run_timeout_does_not_delay_others(self):
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        cfg_mgr = ConfigurationManager(storage_client_mock)
+
+        with patch.object(ServiceRegistry._logger, 'info'):
+            s_id_1 = ServiceRegistry.register('sname1', 'Southbound', 'saddress1', 1, 1, 'http')
+            s_id_2 = ServiceRegistry.register('sname2', 'Southbound', 'saddress2', 2, 2, 'http')
+        i_reg = InterestRegistry(cfg_mgr)
+        i_reg.register(s_id_1, 'catname1')
+        i_reg.register(s_id_2, 'catname1')
+
+        notified = []
+        notified_while_hung = []
+
+        class AsyncSessionContextManagerMock:
+            def __init__(self, url):
+                self.url = url
+
+            async def __aenter__(self):
+                if self.url == 'http://saddress1:1/fledge/change':
+                    # the first service hangs while the second one is notified
+                    for _ in range(100):
+                        await asyncio.sleep(0)
+                    notified_while_hung.extend(notified)
+                    raise asyncio.TimeoutError
+                notified.append(self.url)
+                client_response_mock = MagicMock(spec=aiohttp.ClientResponse)
+                client_response_mock.text.side_effect = asyncio.coroutine(lambda: None)
+                client_response_mock.status = 200
+                return client_response_mock
+
+            async def __aexit__(self, *args):
+                return None
+
+        def post(url, **kwargs):
+            return AsyncSessionContextManagerMock(url)
+
+        async def get_items(category_name):
+            return None
+
+        with patch.object(ConfigurationManager, 'get_category_all_items', side_effect=get_items):
+            with patch.object(aiohttp.ClientSession, 'post', side_effect=post) as post_patch:
+                with patch.object(cb._LOGGER, 'error') as error_patch:
+                    await cb.run('catname1')
+                error_patch.assert_called_once_with(
+                    'Unable to notify microservice with uuid %s as it did not respond within %s seconds', s_id_1,
+                    cb._NOTIFY_TIMEOUT)
+            assert 2 == post_patch.call_count
+        assert ['http://saddress2:2/fledge/change'] == notified_while_hung
+        session, _ = cb._get_session()
+        assert cb._NOTIFY_TIMEOUT == session.timeout.total
+        await cb.close_session()
+
+    @pytest.mark.asyncio
+    async def test_run_coalesces_changes(self):
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        cfg_mgr = ConfigurationManager(storage_client_mock)
+
+        with patch.object(ServiceRegistry._logger, 'info'):
+            s_id_1 = ServiceRegistry.register('sname1', 'Southbound', 'saddress1', 1, 1, 'http')
+        i_reg = InterestRegistry(cfg_mgr)
+        i_reg.register(s_id_1, 'catname1')
+
+        class AsyncSessionContextManagerMock(MagicMock):
+            async def __aenter__(self):
+                client_response_mock = MagicMock(spec=aiohttp.ClientResponse)
+                client_response_mock.text.side_effect = asyncio.coroutine(lambda: None)
+                client_response_mock.status = 200
+                return client_response_mock
+
+            async def __aexit__(self, *args):
+                return None
+
+        versions = []
+
+        async def get_items(category_name):
+            versions.append(len(versions) + 1)
+            if len(versions) == 1:
+                # three more changes while the first one is being notified
+                for _ in range(3):
+                    await cb.run(category_name)
+            return {"version": versions[-1]}
+
+        with patch.object(ConfigurationManager, 'get_category_all_items', side_effect=get_items) as cm_get_patch:
+            with patch.object(aiohttp.ClientSession, 'post', return_value=AsyncSessionContextManagerMock()) as post_patch:
+                await cb.run('catname1')
+            post_patch.assert_has_calls([
+                call('http://saddress1:1/fledge/change', data='{"category": "catname1", "items": {"version": 1}}',
+                     headers={'content-type': 'application/json'}),
+                call('http://saddress1:1/fledge/change', data='{"category": "catname1", "items": {"version": 2}}',
+                     headers={'content-type': 'application/json'})])
+            assert 2 == post_patch.call_count
+        assert 2 == cm_get_patch.call_count
+        assert not cb._notifying and not cb._changed
+        await cb.close_session()
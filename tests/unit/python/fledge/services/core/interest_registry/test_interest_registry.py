@@ -153,6 +153,21 @@ class TestInterestRegistry:
         assert ret_val is not None
         assert ret_val == [1]
 
+    def test_get_after_unregister(self, reset_singleton):
+        configuration_manager_mock = MagicMock(spec=ConfigurationManager)
+        i_reg = InterestRegistry(configuration_manager_mock)
+        id_1_1 = i_reg.register('muuid1', 'catname1')
+        id_2_1 = i_reg.register('muuid2', 'catname1')
+        i_reg.unregister(id_1_1)
+        assert [id_2_1] == [i._registration_id for i in i_reg.get(category_name='catname1')]
+        with pytest.raises(interest_registry_exceptions.DoesNotExist):
+            i_reg.get(microservice_uuid='muuid1')
+        with pytest.raises(interest_registry_exceptions.DoesNotExist):
+            i_reg.get(registration_id=id_1_1)
+        # The interest can be registered again
+        id_1_1 = i_reg.register('muuid1', 'catname1')
+        assert [id_2_1, id_1_1] == [i._registration_id for i in i_reg.get(category_name='catname1')]
+
     def test_get_with_and_filter(self, reset_singleton):
         configuration_manager_mock = MagicMock(spec=ConfigurationManager)
         i_reg = InterestRegistry(configuration_manager_mock)
@@ -276,6 +276,139 @@ class TestScheduler:
         assert 'COAP listener south' in args1
         assert 'OMF to PI north' in args2
 
+    def test__timer_queue(self):
+        queue = Scheduler._TimerQueue()
+        first = Scheduler._ScheduleExecution(uuid.uuid4(), queue)
+        second = Scheduler._ScheduleExecution(uuid.uuid4(), queue)
+        first.next_start_time = 100
+        second.next_start_time = 50
+        assert (50, second) == queue.head()
+
+        # Rescheduling leaves the previous entry in the heap, it is dropped when it reaches the head
+        second.next_start_time = 200
+        assert 3 == len(queue)
+        assert (100, first) == queue.head()
+        assert 2 == len(queue)
+
+        # A queued manual execution goes ahead of every timer until it has started
+        second.start_now = True
+        assert (queue.NOW, second) == queue.head()
+        second.start_now = False
+        assert (100, first) == queue.head()
+
+        first.next_start_time = None
+        assert (200, second) == queue.head()
+        second.timer_queue = None
+        assert queue.head() is None
+        assert 0 == len(queue)
+
+    def test__timer_queue_compaction(self):
+        queue = Scheduler._TimerQueue()
+        execution = Scheduler._ScheduleExecution(uuid.uuid4(), queue)
+        for i in range(1000, 0, -1):
+            execution.next_start_time = i
+        assert len(queue) <= queue._MIN_COMPACT_SIZE
+        assert (1, execution) == queue.head()
+
+    @pytest.mark.asyncio
+    async def test__check_schedules_due_only(self, mocker):
+        # GIVEN
+        scheduler = Scheduler()
+        mocker.patch.object(scheduler._logger, "info")
+        mocker.patch.multiple(scheduler, _max_running_tasks=10, current_time=1000)
+        rows = {}
+        for name, next_start_time, exclusive in (("due", 990, False), ("exclusive", 995, True), ("later", 1030, False)):
+            row = scheduler._ScheduleRow(id=uuid.uuid4(), name=name, type=Schedule.Type.INTERVAL, time=None, day=None,
+                                         repeat=datetime.timedelta(seconds=60), repeat_seconds=60,
+                                         exclusive=exclusive, enabled=True, process_name="purge")
+            scheduler._schedules[row.id] = row
+            scheduler._new_schedule_execution(row.id).next_start_time = next_start_time
+            rows[name] = row
+        started = []
+
+        async def start_task(schedule):
+            started.append(schedule.name)
+        mocker.patch.object(scheduler, '_start_task', side_effect=start_task)
+
+        # WHEN
+        earliest_start_time = await scheduler._check_schedules()
+
+        # THEN
+        assert ["due", "exclusive"] == started
+        # The nonexclusive schedule is rescheduled before its task starts, the exclusive one when its task completes
+        assert 1030 == earliest_start_time
+        assert scheduler._schedule_executions[rows["due"].id].next_start_time > time.time()
+        assert 995 == scheduler._schedule_executions[rows["exclusive"].id].next_start_time
+
+        # Nothing else is due, a manual execution starts at once
+        started.clear()
+        scheduler._schedule_executions[rows["later"].id].start_now = True
+        assert 1030 == await scheduler._check_schedules()
+        assert ["later"] == started
+        assert scheduler._schedule_executions[rows["later"].id].start_now is False
+
+    @pytest.mark.asyncio
+    async def test__check_schedules_launch_governor(self, mocker):
+        # GIVEN
+        scheduler = Scheduler()
+        log_info = mocker.patch.object(scheduler._logger, "info")
+        mocker.patch.multiple(scheduler, _max_running_tasks=10, _max_concurrent_launches=2, current_time=1000)
+        rows = {}
+        for name, schedule_type, next_start_time in (("late", Schedule.Type.INTERVAL, 990),
+                                                     ("early", Schedule.Type.INTERVAL, 980),
+                                                     ("later", Schedule.Type.INTERVAL, 995),
+                                                     ("service", Schedule.Type.STARTUP, 999)):
+            row = scheduler._ScheduleRow(id=uuid.uuid4(), name=name, type=schedule_type, time=None, day=None,
+                                         repeat=datetime.timedelta(seconds=60), repeat_seconds=60,
+                                         exclusive=True, enabled=True, process_name="purge")
+            scheduler._schedules[row.id] = row
+            scheduler._new_schedule_execution(row.id).next_start_time = next_start_time
+            rows[name] = row
+        started = []
+
+        async def start_task(schedule):
+            started.append(schedule.name)
+        mocker.patch.object(scheduler, '_start_task', side_effect=start_task)
+
+        # WHEN
+        retry_time = await scheduler._check_schedules()
+
+        # THEN
+        # STARTUP schedules go first, then tasks in the order they fell due
+        assert ["service", "early"] == started
+        assert 1000 + scheduler._LAUNCH_POLL_SECONDS == retry_time
+        stats = scheduler.get_launch_statistics()
+        assert 2 == stats["queued"]
+        assert 2 == stats["starting"]
+        assert 4 == stats["maxQueueDepth"]
+        assert 1 == stats["deferred"]
+        assert 20 == stats["maxLatency"]
+        assert scheduler._schedule_executions[rows["late"].id].launch_pending is True
+
+        # A launch slot is released once the process settles
+        scheduler.current_time = 1000 + scheduler._LAUNCH_SETTLE_SECONDS
+        assert await scheduler._check_schedules() is None
+        assert ["service", "early", "late", "later"] == started
+        stats = scheduler.get_launch_statistics()
+        assert 0 == stats["queued"]
+        assert 4 == stats["launched"]
+        assert 11.5 == stats["averageLatency"]
+        log_info.assert_has_calls([call("Holding back process launches: %s queued, %s starting up", 2, 2),
+                                   call("Launch queue drained, maximum launch latency %.1f seconds", 20)])
+
+    def test__launch_offset(self, mocker):
+        scheduler = Scheduler()
+        row = scheduler._ScheduleRow(id=uuid.UUID("2b614d26-760f-11e7-b5a5-be2e44b06b34"), name="test",
+                                     type=Schedule.Type.INTERVAL, time=None, day=None,
+                                     repeat=datetime.timedelta(seconds=5), repeat_seconds=5,
+                                     exclusive=True, enabled=True, process_name="purge")
+        offset = scheduler._launch_offset(row)
+        assert 0 <= offset < 5
+        assert offset == scheduler._launch_offset(row)
+        scheduler._launch_jitter_seconds = 0
+        assert 0 == scheduler._launch_offset(row)
+        assert 0 == scheduler._launch_offset(row._replace(repeat=None, repeat_seconds=None))
+
     @pytest.mark.asyncio
     @pytest.mark.skip("_scheduler_loop() not suitable for unit testing. Will be tested during System tests.")
     async def test__scheduler_loop(self, mocker):
@@ -507,6 +640,20 @@ class TestScheduler:
                         "default": str(Scheduler._DEFAULT_MAX_COMPLETED_TASK_AGE_DAYS),
                         "value": str(Scheduler._DEFAULT_MAX_COMPLETED_TASK_AGE_DAYS)
                     },
+                    "max_concurrent_launches": {
+                        "description": "Maximum number of processes that can be starting up at any given time, "
+                                       "0 for no limit. Services are started ahead of tasks",
+                        "type": "integer",
+                        "default": str(Scheduler._DEFAULT_MAX_CONCURRENT_LAUNCHES),
+                        "value": "2"
+                    },
+                    "launch_jitter_seconds": {
+                        "description": "Interval schedules are offset by up to this number of seconds so that "
+                                       "schedules with the same interval do not start together",
+                        "type": "integer",
+                        "default": str(Scheduler._DEFAULT_LAUNCH_JITTER_SECONDS),
+                        "value": "30"
+                    },
             }
         
         # Changed in version 3.8: patch() now returns an AsyncMock if the target is an async function.
@@ -532,6 +679,8 @@ class TestScheduler:
         assert 1 == get_cat.call_count
         assert scheduler._max_running_tasks is not None
         assert scheduler._max_completed_task_age is not None
+        assert 2 == scheduler._max_concurrent_launches
+        assert 30 == scheduler._launch_jitter_seconds
 
     @pytest.mark.asyncio
     async def test_start(self, mocker):
@@ -1053,6 +1202,88 @@ class TestScheduler:
         calls = [call('SCHCH', {'schedule': {'name': 'backup hourly', 'type': Schedule.Type.INTERVAL, 'processName': 'backup', 'exclusive': True, 'repeat': 3600.0, 'enabled': True}})]
         audit_logger.assert_has_calls(calls, any_order=True)
 
+    @pytest.mark.asyncio
+    async def test_enable_schedules(self, mocker):
+        # GIVEN
+        scheduler, schedule, log_info, log_exception, log_error, log_debug = await self.scheduler_fixture(mocker)
+        backup_id = uuid.UUID("d1631422-9ec6-11e7-abc4-cec278b6b50a")  # backup, disabled
+        ocs_id = uuid.UUID("5d7fed92-fb9a-11e7-8c3f-9a214cf093ae")  # OMF to OCS north, disabled
+        pi_id = uuid.UUID("2b614d26-760f-11e7-b5a5-be2e44b06b34")  # OMF to PI north, enabled
+        missing_id = uuid.uuid4()
+        resume = mocker.patch.object(scheduler, '_resume_check_schedules')
+        audit_logger = mocker.patch.object(AuditLogger, 'information', return_value=asyncio.ensure_future(mock_task()))
+        payloads = []
+
+        async def update_tbl(table_name, payload):
+            payloads.append(json.loads(payload))
+            return {"count": 2}
+        mocker.patch.object(scheduler._storage_async, 'update_tbl', side_effect=update_tbl)
+        scheduler._schedule_first_task.reset_mock()
+
+        # WHEN
+        result = await scheduler.enable_schedules([backup_id, pi_id, missing_id, ocs_id])
+
+        # THEN
+        assert {backup_id: (True, "Schedule successfully enabled"), pi_id: (True, "Schedule is already enabled"),
+                missing_id: (False, "No such Schedule"), ocs_id: (True, "Schedule successfully enabled")} == result
+        assert [backup_id, pi_id, missing_id, ocs_id] == list(result.keys())
+        assert [{"values": {"enabled": "t"}, "where": {"column": "id", "condition": "in",
+                                                       "value": [str(backup_id), str(ocs_id)]}}] == payloads
+        assert scheduler._schedules[backup_id].enabled is True
+        assert scheduler._schedules[ocs_id].enabled is True
+        assert backup_id in scheduler._schedule_executions
+        assert ocs_id in scheduler._schedule_executions
+        assert 2 == scheduler._schedule_first_task.call_count
+        assert 1 == resume.call_count
+        assert 2 == audit_logger.call_count
+
+    @pytest.mark.asyncio
+    async def test_disable_schedules(self, mocker):
+        # GIVEN
+        scheduler, schedule, log_info, log_exception, log_error, log_debug = await self.scheduler_fixture(mocker)
+        purge_id = uuid.UUID("cea17db8-6ccc-11e7-907b-a6006ad3dba0")  # purge, enabled
+        pi_id = uuid.UUID("2b614d26-760f-11e7-b5a5-be2e44b06b34")  # OMF to PI north, enabled
+        ocs_id = uuid.UUID("5d7fed92-fb9a-11e7-8c3f-9a214cf093ae")  # OMF to OCS north, disabled
+        audit_logger = mocker.patch.object(AuditLogger, 'information', return_value=asyncio.ensure_future(mock_task()))
+        payloads = []
+
+        async def update_tbl(table_name, payload):
+            payloads.append(json.loads(payload))
+            return {"count": 2}
+        mocker.patch.object(scheduler._storage_async, 'update_tbl', side_effect=update_tbl)
+
+        # WHEN
+        result = await scheduler.disable_schedules([purge_id, ocs_id, pi_id], record_audit_trail=False)
+
+        # THEN
+        assert {purge_id: (True, "Schedule successfully disabled"),
+                ocs_id: (True, "Schedule {} already disabled".format(ocs_id)),
+                pi_id: (True, "Schedule successfully disabled")} == result
+        assert [{"values": {"enabled": "f"}, "where": {"column": "id", "condition": "in",
+                                                       "value": [str(purge_id), str(pi_id)]}}] == payloads
+        assert scheduler._schedules[purge_id].enabled is False
+        assert scheduler._schedules[pi_id].enabled is False
+        log_info.assert_has_calls([call('No Task running for Schedule %s', str(purge_id)),
+                                   call('No Task running for Schedule %s', str(pi_id))], any_order=True)
+        assert 0 == audit_logger.call_count
+
+    @pytest.mark.asyncio
+    async def test__wait_for_task_end(self, mocker):
+        scheduler = Scheduler()
+        task_process = scheduler._TaskProcess()
+        task_process.task_id = uuid.uuid4()
+        scheduler._task_processes[task_process.task_id] = task_process
+
+        def remove():
+            del scheduler._task_processes[task_process.task_id]
+            scheduler._task_ended(task_process)
+
+        assert await scheduler._wait_for_task_end(task_process, 0.01) is False
+        asyncio.get_event_loop().call_soon(remove)
+        assert await scheduler._wait_for_task_end(task_process, 5) is True
+        # Already ended
+        assert await scheduler._wait_for_task_end(task_process, 5) is True
+
     @pytest.mark.asyncio
     async def test_enable_schedule_already_enabled(self, mocker):
         # GIVEN
@@ -138,3 +138,60 @@ class TestMonitor:
                 assert excinfo.type in [TestMonitorException, TypeError]
 
         assert ServiceRegistry.get(idx=s_id_1)[0]._status is ServiceRecord.Status.Failed
+
+    @pytest.mark.asyncio
+    async def test__monitor_concurrent_pings(self, mocker):
+        class SlowResponse:
+            async def __aenter__(self):
+                await asyncio.sleep(0.2)
+                client_response_mock = MagicMock(spec=aiohttp.ClientResponse)
+
+                async def text():
+                    return '{"uptime": 10}'
+                client_response_mock.text.side_effect = text
+                return client_response_mock
+
+            async def __aexit__(self, *args):
+                return None
+
+        class TestMonitorException(Exception):
+            pass
+
+        s_ids = [ServiceRegistry.register('sname{}'.format(i), 'Southbound', 'saddress', i, i, 'http')
+                 for i in range(1, 4)]
+        monitor = Monitor()
+        monitor._sleep_interval = Monitor._DEFAULT_SLEEP_INTERVAL
+        monitor._max_attempts = Monitor._DEFAULT_MAX_ATTEMPTS
+        acl_handler = MagicMock()
+        acl_handler.has_pending_notification.side_effect = lambda name: name == 'sname2'
+
+        async def resolve(name):
+            pass
+        acl_handler.resolve_pending_notification_for_acl_change.side_effect = resolve
+        monitor._acl_handler = acl_handler
+
+        with patch.object(Monitor, '_sleep', side_effect=TestMonitorException()):
+            with patch.object(aiohttp.ClientSession, 'get', side_effect=lambda *args, **kwargs: SlowResponse()) \
+                    as patch_get:
+                start = asyncio.get_event_loop().time()
+                with pytest.raises(TestMonitorException):
+                    await monitor._monitor_loop()
+                elapsed = asyncio.get_event_loop().time() - start
+        await monitor._close_session()
+
+        # Services are pinged concurrently over one session
+        assert 3 == patch_get.call_count
+        assert elapsed < 0.5
+        for s_id in s_ids:
+            assert ServiceRegistry.get(idx=s_id)[0]._status is ServiceRecord.Status.Running
+        # Storage is consulted only for the service with a pending ACL change
+        acl_handler.resolve_pending_notification_for_acl_change.assert_called_once_with('sname2')
+
+    def test__ping_offset(self):
+        monitor = Monitor()
+        s_id = ServiceRegistry.register('sname1', 'Southbound', 'saddress', 1, 1, 'http')
+        service_record = ServiceRegistry.get(idx=s_id)[0]
+        offset = monitor._ping_offset(service_record, 2)
+        assert 0 <= offset < 2
+        assert offset == monitor._ping_offset(service_record, 2)
+        assert 0 == monitor._ping_offset(service_record, 0)
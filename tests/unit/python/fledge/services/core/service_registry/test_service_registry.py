@@ -7,6 +7,7 @@
 from unittest.mock import patch
 import pytest
 
+from fledge.common.service_record import ServiceRecord
 from fledge.services.core.service_registry.service_registry import ServiceRegistry
 from fledge.services.core.service_registry.exceptions import *
 from fledge.services.core.interest_registry.interest_registry import InterestRegistry
@@ -153,3 +154,28 @@ class TestServiceRegistry:
                 assert 0 == len(ServiceRegistry._registry)
             assert 0 == log_info.call_count
         assert excinfo.type is DoesNotExist
+
+    def test_indexed_lookups(self):
+        with patch.object(ServiceRegistry._logger, 'info'):
+            s_id_1 = ServiceRegistry.register("A name", "Southbound", "127.0.0.1", 1234, 4321, 'http')
+            s_id_2 = ServiceRegistry.register("B name", "Southbound", "127.0.0.1", 1235, 4322, 'http')
+            s_id_3 = ServiceRegistry.register("C name", "Northbound", "127.0.0.1", 1236, 4323, 'http')
+        assert [s_id_1, s_id_2] == [s._id for s in ServiceRegistry.get(s_type="Southbound")]
+        assert s_id_3 == ServiceRegistry.get(name="C name")[0]._id
+        assert ServiceRegistry.check_address_and_port("127.0.0.1", 1235) is True
+        assert ServiceRegistry.check_address_and_mgt_port("127.0.0.1", 4323) is True
+        assert s_id_2 == ServiceRegistry.filter_by_name_and_type("B name", "Southbound")[0]._id
+        with pytest.raises(DoesNotExist):
+            ServiceRegistry.filter_by_name_and_type("B name", "Northbound")
+
+        # Indexes follow removals, failures and a registry replaced wholesale
+        ServiceRegistry.remove_from_registry(s_id_1)
+        assert [s_id_2] == [s._id for s in ServiceRegistry.get(s_type="Southbound")]
+        with pytest.raises(DoesNotExist):
+            ServiceRegistry.get(idx=s_id_1)
+        assert ServiceRegistry.check_address_and_port("127.0.0.1", 1234) is False
+        ServiceRegistry.get(idx=s_id_2)[0]._status = ServiceRecord.Status.Failed
+        assert ServiceRegistry.check_address_and_port("127.0.0.1", 1235) is False
+        ServiceRegistry._registry = list()
+        with pytest.raises(DoesNotExist):
+            ServiceRegistry.get(name="C name")
@@ -103,6 +103,34 @@ class TestServer:
         patch_create_cat.assert_called_once_with('Installation', Server._INSTALLATION_DEFAULT_CONFIG, 'Installation',
                                                  True, display_name='Installation')
 
+    async def test_configuration_cache_config(self):
+        async def async_mock(return_value):
+            return return_value
+
+        storage_client_mock = MagicMock(spec=StorageClientAsync)
+        Server._configuration_manager = ConfigurationManager(storage_client_mock)
+        config = {'maxCategories': {'value': '8'}, 'maxBytes': {'value': '4096'}}
+
+        # Changed in version 3.8: patch() now returns an AsyncMock if the target is an async function.
+        if sys.version_info.major == 3 and sys.version_info.minor >= 8:
+            _rv1 = await async_mock(None)
+            _rv2 = await async_mock(config)
+        else:
+            _rv1 = asyncio.ensure_future(async_mock(None))
+            _rv2 = asyncio.ensure_future(async_mock(config))
+
+        cache_manager = Server._configuration_manager._cacheManager
+        with patch.object(Server._configuration_manager, 'create_category',
+                          return_value=_rv1) as patch_create_cat:
+            with patch.object(Server._configuration_manager, 'get_category_all_items',
+                              return_value=_rv2) as patch_get_all_cat:
+                with patch.object(cache_manager, 'set_limits') as patch_set_limits:
+                    await Server.configuration_cache_config()
+                patch_set_limits.assert_called_once_with(8, 4096)
+            patch_get_all_cat.assert_called_once_with('CONFIGURATION_CACHE')
+        patch_create_cat.assert_called_once_with('CONFIGURATION_CACHE', Server._CONFIGURATION_CACHE_DEFAULT_CONFIG,
+                                                 'Configuration Cache', True, display_name='Configuration Cache')
+
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="To be implemented")
     async def test__make_app(self):
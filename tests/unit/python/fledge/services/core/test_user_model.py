@@ -27,6 +27,14 @@ pytestmark = pytest.mark.asyncio
 def mock_coro(*args, **kwargs):
     return None if len(args) == 0 else args[0]
 
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    # Verified tokens and roles are cached by User.Objects
+    User.Objects.clear_cache()
+    yield
+    User.Objects.clear_cache()
+
+
 @pytest.allure.feature("unit")
 @pytest.allure.story("services", "core", "user-model")
 class TestUserModel:
@@ -84,6 +92,9 @@ class TestUserModel:
                 actual = await User.Objects.get_role_id_by_name("admin")
                 assert actual == expected['rows']
             query_tbl_patch.assert_called_once_with('roles', payload)
+            # Roles are cached
+            assert expected['rows'] == await User.Objects.get_role_id_by_name("admin")
+            assert 1 == query_tbl_patch.call_count
 
     async def test_get_all(self):
         expected = {'rows': [], 'count': 0}
@@ -595,6 +606,137 @@ class TestUserModel:
             args, kwargs = update_tbl_patch.call_args
             assert 'user_logins' == args[0]
 
+    async def test_get_user_for_token_cached(self, mocker):
+        token = "RDSlaEtgXuxbYHlDgJURbEeBua2ccwvHeB7MVDeIHq4"
+        user = {'id': 2, 'uname': 'user', 'role_id': '2'}
+
+        async def validate_token(t):
+            return 2
+
+        async def refresh_token_expiry(*args):
+            pass
+
+        async def get(uid):
+            return user
+
+        patch_validate = mocker.patch.object(User.Objects, 'validate_token', side_effect=validate_token)
+        patch_refresh = mocker.patch.object(User.Objects, 'refresh_token_expiry', side_effect=refresh_token_expiry)
+        patch_get = mocker.patch.object(User.Objects, 'get', side_effect=get)
+        patch_flush = mocker.patch.object(User.Objects, '_flush_token_expiry_refresh', side_effect=refresh_token_expiry)
+
+        assert user == await User.Objects.get_user_for_token(token)
+        assert user == await User.Objects.get_user_for_token(token)
+        patch_validate.assert_called_once_with(token)
+        patch_refresh.assert_called_once_with(token)
+        patch_get.assert_called_once_with(uid=2)
+        # The expiry refresh of the cached token is written behind
+        assert {token} == User.Objects._expiry_refresh_pending
+        assert 1 == patch_flush.call_count
+
+        # Password change, role change, user delete and logout drop the cached token
+        User.Objects.invalidate_user_cache(2)
+        assert user == await User.Objects.get_user_for_token(token)
+        assert 2 == patch_validate.call_count
+        assert set() == User.Objects._expiry_refresh_pending
+        with patch.object(connect, 'get_storage_async', return_value=MagicMock(StorageClientAsync)) as patch_storage:
+            patch_storage.return_value.delete_from_tbl.side_effect = refresh_token_expiry
+            await User.Objects.delete_token(token)
+        assert {} == User.Objects._token_cache
+        assert {} == User.Objects._user_tokens
+
+    async def test_get_user_for_token_expired_cache(self, mocker):
+        token = "RDSlaEtgXuxbYHlDgJURbEeBua2ccwvHeB7MVDeIHq4"
+
+        async def validate_token(t):
+            return 2
+
+        async def refresh_token_expiry(t):
+            pass
+
+        async def get(uid):
+            return {'id': 2, 'role_id': '2'}
+
+        patch_validate = mocker.patch.object(User.Objects, 'validate_token', side_effect=validate_token)
+        mocker.patch.object(User.Objects, 'refresh_token_expiry', side_effect=refresh_token_expiry)
+        mocker.patch.object(User.Objects, 'get', side_effect=get)
+        mocker.patch('fledge.services.core.user_model.TOKEN_CACHE_TTL_SECONDS', 0)
+        await User.Objects.get_user_for_token(token)
+        await User.Objects.get_user_for_token(token)
+        assert 2 == patch_validate.call_count
+
+    @pytest.mark.parametrize("revoke", [
+        lambda token: User.Objects.invalidate_user_cache(2),
+        lambda token: User.Objects.invalidate_token_cache(token),
+        lambda token: User.Objects.clear_cache()
+    ])
+    async def test_get_user_for_token_revoked_during_lookup(self, mocker, revoke):
+        token = "RDSlaEtgXuxbYHlDgJURbEeBua2ccwvHeB7MVDeIHq4"
+
+        async def validate_token(t):
+            return 2
+
+        async def refresh_token_expiry(t):
+            # a logout, password change or user delete completes while the token is being verified
+            revoke(t)
+
+        async def get(uid):
+            return {'id': 2, 'role_id': '2'}
+
+        patch_validate = mocker.patch.object(User.Objects, 'validate_token', side_effect=validate_token)
+        mocker.patch.object(User.Objects, 'refresh_token_expiry', side_effect=refresh_token_expiry)
+        mocker.patch.object(User.Objects, 'get', side_effect=get)
+        assert {'id': 2, 'role_id': '2'} == await User.Objects.get_user_for_token(token)
+        assert {} == User.Objects._token_cache
+        assert {} == User.Objects._user_tokens
+        await User.Objects.get_user_for_token(token)
+        assert 2 == patch_validate.call_count
+
+    async def test_delete_all_user_tokens_during_lookup(self, mocker):
+        token = "RDSlaEtgXuxbYHlDgJURbEeBua2ccwvHeB7MVDeIHq4"
+        storage_client_mock = MagicMock(StorageClientAsync)
+        lookup = None
+
+        async def validate_token(t):
+            return 2
+
+        async def refresh_token_expiry(t):
+            pass
+
+        async def get(uid):
+            return {'id': 2, 'role_id': '2'}
+
+        async def delete_from_tbl(*args):
+            # the token is verified against storage before its row is deleted
+            await lookup
+
+        mocker.patch.object(User.Objects, 'validate_token', side_effect=validate_token)
+        mocker.patch.object(User.Objects, 'refresh_token_expiry', side_effect=refresh_token_expiry)
+        mocker.patch.object(User.Objects, 'get', side_effect=get)
+        with patch.object(connect, 'get_storage_async', return_value=storage_client_mock):
+            with patch.object(storage_client_mock, 'delete_from_tbl', side_effect=delete_from_tbl) as delete_patch:
+                lookup = asyncio.ensure_future(User.Objects.get_user_for_token(token))
+                await User.Objects.delete_all_user_tokens()
+            delete_patch.assert_called_once_with("user_logins")
+        assert {} == User.Objects._token_cache
+        assert {} == User.Objects._user_tokens
+
+    async def test_flush_token_expiry_refresh(self, mocker):
+        mocker.patch('fledge.services.core.user_model.TOKEN_EXPIRY_FLUSH_SECONDS', 0)
+        storage_client_mock = MagicMock(StorageClientAsync)
+        User.Objects._expiry_refresh_pending.update({"token2", "token1"})
+        with patch.object(connect, 'get_storage_async', return_value=storage_client_mock):
+
+            async def update_tbl(*args):
+                return {'rows_affected': 2}
+            with patch.object(storage_client_mock, 'update_tbl', side_effect=update_tbl) as update_tbl_patch:
+                User.Objects._expiry_refresh_task = asyncio.ensure_future(User.Objects._flush_token_expiry_refresh())
+                await User.Objects._expiry_refresh_task
+        args, kwargs = update_tbl_patch.call_args
+        assert 'user_logins' == args[0]
+        assert {"column": "token", "condition": "in", "value": ["token1", "token2"]} == json.loads(args[1])["where"]
+        assert set() == User.Objects._expiry_refresh_pending
+        assert User.Objects._expiry_refresh_task is None
+
     async def test_invalid_token(self):
         storage_client_mock = MagicMock(StorageClientAsync)
         payload = {"return": [{"column": "token_expiration", "format": "YYYY-MM-DD HH24:MI:SS.MS", "alias": "token_expiration"}], "where": {"column": "token", "condition": "=", "value": "blah"}}
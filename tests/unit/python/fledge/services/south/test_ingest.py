@@ -67,6 +67,11 @@ class TestIngest:
         Ingest._readings_insert_batch_timeout_seconds = 1
         Ingest._max_readings_insert_batch_connection_idle_seconds = 60
         Ingest._max_readings_insert_batch_reconnect_wait_seconds = 10
+        Ingest._statistics_flush_interval_seconds = 5
+        Ingest._asset_tracker_events = set()
+        Ingest._asset_tracker_queue = []
+        Ingest._asset_tracker_queue_not_empty = None
+        Ingest._asset_tracker_task = None
         Ingest.category = 'South'
         Ingest.default_config = {
             "readings_buffer_size": {
@@ -103,6 +108,12 @@ class TestIngest:
                 "type": "integer",
                 "default": str(Ingest._max_readings_insert_batch_reconnect_wait_seconds)
             },
+            "statistics_flush_interval_seconds": {
+                "description": "Number of seconds between two writes of the readings statistics to "
+                               "storage",
+                "type": "integer",
+                "default": str(Ingest._statistics_flush_interval_seconds)
+            },
         }
 
     @pytest.mark.asyncio
@@ -133,6 +144,8 @@ class TestIngest:
                int(new_config['max_readings_insert_batch_connection_idle_seconds']['value'])
         assert Ingest._max_readings_insert_batch_reconnect_wait_seconds == \
                int(new_config['max_readings_insert_batch_reconnect_wait_seconds']['value'])
+        assert Ingest._statistics_flush_interval_seconds == \
+               int(new_config['statistics_flush_interval_seconds']['value'])
 
     @pytest.mark.asyncio
     async def test_read_config_filter(self, mocker):
@@ -239,6 +252,9 @@ class TestIngest:
         assert Ingest._max_concurrent_readings_inserts == len(Ingest._readings_list_not_empty)
         assert Ingest._max_concurrent_readings_inserts == len(Ingest._readings_lists)
         assert 0 == log_warning.call_count
+        assert isinstance(Ingest._statistics, statistics.StatisticsAccumulator)
+        assert Ingest._statistics_flush_interval_seconds == Ingest._statistics._flush_interval
+        await Ingest._statistics.stop()
 
     @pytest.mark.asyncio
     async def test_stop(self, mocker):
@@ -307,10 +323,27 @@ class TestIngest:
     async def test__insert_readings(self, mocker):
         pass
 
-    @pytest.mark.skip(reason="This method uses a while True loop. Investigate as to how to write unit test for an infinite loop.")
     @pytest.mark.asyncio
     async def test_write_statistics(self, mocker):
-        pass
+        # GIVEN
+        Ingest._readings_stats = 5
+        Ingest._discarded_readings_stats = 1
+        Ingest._sensor_stats = {'PUMP1': 3, 'PUMP2': 2}
+        Ingest._statistics = MagicMock()
+
+        # WHEN
+        await Ingest._write_statistics()
+
+        # THEN
+        assert 0 == Ingest._readings_stats
+        assert 0 == Ingest._discarded_readings_stats
+        assert {} == Ingest._sensor_stats
+        Ingest._statistics.increment.assert_has_calls([
+            call('READINGS', 5), call('DISCARDED', 1),
+            call('PUMP1', 3, 'Readings received by Fledge since startup for sensor PUMP1'),
+            call('PUMP2', 2, 'Readings received by Fledge since startup for sensor PUMP2')])
+        # Storage is written by the accumulator
+        assert 0 == Ingest._statistics.flush.call_count
 
     @pytest.mark.asyncio
     async def test_is_available_at_start(self, mocker):
@@ -539,6 +572,142 @@ class TestIngest:
         # THEN
         assert 0 == len(Ingest._readings_lists[0])
 
+    @pytest.mark.asyncio
+    async def test_add_readings_queues_asset_tracker_events(self, mocker):
+        # GIVEN
+        Ingest._max_concurrent_readings_inserts = 1
+        Ingest._readings_list_size = 10
+        Ingest._current_readings_list_index = 0
+        Ingest._readings_lists = [[]]
+        Ingest._readings_list_not_empty = [asyncio.Event()]
+        Ingest._readings_list_batch_size_reached = [asyncio.Event()]
+        Ingest._asset_tracker_events = {("pump1", "Ingest", "south", "http_south")}
+        Ingest._asset_tracker_queue_not_empty = asyncio.Event()
+        Ingest._started = True
+        mocker.patch.object(MicroserviceManagementClient, "__init__", return_value=None)
+        create_event = mocker.patch.object(MicroserviceManagementClient, "create_asset_tracker_event")
+        create_events = mocker.patch.object(MicroserviceManagementClient, "create_asset_tracker_events")
+        Ingest._parent_service = MagicMock(_core_microservice_management_client=MicroserviceManagementClient(),
+                                           _name="south",
+                                           _plugin_info={'config': {'plugin': {'default': 'http_south'}}})
+
+        # WHEN
+        for asset in ["pump1", "pump2", "pump2", "pump3"]:
+            await Ingest.add_readings(asset=asset, timestamp="2017-01-02T01:02:03.23232Z-05:00",
+                                      readings={"velocity": 500})
+
+        # THEN
+        assert 4 == len(Ingest._readings_lists[0])
+        assert [("pump2", "Ingest", "south", "http_south"),
+                ("pump3", "Ingest", "south", "http_south")] == Ingest._asset_tracker_queue
+        assert Ingest._asset_tracker_queue_not_empty.is_set()
+        # No network I/O on the readings path
+        assert 0 == create_event.call_count
+        assert 0 == create_events.call_count
+
+    @pytest.mark.asyncio
+    async def test_register_asset_tracker_events(self, mocker):
+        # GIVEN
+        pump1 = ("pump1", "Ingest", "south", "http_south")
+        pump2 = ("pump2", "Ingest", "south", "http_south")
+
+        async def mock_create_events(events):
+            return [events[0], Exception("core unavailable")]
+
+        mocker.patch.object(MicroserviceManagementClient, "__init__", return_value=None)
+        create_events = mocker.patch.object(MicroserviceManagementClient, "create_asset_tracker_events",
+                                            side_effect=mock_create_events)
+        log_error = mocker.patch.object(ingest._LOGGER, "error")
+        Ingest._parent_service = MagicMock(_core_microservice_management_client=MicroserviceManagementClient())
+        Ingest._asset_tracker_events = {pump1, pump2}
+        Ingest._asset_tracker_queue = [pump1, pump2]
+        Ingest._asset_tracker_queue_not_empty = asyncio.Event()
+        Ingest._asset_tracker_queue_not_empty.set()
+        Ingest._stop = True
+
+        # WHEN
+        await Ingest._register_asset_tracker_events()
+
+        # THEN
+        create_events.assert_called_once_with(
+            [{"asset": "pump1", "event": "Ingest", "service": "south", "plugin": "http_south"},
+             {"asset": "pump2", "event": "Ingest", "service": "south", "plugin": "http_south"}])
+        assert [] == Ingest._asset_tracker_queue
+        # failed registration is forgotten, so that the next pump2 reading queues it again
+        assert {pump1} == Ingest._asset_tracker_events
+        log_error.assert_called_once_with('Unable to register %s of %s asset tracker events, first error: %s', 1, 2,
+                                          'core unavailable')
+
+    @pytest.mark.asyncio
+    async def test_add_readings_bulk(self, mocker):
+        # GIVEN
+        Ingest._max_concurrent_readings_inserts = 2
+        Ingest._readings_list_size = 3
+        Ingest._readings_insert_batch_size = 2
+        Ingest._current_readings_list_index = 0
+        Ingest._readings_lists = [[], []]
+        Ingest._readings_list_not_empty = [asyncio.Event(), asyncio.Event()]
+        Ingest._readings_list_batch_size_reached = [asyncio.Event(), asyncio.Event()]
+        Ingest._started = True
+        Ingest._parent_service = MagicMock(_name="south", _plugin_info={'config': {'plugin': {'default': 'poll'}}})
+        readings = [{"asset": "pump1", "timestamp": "2017-01-02T01:02:03.23232Z", "readings": {"velocity": i}}
+                    for i in range(3)]
+        readings.append({"asset": "Pump2", "timestamp": "2017-01-02T01:02:03.23232Z", "readings": None})
+        readings.append({"asset": "pump3", "timestamp": None, "readings": {"velocity": 1}})
+        readings.append({"asset": 1, "timestamp": "2017-01-02T01:02:03.23232Z", "readings": {"velocity": 1}})
+        readings.append({"asset": "pump4", "timestamp": "2017-01-02T01:02:03.23232Z", "readings": 5})
+        readings.append({"asset": "pump5"})
+        log_warning = mocker.patch.object(ingest._LOGGER, "warning")
+
+        # WHEN
+        added = await Ingest.add_readings_bulk(readings)
+
+        # THEN
+        assert 4 == added
+        assert 4 == Ingest._discarded_readings_stats
+        log_warning.assert_called_once_with('Discarded %s invalid readings out of %s', 4, 8)
+        # first list filled up to the batch size, then the remaining readings went to the second list
+        assert [0, 1] == [r['reading']['velocity'] for r in Ingest._readings_lists[0]]
+        assert [{"asset_code": "pump1", "reading": {"velocity": 2}, "user_ts": "2017-01-02T01:02:03.23232Z"},
+                {"asset_code": "Pump2", "reading": {}, "user_ts": "2017-01-02T01:02:03.23232Z"}
+                ] == Ingest._readings_lists[1]
+        assert all(e.is_set() for e in Ingest._readings_list_not_empty)
+        assert all(e.is_set() for e in Ingest._readings_list_batch_size_reached)
+        assert {'PUMP1': 3, 'PUMP2': 1} == Ingest._sensor_stats
+        assert [("pump1", "Ingest", "south", "poll"), ("Pump2", "Ingest", "south", "poll")
+                ] == Ingest._asset_tracker_queue
+
+    @pytest.mark.asyncio
+    async def test_add_readings_bulk_when_buffers_full(self, mocker):
+        # GIVEN
+        Ingest._max_concurrent_readings_inserts = 1
+        Ingest._readings_list_size = 2
+        Ingest._readings_insert_batch_size = 2
+        Ingest._current_readings_list_index = 0
+        Ingest._readings_lists = [[]]
+        Ingest._readings_list_not_empty = [asyncio.Event()]
+        Ingest._readings_list_batch_size_reached = [asyncio.Event()]
+        Ingest._started = True
+        Ingest._parent_service = MagicMock(_name="south", _plugin_info={'config': {'plugin': {'default': 'poll'}}})
+        readings = [{"asset": "pump1", "timestamp": "2017-01-02T01:02:03.23232Z", "readings": {"velocity": i}}
+                    for i in range(5)]
+        mocker.patch.object(ingest._LOGGER, "warning")
+
+        # WHEN
+        added = await Ingest.add_readings_bulk(readings)
+
+        # THEN
+        assert 2 == added
+        assert 2 == len(Ingest._readings_lists[0])
+        assert 3 == Ingest._discarded_readings_stats
+        assert {'PUMP1': 2} == Ingest._sensor_stats
+
+    @pytest.mark.asyncio
+    async def test_add_readings_bulk_not_started(self):
+        Ingest._started = False
+        with pytest.raises(RuntimeError):
+            await Ingest.add_readings_bulk([{"asset": "pump1", "timestamp": "2017-01-02", "readings": {}}])
+
     @pytest.mark.asyncio
     async def test_add_readings_when_one_list_becomes_full(self, mocker):
         # GIVEN
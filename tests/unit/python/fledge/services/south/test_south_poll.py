@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+""" Test the poll loop of python/fledge/services/south/server.py """
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+import pytest
+
+from fledge.services.south import server as South
+from fledge.services.south import exceptions
+from fledge.services.south.server import Server
+from fledge.services.common.microservice import FledgeMicroservice
+from fledge.services.south.ingest import Ingest
+
+__author__ = "Dianomic Systems Inc."
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+READING = {'asset': 'sinusoid', 'timestamp': '2026-01-01 00:00:00.000000+00:00', 'readings': {'sinusoid': 0.5}}
+
+
+class FakeClock(object):
+    """ Event loop time that only moves when the poll loop sleeps or a poll takes time """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def make_server(poll_interval='1000'):
+    with patch.object(FledgeMicroservice, '__init__', return_value=None):
+        server = Server()
+    server._name = 'sine'
+    server._plugin_handle = {'pollInterval': {'value': poll_interval}}
+    return server
+
+
+def make_plugin(server, clock, durations):
+    """ A plugin whose polls take the given durations, an exception is raised instead; the last poll stops the loop """
+    polls = []
+
+    def plugin_poll(handle):
+        duration = durations[len(polls)]
+        polls.append(duration)
+        if len(polls) == len(durations):
+            server._plugin = None
+        if isinstance(duration, Exception):
+            clock.now += 0.2
+            raise duration
+        clock.now += duration
+        return [READING]
+
+    return MagicMock(plugin_poll=MagicMock(side_effect=plugin_poll))
+
+
+async def run_polls(server, durations):
+    clock = FakeClock()
+    server._event_loop = MagicMock(time=clock.time)
+    server._plugin = make_plugin(server, clock, durations)
+
+    async def add_readings_bulk(readings):
+        pass
+
+    with patch.object(Ingest, 'add_readings_bulk', side_effect=add_readings_bulk) as patch_ingest:
+        with patch.object(asyncio, 'sleep', side_effect=clock.sleep):
+            await server._exec_plugin_poll()
+    return clock, patch_ingest
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("south", "poll")
+class TestSouthPoll:
+
+    @pytest.mark.asyncio
+    async def test_ticks_do_not_drift(self):
+        server = make_server()
+        clock, patch_ingest = await run_polls(server, [0.3, 0.3, 0.3])
+        assert [pytest.approx(0.7)] * 3 == clock.sleeps
+        assert 3 == patch_ingest.call_count
+        patch_ingest.assert_called_with([READING])
+        stats = server._get_poll_statistics()
+        assert 3 == stats['polls']
+        assert 0 == stats['overruns']
+        assert stats['lastLatency'] == pytest.approx(0.3)
+        assert stats['maxLatency'] == pytest.approx(0.3)
+        assert stats['averageLatency'] == pytest.approx(0.3)
+
+    @pytest.mark.asyncio
+    async def test_overrun_skips_ticks(self):
+        server = make_server()
+        with patch.object(South._LOGGER, 'warning') as log_warning:
+            clock, _ = await run_polls(server, [2.5, 0.1, 0.1])
+        # The poll ran over the ticks at 1 and 2, the next poll is at the tick at 3, then back to the schedule
+        assert [pytest.approx(0.5), pytest.approx(0.9), pytest.approx(0.9)] == clock.sleeps
+        stats = server._get_poll_statistics()
+        assert 3 == stats['polls']
+        assert 1 == stats['overruns']
+        assert 2 == stats['skipped']
+        assert stats['maxLatency'] == pytest.approx(2.5)
+        assert stats['averageLatency'] == pytest.approx(0.9)
+        log_warning.assert_any_call('Plugin sine poll overrun, 2 poll(s) skipped; last poll took 2.500s, '
+                                    '1 overrun(s) so far')
+
+    @pytest.mark.asyncio
+    async def test_overrun_warning_rate_limited(self):
+        server = make_server()
+        with patch.object(South._LOGGER, 'warning') as log_warning:
+            for _ in range(South._POLL_OVERRUN_WARNING_INTERVAL + 1):
+                server._record_poll_overrun(1)
+        assert 2 == log_warning.call_count
+        assert South._POLL_OVERRUN_WARNING_INTERVAL + 1 == server._get_poll_statistics()['overruns']
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [Exception("device unreachable"), exceptions.QuietError()])
+    async def test_failed_poll_is_retried_after_a_poll_interval(self, error):
+        server = make_server()
+        with patch.object(South._LOGGER, 'error'):
+            clock, patch_ingest = await run_polls(server, [0.3, error, 0.3])
+        # Retried one poll interval after the failure, rather than on the next tick
+        assert [pytest.approx(0.7), pytest.approx(1.0), pytest.approx(0.7)] == clock.sleeps
+        assert 2 == patch_ingest.call_count
+        stats = server._get_poll_statistics()
+        assert 2 == stats['polls']
+        assert 1 == stats['failures']
+        assert 0 == stats['overruns']
+
+    @pytest.mark.asyncio
+    async def test_poll_in_thread_one_at_a_time(self):
+        server = make_server(poll_interval='10')
+        server._event_loop = asyncio.get_event_loop()
+        server._poll_executor = ThreadPoolExecutor(max_workers=1)
+        in_flight = []
+        polls = []
+        lock = threading.Lock()
+        loop_thread = threading.get_ident()
+
+        def plugin_poll(handle):
+            with lock:
+                in_flight.append(1)
+                polls.append(len(in_flight))
+            assert threading.get_ident() != loop_thread
+            # Slower than the poll interval: every poll is an overrun
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+            if len(polls) == 3:
+                server._plugin = None
+            return [READING]
+
+        server._plugin = MagicMock(plugin_poll=MagicMock(side_effect=plugin_poll))
+        ticks = []
+
+        async def ticker():
+            while server._plugin:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def add_readings_bulk(readings):
+            pass
+
+        with patch.object(Ingest, 'add_readings_bulk', side_effect=add_readings_bulk):
+            with patch.object(South._LOGGER, 'warning'):
+                await asyncio.gather(server._exec_plugin_poll(), ticker())
+        server._poll_executor.shutdown()
+        # Never more than one poll in flight, and the event loop kept running meanwhile
+        assert [1, 1, 1] == polls
+        assert 5 < len(ticks)
+        stats = server._get_poll_statistics()
+        assert 3 == stats['polls']
+        assert 3 == stats['overruns']
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_poll_in_thread(self):
+        server = make_server()
+        server._poll_executor = ThreadPoolExecutor(max_workers=1)
+        finished = []
+
+        def plugin_poll(handle):
+            time.sleep(0.1)
+            finished.append(1)
+
+        server._poll_future = server._poll_executor.submit(plugin_poll, None)
+        plugin = MagicMock()
+        server._plugin = plugin
+        handle = server._plugin_handle
+
+        async def stop():
+            pass
+
+        with patch.object(Ingest, 'stop', side_effect=stop):
+            with patch.object(Server, 'close_storage_sessions', side_effect=stop, create=True):
+                await server._stop(asyncio.get_event_loop())
+        assert [1] == finished
+        plugin.plugin_shutdown.assert_called_once_with(handle)
+        assert server._poll_executor is None
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+# FLEDGE_BEGIN
+# See: http://fledge-iot.readthedocs.io/
+# FLEDGE_END
+
+import asyncio
+from unittest.mock import patch, MagicMock
+
+import pyjq
+import pytest
+
+from fledge.common import jqfilter
+from fledge.common.process import FledgeProcess
+from fledge.common.storage_client.storage_client import StorageClientAsync
+from fledge.tasks.north import sending_process
+from fledge.tasks.north.sending_process import SendingProcess
+
+__author__ = "Dianomic Systems Inc."
+__copyright__ = "Copyright (c) 2026 Dianomic Systems Inc."
+__license__ = "Apache 2.0"
+__version__ = "${VERSION}"
+
+
+def _reading(_id, asset="fogbench_x"):
+    return {'id': _id, 'asset_code': asset, 'reading': {'x': str(_id)}, 'user_ts': '2026-01-01 00:00:00.000000+00'}
+
+
+def _sending_process(blocks, plugin_send):
+    """ Returns a SendingProcess reading the given blocks of raw rows and sending them with plugin_send"""
+    with patch.object(FledgeProcess, '__init__'):
+        sp = SendingProcess(loop=MagicMock())
+    sp._name = "north"
+    sp._storage_async = MagicMock(spec=StorageClientAsync)
+    sp._stream_id = 1
+    sp._config.update({'source': 'readings', 'plugin': 'north_plugin', 'duration': 0.3, 'sleepInterval': 0.05,
+                       'memory_buffer_size': 2})
+    sp._config_from_manager = {}
+    sp._tracked_assets = []
+    sp._core_microservice_management_client = MagicMock()
+    sp._plugin = MagicMock(plugin_send=plugin_send)
+    sp.fetched_from = []
+
+    async def load(last_object_id):
+        sp.fetched_from.append(last_object_id)
+        return blocks.pop(0) if blocks else []
+
+    async def last_object_id_read():
+        return 0
+
+    async def audit_failure(*args):
+        pass
+
+    sp.positions = []
+
+    async def update_position_reached(last_object_id, num_sent):
+        sp.positions.append((last_object_id, num_sent))
+
+    sp._load_data_into_memory = load
+    sp._last_object_id_read = last_object_id_read
+    sp._update_position_reached = update_position_reached
+    sp._audit = MagicMock(failure=audit_failure)
+    return sp
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("tasks", "north")
+class TestSendingProcessPipeline:
+
+    @pytest.mark.asyncio
+    async def test_send_data(self):
+        sent = []
+
+        async def plugin_send(handle, data, stream_id):
+            sent.append([row['id'] for row in data])
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(1), _reading(2)], [_reading(3)]], plugin_send)
+        await sp.send_data()
+
+        assert [[1, 2], [3]] == sent
+        assert [0, 2, 3] == sp.fetched_from[:3]
+        assert 3 == sum(num_sent for _, num_sent in sp.positions)
+        assert 3 == sp.positions[-1][0]
+        timings = sp.stage_timings()
+        assert {'fetch', 'transform', 'send'} == set(timings)
+        for stage in timings:
+            assert 2 == timings[stage]['blocks']
+            assert 3 == timings[stage]['rows']
+        sp._core_microservice_management_client.create_asset_tracker_event.assert_called_once_with(
+            {"asset": "fogbench_x", "event": "Egress", "service": "north", "plugin": "north_plugin"})
+
+    @pytest.mark.asyncio
+    async def test_transform_converts_values(self):
+        sent = []
+
+        async def plugin_send(handle, data, stream_id):
+            sent.extend(data)
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(1)]], plugin_send)
+        await sp.send_data()
+        assert [{'id': 1, 'asset_code': 'fogbench_x', 'reading': {'x': 1},
+                 'user_ts': '2026-01-01T00:00:00.000000Z'}] == sent
+
+    @pytest.mark.asyncio
+    async def test_discarded_block_advances_fetch(self):
+        """ A block whose rows are all discarded by the transform stage is not sent nor loaded again"""
+        sent = []
+
+        async def plugin_send(handle, data, stream_id):
+            sent.append([row['id'] for row in data])
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(1, asset=" ")], [_reading(2)]], plugin_send)
+        await sp.send_data()
+
+        assert [[2]] == sent
+        assert [0, 1, 2] == sp.fetched_from[:3]
+
+    @pytest.mark.asyncio
+    async def test_transform_failure_stops_before_block(self):
+        """ A block that fails to transform is not skipped: no later block is sent and it is loaded again"""
+        sent = []
+
+        async def plugin_send(handle, data, stream_id):
+            sent.append([row['id'] for row in data])
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(1)], [_reading(2)], [_reading(3)]], plugin_send)
+        transform = sp._transform_data
+
+        def transform_data(raw_data):
+            if raw_data[0]['id'] == 2:
+                raise ValueError("bad block")
+            return transform(raw_data)
+
+        sp._transform_data = transform_data
+        sp._config['duration'] = 10
+        await asyncio.wait_for(sp.send_data(), 5)
+
+        assert [3] not in sent
+        assert [2] not in sent
+        assert all(last_object_id < 2 for last_object_id, _ in sp.positions)
+
+    @pytest.mark.asyncio
+    async def test_send_retried_after_failure(self):
+        sent = []
+
+        async def plugin_send(handle, data, stream_id):
+            if not sent:
+                sent.append(None)
+                raise RuntimeError("unreachable")
+            sent.append([row['id'] for row in data])
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(1)]], plugin_send)
+        sp.TASK_SEND_SLEEP = 0.01
+        await sp.send_data()
+
+        assert [None, [1]] == sent
+        assert [(1, 1)] == sp.positions
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_bounded(self):
+        """ While the plugin is blocked no more than memory_buffer_size blocks are prefetched"""
+        release = asyncio.Event()
+
+        async def plugin_send(handle, data, stream_id):
+            await release.wait()
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(i)] for i in range(1, 20)], plugin_send)
+        task = asyncio.ensure_future(sp.send_data())
+        await asyncio.sleep(0.1)
+        # one block in the plugin, one in the send queue, one in the transform stage,
+        # two in the prefetch queue and one waiting in the fetch stage
+        assert 6 == len(sp.fetched_from)
+        release.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_filter_rule_applied(self):
+        sent = []
+
+        async def plugin_send(handle, data, stream_id):
+            sent.extend(data)
+            return True, data[-1]['id'], len(data)
+
+        sp = _sending_process([[_reading(1), _reading(2, asset="other")], [_reading(3)]], plugin_send)
+        sp._set_filter_rule({'applyFilter': {'value': 'true'},
+                             'filterRule': {'value': '[.[] | select(.asset_code == "fogbench_x")]'}})
+        with patch.object(pyjq, "compile", wraps=pyjq.compile) as mock_compile:
+            jqfilter._compile.cache_clear()
+            await sp.send_data()
+        assert [1, 3] == [row['id'] for row in sent]
+        mock_compile.assert_called_once_with('[.[] | select(.asset_code == "fogbench_x")]')
+
+    @pytest.mark.asyncio
+    async def test_statistics_flush_interval_configured(self):
+        config = {key: dict(item, value=item['default']) for key, item in SendingProcess._CONFIG_DEFAULT.items()}
+        config['statisticsFlushInterval']['value'] = '30'
+        config['duration']['value'] = '0'
+        sp = _sending_process([], None)
+        with patch.object(sp, '_fetch_configuration', return_value=config):
+            sp._retrieve_configuration(cat_name="north", cat_config=SendingProcess._CONFIG_DEFAULT)
+        assert 30 == sp._config['statisticsFlushInterval']
+        with patch.object(sending_process.statistics, 'StatisticsAccumulator') as accumulator_patch:
+            await sp.send_data()
+        accumulator_patch.assert_called_once_with(sp._storage_async, 30)
+
+    @pytest.mark.parametrize("config, expected_rule", [
+        ({}, None),
+        ({'applyFilter': {'value': 'false'}, 'filterRule': {'value': '.[0:1]'}}, None),
+        ({'applyFilter': {'value': 'true'}}, None),
+        ({'applyFilter': {'value': 'TRUE'}, 'filterRule': {'value': '.[0:1]'}}, '.[0:1]'),
+    ])
+    def test_set_filter_rule(self, config, expected_rule):
+        sp = _sending_process([], None)
+        sp._set_filter_rule(config)
+        assert expected_rule == sp._filter_rule
+
+
+def _reference_date_format(in_data):
+    """ apply_date_format as it was before the UTC fast path, without the warning """
+    zone_index = in_data.rfind("-")
+    if zone_index < 10:
+        zone_index = in_data.rfind("+")
+    if zone_index == -1:
+        if in_data.rfind(".") == -1:
+            in_data += ".000000"
+        in_data = in_data.ljust(26, '0')
+        timestamp = in_data.replace(" ", "T")
+        if 'Z' not in in_data:
+            timestamp = timestamp + "Z"
+    else:
+        timestamp = in_data[:zone_index].replace(" ", "T") + "Z"
+    return timestamp
+
+
+def _date_format_corpus():
+    dates = ["2018-05-28 16:56:55", "2026-01-01 00:00:00", "2018-03-22T17:17:17", "2018-3-2 7:17:17", "16:56:55", ""]
+    fractions = ["", ".", ".8", ".84", ".166347", ".123456789", ".000000"]
+    zones = ["", "Z", "+00", "+00:00", "+0000", "+02:00", "+02", "-05:00", "-00", "-00:00", "+00+00:00", "+00:00Z",
+             "Z+00", " +00:00"]
+    corpus = [date + fraction + zone for date in dates for fraction in fractions for zone in zones]
+    corpus.extend(["+00", "+00:00", "-", "+", "Z", "2018-05-28 16:56:55.1-2+00", "2018-05-28 16:56:55+00-00",
+                   "2018-05-28 16-56-55.1+00:00", "2018 05 28 16:56:55.5+00:00", "2018-05-28  16:56:55+00"])
+    return corpus
+
+
+@pytest.allure.feature("unit")
+@pytest.allure.story("tasks", "north")
+class TestApplyDateFormat:
+
+    @pytest.mark.parametrize("in_data, expected", [
+        ("2018-05-28 16:56:55", "2018-05-28T16:56:55.000000Z"),
+        ("2018-05-28 13:42:28.84", "2018-05-28T13:42:28.840000Z"),
+        ("2018-03-22 17:17:17.166347", "2018-03-22T17:17:17.166347Z"),
+        ("2020-03-30 05:35:24.066553Z", "2020-03-30T05:35:24.066553Z"),
+        ("2018-03-22 17:17:17.166347+00:00", "2018-03-22T17:17:17.166347Z"),
+        ("2018-03-22 17:17:17.166347+00", "2018-03-22T17:17:17.166347Z"),
+        ("2018-03-22 17:17:17.166347+02:00", "2018-03-22T17:17:17.166347Z"),
+    ])
+    def test_documented_examples(self, in_data, expected):
+        assert expected == sending_process.apply_date_format(in_data)
+
+    def test_conformance(self):
+        """ The output is the same as the generic handling for every string of the corpus """
+        with patch.object(sending_process, "_warn_non_utc"):
+            for in_data in _date_format_corpus():
+                assert _reference_date_format(in_data) == sending_process.apply_date_format(in_data), in_data
+
+    def test_non_utc_warning_rate_limited(self):
+        sending_process._non_utc_warnings.clear()
+        with patch.object(sending_process._LOGGER, "warning") as log:
+            for _ in range(100):
+                sending_process.apply_date_format("2018-03-22 17:17:17.166347+02:00")
+            sending_process.apply_date_format("2018-03-22 17:17:17.166347-05:00")
+            assert 2 == log.call_count
+            assert "+02:00" in log.call_args_list[0][0][0]
+            assert "-05:00" in log.call_args_list[1][0][0]
+
+            # Once the interval has elapsed the number of suppressed warnings is reported
+            sending_process._non_utc_warnings["+02:00"][0] -= sending_process._NON_UTC_WARNING_INTERVAL
+            sending_process.apply_date_format("2018-03-22 17:17:17.166347+02:00")
+            assert 3 == log.call_count
+            assert "99 similar warnings suppressed" in log.call_args[0][0]
+        sending_process._non_utc_warnings.clear()
+
+    def test_timestamp_formatted_once_per_block(self):
+        raw_data = [{'id': i, 'asset_code': 'asset{}'.format(i), 'reading': {'x': i},
+                     'user_ts': '2026-01-01 00:00:00.000001+00'} for i in range(5)]
+        with patch.object(sending_process, "apply_date_format", return_value="ts") as mock_format:
+            converted = SendingProcess._transform_in_memory_data_readings(raw_data)
+        mock_format.assert_called_once_with('2026-01-01 00:00:00.000001+00')
+        assert ["ts"] * 5 == [row['user_ts'] for row in converted]
@@ -8,7 +8,7 @@ import json
 import pytest
 import asyncio
 import sys
-from unittest.mock import patch, call, MagicMock
+from unittest.mock import patch, MagicMock
 from fledge.common import logger
 from fledge.common.storage_client.storage_client import StorageClientAsync, ReadingsStorageClientAsync
 from fledge.common.statistics import Statistics
@@ -58,7 +58,7 @@ class TestPurge:
         mock_process.assert_called_once_with()
 
     async def test_write_statistics(self):
-        """Test that write_statistics calls update statistics with defined keys and value increments"""
+        """Test that write_statistics bulk updates statistics with defined keys and value increments"""
 
         mock_storage_client_async = MagicMock(spec=StorageClientAsync)
         mock_audit_logger = AuditLogger(mock_storage_client_async)
@@ -69,12 +69,12 @@ class TestPurge:
         
         with patch.object(FledgeProcess, '__init__'):
             with patch.object(Statistics, '_load_keys', return_value=_rv):
-                with patch.object(Statistics, 'update', return_value=_rv) as mock_stats_update:
+                with patch.object(Statistics, 'update_bulk', return_value=_rv) as mock_stats_update:
                     with patch.object(mock_audit_logger, "__init__", return_value=None):
                         p = Purge()
                         p._storage_async = mock_storage_client_async
                         await p.write_statistics(1, 2)
-                mock_stats_update.assert_has_calls([call('PURGED', 1), call('UNSNPURGED', 2)])
+                mock_stats_update.assert_called_once_with({'PURGED': 1, 'UNSNPURGED': 2})
 
     async def test_set_configuration(self):
         """Test that purge's set_configuration returns configuration item with key 'PURGE_READ' """
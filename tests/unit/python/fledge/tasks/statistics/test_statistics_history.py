@@ -7,12 +7,14 @@
 """Test tasks/statistics/statistics_history.py"""
 
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 import pytest
 import sys
+import json
 
 import ast
 from fledge.common import logger
+from fledge.common.storage_client.exceptions import StorageServerError
 from fledge.common.storage_client.storage_client import StorageClientAsync
 from fledge.tasks.statistics.statistics_history import StatisticsHistory
 from fledge.common.process import FledgeProcess
@@ -69,6 +71,37 @@ class TestStatisticsHistory:
                 assert 1 == payload["updates"][0]["values"]["previous_value"]
 
     async def test_run(self):
+        with patch.object(FledgeProcess, '__init__'):
+            with patch.object(logger, "setup"):
+                sh = StatisticsHistory()
+                sh._storage_async = MagicMock(spec=StorageClientAsync)
+                with patch.object(sh, "is_dry_run", return_value=False):
+                    with patch.object(sh._storage_async, "statistics_snapshot",
+                                      side_effect=mock_coro) as mock_snapshot:
+                        with patch.object(sh._storage_async, "query_tbl") as mock_keys:
+                            await sh.run()
+                mock_snapshot.assert_called_once_with(ANY)
+                assert not mock_keys.called
+
+    async def test_run_error(self):
+        async def storage_error(*args):
+            raise StorageServerError(code=400, reason="bad data", error={})
+
+        with patch.object(FledgeProcess, '__init__'):
+            with patch.object(logger, "setup"):
+                sh = StatisticsHistory()
+                sh._storage_async = MagicMock(spec=StorageClientAsync)
+                with patch.object(sh, "is_dry_run", return_value=False):
+                    with patch.object(sh._storage_async, "statistics_snapshot", side_effect=storage_error):
+                        with patch.object(sh._storage_async, "query_tbl") as mock_keys:
+                            with pytest.raises(StorageServerError):
+                                await sh.run()
+                assert not mock_keys.called
+
+    async def test_run_client_side_snapshot(self):
+        async def not_supported(*args):
+            raise StorageServerError(code=404, reason="not supported", error={})
+
         with patch.object(FledgeProcess, '__init__'):
             with patch.object(logger, "setup"):
                 sh = StatisticsHistory()
@@ -78,7 +111,7 @@ class TestStatisticsHistory:
                                     'value': 0, 'key': 'PURGED', 'previous_value': 0,
                                     'ts': '2018-08-31 17:03:17.597055+05:30'},
                                    {'description': 'Readings received by Fledge',
-                                    'value': 0, 'key': 'READINGS', 'previous_value': 0,
+                                    'value': 7, 'key': 'READINGS', 'previous_value': 2,
                                     'ts': '2018-08-31 17:03:17.597055+05:30'
                                     }]
                           }
@@ -90,10 +123,19 @@ class TestStatisticsHistory:
                     _rv1 = asyncio.ensure_future(mock_coro(retval))
                     _rv2 = asyncio.ensure_future(mock_coro(None))
 
-                with patch.object(sh._storage_async, "query_tbl", return_value=_rv1) as mock_keys:
-                    with patch.object(sh, "_bulk_update_previous_value", return_value=_rv2) as mock_update:
-                        with patch.object(sh._storage_async, "insert_into_tbl", return_value=_rv2) as mock_bulk_insert:
-                            await sh.run()
-                    assert 1 == mock_bulk_insert.call_count
-                    assert 1 == mock_update.call_count
+                with patch.object(sh, "is_dry_run", return_value=False):
+                    with patch.object(sh._storage_async, "statistics_snapshot", side_effect=not_supported):
+                        with patch.object(sh._storage_async, "query_tbl", return_value=_rv1) as mock_keys:
+                            with patch.object(sh, "_bulk_update_previous_value", return_value=_rv2) as mock_update:
+                                with patch.object(sh._storage_async, "insert_into_tbl",
+                                                  return_value=_rv2) as mock_bulk_insert:
+                                    await sh.run()
                 mock_keys.assert_called_once_with('statistics')
+                args, kwargs = mock_bulk_insert.call_args
+                assert "statistics_history" == args[0]
+                inserts = json.loads(args[1])["inserts"]
+                assert [("PURGED", 0), ("READINGS", 5)] == [(i["key"], i["value"]) for i in inserts]
+                # previous_value is rolled forward by the recorded delta, unchanged keys are not updated
+                mock_update.assert_called_once_with({"updates": [
+                    {"expressions": [{"column": "previous_value", "operator": "+", "value": 5}],
+                     "where": {"column": "key", "condition": "=", "value": "READINGS"}}]})